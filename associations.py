@@ -0,0 +1,65 @@
+"""
+Co-purchase pairs and association rules between subcategories or products.
+
+Baskets are customers: each (customer, item) pair the dashboard loads
+becomes a 1 in a sparse customer x item incidence matrix ``X``. One sparse
+product ``X.T @ X`` gives, for every item pair, the number of customers who
+bought both (its diagonal holds each item's customer count). Memory follows
+the number of pairs that actually co-occur, not items², so 2,000+ products
+need no dense N x N array.
+
+For a pair (A, B) over N customers:
+
+* support = customers(A and B) / N
+* confidence(A -> B) = customers(A and B) / customers(A)
+* lift = support / (support(A) * support(B)); above 1 means bought
+  together more often than chance.
+"""
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+RANK_METRICS = ["lift", "support", "confidence"]
+
+
+def incidence(pairs, item_column, basket_column="customer_id"):
+    """Sparse 0/1 basket x item matrix from ``(basket, item)`` rows, plus the item labels."""
+    baskets, _ = pd.factorize(pairs[basket_column])
+    items, labels = pd.factorize(pairs[item_column])
+    matrix = sp.csr_matrix(
+        (np.ones(len(pairs), dtype=np.int32), (baskets, items)),
+        shape=(baskets.max() + 1 if len(baskets) else 0, len(labels)),
+    )
+    matrix.data[:] = 1  # repeated pairs count once
+    return matrix, labels
+
+
+def association_rules(pairs, item_column, top_k=20, min_customers=1, rank_by="lift"):
+    """The ``top_k`` item pairs by ``rank_by`` among pairs bought by at least ``min_customers`` customers.
+
+    ``pairs`` has ``customer_id`` and ``item_column``. Confidence is ranked by
+    the stronger of the pair's two directions.
+    """
+    matrix, labels = incidence(pairs, item_column)
+    customers = matrix.shape[0]
+    co = (matrix.T @ matrix).tocsr()
+    counts = co.diagonal().astype(np.float64)
+    upper = sp.triu(co, k=1).tocoo()
+    keep = upper.data >= min_customers
+    a, b, both = upper.row[keep], upper.col[keep], upper.data[keep].astype(np.float64)
+
+    support = both / max(customers, 1)
+    confidence_ab, confidence_ba = both / counts[a], both / counts[b]
+    lift = both * customers / (counts[a] * counts[b])
+    metric = {"lift": lift, "support": support, "confidence": np.maximum(confidence_ab, confidence_ba)}[rank_by]
+    top = np.argpartition(-metric, top_k)[:top_k] if len(metric) > top_k else np.arange(len(metric))
+    top = top[np.lexsort((-both[top], -metric[top]))]
+    return pd.DataFrame({
+        "item_a": np.asarray(labels)[a[top]],
+        "item_b": np.asarray(labels)[b[top]],
+        "customers_both": both[top].astype(np.int64),
+        "support_pct": np.round(support[top] * 100, 3),
+        "confidence_a_to_b_pct": np.round(confidence_ab[top] * 100, 2),
+        "confidence_b_to_a_pct": np.round(confidence_ba[top] * 100, 2),
+        "lift": np.round(lift[top], 3),
+    })
@@ -0,0 +1,314 @@
+"""
+End-to-end benchmark of the dashboards registered in ``dashboards/``.
+
+Each dashboard runs headlessly through Streamlit's ``AppTest`` in its own
+subprocess (so peak RSS is per dashboard), against whichever database the
+``AMAZON_DB_*`` variables point at — typically a local stand-in loaded at a
+given data size. Timings cover SQL execution and transfer, pandas
+post-processing and chart-data preparation. Every repeat is two fresh
+sessions:
+
+* cold: all process-wide ``st.cache_resource`` state is dropped first —
+  result cache, watermark and cohort stores, routers, customer summary,
+  orders snapshot — as in a newly started server; the connection pool and
+  query / prefetch executors are shut down before they are dropped, so no
+  connections or threads leak between repeats;
+* warm: only the result cache is dropped, so incremental aggregates,
+  merged sketches and the snapshot carried over from the cold run are
+  reused, as on a long-running server.
+
+Both are reported separately (``p50_ms`` / ``p95_ms`` are cold). Results
+are saved as JSON; ``--compare`` flags dashboards whose p95 latency (cold
+or warm) or peak RSS regressed.
+
+Usage::
+
+    python benchmark.py [--database amazon_bench] [--repeats 5] [--dashboards 1 2 16]
+                        [--output bench.json] [--compare baseline.json] [--threshold 0.2]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+APP_PATH = "Amazon_App_2.py"
+DEFAULT_REPEATS = 5
+DEFAULT_TIMEOUT = 600
+# A dashboard regresses when p95 latency or peak RSS grows by more than this fraction.
+REGRESSION_THRESHOLD = 0.2
+
+
+# -----------------------------
+# Worker: one dashboard, one process
+# -----------------------------
+def _instrument(db, counters):
+    """Wrap the data-access entry points of ``db`` to time them and count rows transferred."""
+    fetch_query, stream_query, read_orders = db.fetch_query, db.stream_query, db.read_orders
+
+    def timed_fetch(sql, params=None):
+        start = time.perf_counter()
+        df = fetch_query(sql, params)
+        counters["sql_s"] += time.perf_counter() - start
+        counters["queries"] += 1
+        counters["rows"] += len(df)
+        return df
+
+    def timed_stream(*args, **kwargs):
+        chunks = stream_query(*args, **kwargs)
+        counters["queries"] += 1
+        while True:
+            start = time.perf_counter()
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                counters["sql_s"] += time.perf_counter() - start
+                return
+            counters["sql_s"] += time.perf_counter() - start
+            counters["rows"] += len(chunk)
+            yield chunk
+
+    def timed_read(*args, **kwargs):
+        start = time.perf_counter()
+        table = read_orders(*args, **kwargs)
+        counters["sql_s"] += time.perf_counter() - start
+        counters["queries"] += 1
+        counters["rows"] += table.num_rows
+        return table
+
+    db.fetch_query, db.stream_query, db.read_orders = timed_fetch, timed_stream, timed_read
+
+
+def _track_resources(db, scheduler):
+    """Record the pools and executors the app's ``st.cache_resource`` factories create.
+
+    Returns ``release()``, which shuts them all down: executors first, since
+    prefetch warm-ups borrow pooled connections, then the pools.
+    """
+    executors, pools = [], []
+
+    def tracking(factory, created):
+        def create(*args, **kwargs):
+            resource = factory(*args, **kwargs)
+            created.append(resource)
+            return resource
+        return create
+
+    db.ConnectionPool = tracking(db.ConnectionPool, pools)
+    db.Prefetcher = tracking(db.Prefetcher, executors)
+    scheduler.ThreadPoolExecutor = tracking(scheduler.ThreadPoolExecutor, executors)
+
+    def release():
+        while executors:
+            executor = executors.pop()
+            if hasattr(executor, "close"):
+                executor.close()
+            else:
+                executor.shutdown(wait=True, cancel_futures=True)
+        while pools:
+            pools.pop().close()
+
+    return release
+
+
+def run_dashboard(name, repeats=DEFAULT_REPEATS, path=APP_PATH, timeout=DEFAULT_TIMEOUT):
+    """Run one dashboard ``repeats`` times (a cold and a warm session each) in this process; return its measurements."""
+    # Imported here so the driver process never loads Streamlit or opens a pool.
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    import db
+    import scheduler
+
+    counters = {"sql_s": 0.0, "queries": 0, "rows": 0}
+    _instrument(db, counters)
+    release_resources = _track_resources(db, scheduler)
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    runs, errors = [], []
+    for _ in range(repeats):
+        for phase in ("cold", "warm"):
+            if phase == "cold":
+                # Close connections and stop threads first: clearing only drops the references.
+                release_resources()
+                st.cache_resource.clear()
+            db.get_cache().clear()
+            for key in counters:
+                counters[key] = 0
+            app = AppTest.from_file(path, default_timeout=timeout)
+            app.session_state["selected_question"] = name
+            start = time.perf_counter()
+            app.run()
+            total_s = time.perf_counter() - start
+            errors.extend(str(e.value) for e in app.exception)
+            errors.extend(w.value for w in app.warning if w.value.startswith("Failed to load"))
+            runs.append({
+                "phase": phase,
+                "total_ms": total_s * 1000,
+                "sql_ms": counters["sql_s"] * 1000,
+                "app_ms": (total_s - counters["sql_s"]) * 1000,
+                "queries": counters["queries"],
+                "rows": counters["rows"],
+            })
+
+    release_resources()
+    # ru_maxrss is in KiB on Linux.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "runs": runs,
+        "errors": sorted(set(errors)),
+        "baseline_rss_mb": baseline_rss / 1024,
+        "peak_rss_mb": peak_rss / 1024,
+    }
+
+
+# -----------------------------
+# Driver
+# -----------------------------
+def summarize(result):
+    cold = [r for r in result["runs"] if r.get("phase", "cold") == "cold"]
+    warm = [r for r in result["runs"] if r.get("phase") == "warm"]
+    total = np.array([r["total_ms"] for r in cold])
+    sql = np.array([r["sql_ms"] for r in cold])
+    app = np.array([r["app_ms"] for r in cold])
+    summary = {
+        "p50_ms": float(np.percentile(total, 50)),
+        "p95_ms": float(np.percentile(total, 95)),
+        "sql_p50_ms": float(np.percentile(sql, 50)),
+        "app_p50_ms": float(np.percentile(app, 50)),
+        "queries": cold[-1]["queries"],
+        "rows_transferred": cold[-1]["rows"],
+        "peak_rss_mb": result["peak_rss_mb"],
+        "rss_growth_mb": result["peak_rss_mb"] - result["baseline_rss_mb"],
+        "errors": result["errors"],
+    }
+    if warm:
+        warm_total = np.array([r["total_ms"] for r in warm])
+        summary.update(
+            warm_p50_ms=float(np.percentile(warm_total, 50)),
+            warm_p95_ms=float(np.percentile(warm_total, 95)),
+            warm_sql_p50_ms=float(np.percentile([r["sql_ms"] for r in warm], 50)),
+            warm_queries=warm[-1]["queries"],
+            warm_rows_transferred=warm[-1]["rows"],
+        )
+    return summary
+
+
+def _orders_rows():
+    # Imported here so --database has already set AMAZON_DB_NAME.
+    import pymysql
+
+    from db_pool import DB_CONFIG
+
+    try:
+        conn = pymysql.connect(**DB_CONFIG)
+    except pymysql.MySQLError:
+        return None
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) FROM orders")
+            return cur.fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(names, repeats=DEFAULT_REPEATS, path=APP_PATH, timeout=DEFAULT_TIMEOUT, log=print):
+    results = {}
+    for name in names:
+        proc = subprocess.run(
+            [sys.executable, __file__, "--worker", name, "--repeats", str(repeats),
+             "--app", path, "--timeout", str(timeout)],
+            capture_output=True, text=True, env=os.environ.copy(),
+        )
+        if proc.returncode != 0:
+            results[name] = {"errors": [proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "worker failed"]}
+            log(f"{name}: FAILED")
+            continue
+        summary = summarize(json.loads(proc.stdout.strip().splitlines()[-1]))
+        results[name] = summary
+        log(
+            f"{name}: cold p50 {summary['p50_ms']:,.0f} ms • p95 {summary['p95_ms']:,.0f} ms • "
+            f"SQL {summary['sql_p50_ms']:,.0f} ms • {summary['rows_transferred']:,} rows • "
+            f"warm p50 {summary['warm_p50_ms']:,.0f} ms • p95 {summary['warm_p95_ms']:,.0f} ms • "
+            f"peak RSS {summary['peak_rss_mb']:,.0f} MB"
+            + (f" • {len(summary['errors'])} errors" if summary["errors"] else "")
+        )
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": _git_commit(),
+            "database": os.environ.get("AMAZON_DB_NAME", "amazon_db"),
+            "data_source": os.environ.get("AMAZON_DATA_SOURCE", "mysql"),
+            "orders_rows": _orders_rows(),
+            "repeats": repeats,
+        },
+        "dashboards": results,
+    }
+
+
+def compare(current, baseline, threshold=REGRESSION_THRESHOLD):
+    """Return ``(dashboard, metric, before, after)`` for every regression beyond ``threshold``."""
+    regressions = []
+    for name, now in current["dashboards"].items():
+        before = baseline["dashboards"].get(name)
+        if not before or "p95_ms" not in before or "p95_ms" not in now:
+            continue
+        for metric in ("p95_ms", "warm_p95_ms", "peak_rss_mb"):
+            if before.get(metric) and metric in now and now[metric] > before[metric] * (1 + threshold):
+                regressions.append((name, metric, before[metric], now[metric]))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark every dashboard headlessly.")
+    parser.add_argument("--database", help="Database to benchmark against (sets AMAZON_DB_NAME).")
+    parser.add_argument("--dashboards", nargs="*", type=int, help="1-based dashboard numbers (default: all).")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT)
+    parser.add_argument("--app", default=APP_PATH)
+    parser.add_argument("--output", default="bench.json")
+    parser.add_argument("--compare", help="Baseline JSON from a previous run.")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_dashboard(args.worker, args.repeats, args.app, args.timeout)))
+        sys.exit(0)
+
+    if args.database:
+        os.environ["AMAZON_DB_NAME"] = args.database
+    # Imported late: the registry pulls in Streamlit through ``db``.
+    from dashboards import TITLES
+
+    names = TITLES
+    if args.dashboards:
+        names = [names[i - 1] for i in args.dashboards]
+
+    report = run_benchmark(names, args.repeats, args.app, args.timeout)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for name, metric, before, after in regressions:
+            print(f"REGRESSION {name}: {metric} {before:,.1f} -> {after:,.1f}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions.")
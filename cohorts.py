@@ -0,0 +1,133 @@
+"""
+Monthly acquisition-cohort retention and revenue matrices.
+
+Input is monthly customer activity: one row per customer and month with
+``customer_id``, ``order_year``, ``order_month`` and ``revenue`` (kept
+current by the watermark store, see ``incremental``). A customer's cohort
+is the month of their first order in the selected date range.
+
+Customer ids are mapped to integer codes through a sorted id array, and
+each matrix cell (cohort month x activity month) is counted with one
+``np.bincount`` over the flattened cell index: no per-customer Python loop.
+Updates are incremental: only activity months from the last month already
+processed onward are re-counted, since a customer active before that month
+already has a fixed cohort. Customers whose cohort lies in the re-counted
+months are re-derived from the new rows, so edits to those months stay
+exact. If rows before that month change (the store's periodic full
+recompute), the matrices are rebuilt from scratch.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+# First month of customers with no activity in the current data.
+_NO_MONTH = np.iinfo(np.int64).max
+
+
+def _month_index(df):
+    return df["order_year"].to_numpy(dtype=np.int64) * 12 + df["order_month"].to_numpy(dtype=np.int64) - 1
+
+
+class CohortMatrix:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.customers = np.array([], dtype=object)  # sorted ids; a customer's code is its position
+        self.first_month = np.array([], dtype=np.int64)
+        self.base = None  # month index of row / column 0
+        self.active = np.zeros((0, 0), dtype=np.int64)
+        self.revenue = np.zeros((0, 0), dtype=np.float64)
+        self.last_month = None
+        self.rows_before = 0  # activity rows before last_month when it was processed
+
+    def update(self, activity):
+        """Fold ``activity`` (the full current frame) into the matrices, re-counting only recent months."""
+        months = _month_index(activity)
+        if not len(months):
+            self._reset()
+            return
+        since = self.last_month
+        if since is None or np.count_nonzero(months < since) != self.rows_before:
+            self._reset()
+            since = int(months.min())
+        fresh = months >= since
+        ids = activity["customer_id"].to_numpy(dtype=object)[fresh]
+        months = months[fresh]
+        revenue = activity["revenue"].to_numpy(dtype=np.float64)[fresh]
+
+        self._add_customers(np.unique(ids))
+        codes = np.searchsorted(self.customers, ids)
+        # Cohorts inside the re-counted months come from the new rows alone.
+        self.first_month[self.first_month >= since] = _NO_MONTH
+        np.minimum.at(self.first_month, codes, months)
+        self._grow(int(months.max()))
+
+        size = len(self.active)
+        cells = (self.first_month[codes] - self.base) * size + (months - self.base)
+        start = since - self.base
+        self.active[:, start:] = np.bincount(cells, minlength=size * size).reshape(size, size)[:, start:]
+        self.revenue[:, start:] = np.bincount(
+            cells, weights=np.nan_to_num(revenue), minlength=size * size
+        ).reshape(size, size)[:, start:]
+
+        all_months = _month_index(activity)
+        self.last_month = int(all_months.max())
+        self.rows_before = int(np.count_nonzero(all_months < self.last_month))
+
+    def _add_customers(self, ids):
+        """Add the sorted unique ``ids`` not seen yet (membership by binary search on the sorted ids)."""
+        pos = np.minimum(np.searchsorted(self.customers, ids), max(len(self.customers) - 1, 0))
+        known = self.customers[pos] == ids if len(self.customers) else np.zeros(len(ids), dtype=bool)
+        new = ids[~known]
+        if not len(new):
+            return
+        customers = np.union1d(self.customers, new)
+        first_month = np.full(len(customers), _NO_MONTH, dtype=np.int64)
+        first_month[np.searchsorted(customers, self.customers)] = self.first_month
+        self.customers, self.first_month = customers, first_month
+
+    def _grow(self, last):
+        if self.base is None:
+            self.base = int(self.first_month[self.first_month != _NO_MONTH].min())
+        size = last - self.base + 1
+        if size > len(self.active):
+            active = np.zeros((size, size), dtype=np.int64)
+            revenue = np.zeros((size, size), dtype=np.float64)
+            old = len(self.active)
+            active[:old, :old], revenue[:old, :old] = self.active, self.revenue
+            self.active, self.revenue = active, revenue
+
+    def frame(self):
+        """Long-form matrices: one row per cohort and months since its first order."""
+        rows, cols = np.triu_indices(len(self.active))
+        sizes = np.diagonal(self.active)[rows]  # every customer is active in their cohort month
+        keep = sizes > 0
+        rows, cols, sizes = rows[keep], cols[keep], sizes[keep]
+        months = rows + (self.base or 0)
+        active = self.active[rows, cols]
+        return pd.DataFrame({
+            "cohort": [f"{m // 12}-{m % 12 + 1:02d}" for m in months],
+            "months_since_first": cols - rows,
+            "cohort_size": sizes,
+            "active_customers": active,
+            "retention_pct": np.round(active / sizes * 100, 2),
+            "revenue": self.revenue[rows, cols],
+        })
+
+
+class CohortStore:
+    """One ``CohortMatrix`` per activity query (i.e. per filter set)."""
+
+    def __init__(self):
+        self._matrices = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, activity):
+        with self._lock:
+            matrix = self._matrices.setdefault(key, CohortMatrix())
+        with matrix.lock:
+            matrix.update(activity)
+            return matrix.frame()
@@ -0,0 +1,154 @@
+"""
+Customer-level summary of ``orders``, shared by the customer dashboards.
+
+One row per customer with first/last order date, order count, spend,
+average order value and discount, distinct categories and the prime flag,
+over the rows the dashboards cover by default (orders since 2021). The
+RFM, journey, retention and churn dashboards read it instead of each
+grouping all of ``orders`` by customer.
+
+``build`` recomputes the table into a staging copy and swaps it in.
+``update`` recomputes only the customers with orders on or after the
+stored watermark (the latest ``order_date`` seen by the previous run) and
+REPLACEs their rows, so its cost follows the new orders, not the table.
+Rows are recomputed whole rather than merged, which keeps distinct
+categories and averages exact; the watermark day itself is re-read so
+orders loaded late for that day are not missed. Deleted orders are only
+dropped by a rebuild.
+
+Usage::
+
+    python customer_summary.py build
+    python customer_summary.py update
+"""
+import sys
+import time
+
+import pymysql
+
+from db_pool import DB_CONFIG
+
+SUMMARY_TABLE = "customer_summary"
+STATE_TABLE = "customer_summary_state"
+# Same scope as the default sidebar filters.
+SUMMARY_WHERE = "order_year > 2020"
+
+SUMMARY_DDL = """CREATE TABLE IF NOT EXISTS {table} (
+    customer_id VARCHAR(16) PRIMARY KEY,
+    first_order_date DATE NOT NULL,
+    last_order_date DATE NOT NULL,
+    total_orders INT NOT NULL,
+    total_spend DECIMAL(16, 2),
+    avg_order_value DECIMAL(14, 4),
+    avg_discount DECIMAL(9, 4),
+    categories_purchased SMALLINT NOT NULL,
+    is_prime_member TINYINT,
+    INDEX idx_last_order_date (last_order_date)
+)"""
+
+SUMMARY_SELECT = """SELECT
+    o.customer_id,
+    MIN(o.order_date),
+    MAX(o.order_date),
+    COUNT(o.transaction_id),
+    SUM(o.final_amount_inr),
+    AVG(o.final_amount_inr),
+    AVG(o.discount_percent),
+    COUNT(DISTINCT o.category),
+    MAX(o.is_prime_member)
+FROM orders o"""
+
+
+def build_statements():
+    """SQL that rebuilds the summary into a staging table and swaps it in atomically."""
+    return [
+        f"DROP TABLE IF EXISTS {SUMMARY_TABLE}_new",
+        SUMMARY_DDL.format(table=f"{SUMMARY_TABLE}_new"),
+        f"INSERT INTO {SUMMARY_TABLE}_new\n{SUMMARY_SELECT}\nWHERE o.{SUMMARY_WHERE}\nGROUP BY o.customer_id",
+        SUMMARY_DDL.format(table=SUMMARY_TABLE),
+        f"RENAME TABLE {SUMMARY_TABLE} TO {SUMMARY_TABLE}_old, {SUMMARY_TABLE}_new TO {SUMMARY_TABLE}",
+        f"DROP TABLE {SUMMARY_TABLE}_old",
+    ]
+
+
+def update_sql():
+    """Recompute the rows of every customer with an order on or after ``%(since)s``."""
+    return (
+        f"REPLACE INTO {SUMMARY_TABLE}\n{SUMMARY_SELECT}\n"
+        "JOIN (SELECT DISTINCT customer_id FROM orders WHERE order_date >= %(since)s) touched\n"
+        "    ON touched.customer_id = o.customer_id\n"
+        f"WHERE o.{SUMMARY_WHERE}\nGROUP BY o.customer_id"
+    )
+
+
+def state_query():
+    return f"SELECT watermark, row_count, refreshed_at FROM {STATE_TABLE} WHERE id = 1"
+
+
+def _ensure_state(cur):
+    cur.execute(
+        f"""CREATE TABLE IF NOT EXISTS {STATE_TABLE} (
+            id TINYINT PRIMARY KEY,
+            watermark DATE,
+            row_count BIGINT NOT NULL,
+            refreshed_at DATETIME NOT NULL
+        )"""
+    )
+
+
+def _save_state(cur, watermark):
+    cur.execute(f"SELECT COUNT(*) FROM {SUMMARY_TABLE}")
+    rows = cur.fetchone()[0]
+    cur.execute(
+        f"REPLACE INTO {STATE_TABLE} (id, watermark, row_count, refreshed_at) VALUES (1, %s, %s, NOW())",
+        (watermark, rows),
+    )
+    return rows
+
+
+def _orders_watermark(cur):
+    cur.execute(f"SELECT MAX(order_date) FROM orders WHERE {SUMMARY_WHERE}")
+    return cur.fetchone()[0]
+
+
+def build_summary(conn, log=print):
+    start = time.perf_counter()
+    with conn.cursor() as cur:
+        _ensure_state(cur)
+        # Taken first: orders arriving during the build are re-read by the next update.
+        watermark = _orders_watermark(cur)
+        for statement in build_statements():
+            cur.execute(statement)
+        rows = _save_state(cur, watermark)
+    conn.commit()
+    log(f"{SUMMARY_TABLE}: {rows:,} customers through {watermark} in {time.perf_counter() - start:.1f}s")
+
+
+def update_summary(conn, log=print):
+    with conn.cursor() as cur:
+        _ensure_state(cur)
+        cur.execute(state_query())
+        state = cur.fetchone()
+    if state is None or state[0] is None:
+        log(f"{SUMMARY_TABLE} has not been built yet; building it.")
+        return build_summary(conn, log)
+
+    start = time.perf_counter()
+    with conn.cursor() as cur:
+        watermark = _orders_watermark(cur)
+        touched = cur.execute(update_sql(), {"since": state[0]})
+        rows = _save_state(cur, watermark)
+    conn.commit()
+    # REPLACE reports 2 affected rows for each customer it rewrites.
+    log(f"{SUMMARY_TABLE}: refreshed customers with orders since {state[0]} "
+        f"(~{touched:,} rows affected), {rows:,} customers through {watermark} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] not in (["build"], ["update"]):
+        sys.exit("usage: python customer_summary.py build|update")
+    connection = pymysql.connect(**DB_CONFIG)
+    try:
+        (build_summary if sys.argv[1] == "build" else update_summary)(connection)
+    finally:
+        connection.close()
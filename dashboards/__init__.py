@@ -0,0 +1,202 @@
+"""
+Registry of the analytics dashboards.
+
+Each dashboard is its own module in this package and declares:
+
+* ``QUERIES``: name -> SQL string, ``Routed`` rollup-aware query,
+  ``Sketched`` query with estimated distinct counts, ``Incremental`` monthly
+  aggregate, ``Cohorts`` matrices, ``AggSpec`` or ``Summary`` (read from
+  ``customer_summary`` when possible), each with a ``{filters}`` placeholder
+  for the sidebar filters;
+* ``CACHE_TTL`` (optional): result-cache lifetime in seconds for its queries;
+* ``render(ctx)``: draws the dashboard, loading data with ``ctx.load(name)``.
+
+Modules are imported only when their dashboard is first selected, and a
+rerun executes just that one module's ``render``, so per-rerun work doesn't
+grow with the number of registered dashboards.
+"""
+import importlib
+from collections import namedtuple
+
+from db import (
+    cohort_query, derived_frame, fetch_query, get_router, incremental_query, routed_query, run_aggregate,
+    run_query, sketched_query, summary_available,
+)
+from filters import Filters
+from pushdown import AggSpec, pushdown_sql
+
+# A raw-table query plus the same query against the rollup measures, answered
+# from the smallest rollup covering ``dims`` (see ``db.routed_query``).
+Routed = namedtuple("Routed", ["raw_sql", "rollup_sql", "dims"])
+# A query whose distinct counts are merged from HyperLogLog sketches (see
+# ``db.sketched_query``): ``distinct`` maps NULL placeholder columns of
+# ``rollup_sql`` to the column counted, ``keys`` maps result columns to the
+# rollup keys they group by, ``match`` pins rollup keys to a value.
+# ``exact_sql`` runs in exact mode or when no sketches cover the query.
+Sketched = namedtuple(
+    "Sketched", ["exact_sql", "rollup_sql", "dims", "distinct", "keys", "match"], defaults=(None, None)
+)
+# A monthly aggregate refreshed from its order_date watermark (see ``db.incremental_query``).
+Incremental = namedtuple("Incremental", ["sql"])
+# Acquisition-cohort matrices folded from an incremental monthly customer
+# activity query (see ``db.cohort_query``).
+Cohorts = namedtuple("Cohorts", ["sql"])
+# A per-customer query answered from the customer_summary table (see
+# ``customer_summary.py``) while it is built and no filter narrows the rows;
+# ``fallback`` is the declared query over orders used otherwise.
+Summary = namedtuple("Summary", ["summary_sql", "fallback"])
+
+# (selectbox title, module) in navigation order
+DASHBOARDS = [
+    ("1️⃣ Executive Summary Dashboard", "executive_summary"),
+    ("2️⃣ Real-time Business Performance Monitor", "realtime_performance"),
+    ("3️⃣ Strategic Overview Dashboard", "strategic_overview"),
+    ("4️⃣ Financial Performance Dashboard", "financial_performance"),
+    ("5️⃣ Growth Analytics Dashboard", "growth_analytics"),
+    ("6️⃣ Revenue Trend Analysis Dashboard", "revenue_trends"),
+    ("7️⃣ Category Performance Dashboard", "category_performance"),
+    ("8️⃣ Geographic Revenue Analysis", "geographic_revenue"),
+    ("9️⃣ Festival Sales Analytics", "festival_sales"),
+    ("🔟 Price Optimization Dashboard", "price_optimization"),
+    ("1️⃣1️⃣ Customer Segmentation Dashboard", "customer_segmentation"),
+    ("1️⃣2️⃣ Customer Journey Analytics Dashboard", "customer_journey"),
+    ("1️⃣3️⃣ Prime Membership Analytics Dashboard", "prime_membership"),
+    ("1️⃣4️⃣ Customer Retention Dashboard", "customer_retention"),
+    ("1️⃣5️⃣ Demographics & Behavior Dashboard", "demographics"),
+    ("1️⃣6️⃣ Product Performance Dashboard", "product_performance"),
+    ("1️⃣7️⃣ Brand Analytics Dashboard", "brand_analytics"),
+    ("1️⃣8️⃣ Inventory Optimization Dashboard", "inventory_optimization"),
+    ("1️⃣9️⃣ Product Rating & Review Dashboard", "product_ratings"),
+    ("2️⃣0️⃣ New Product Launch Dashboard", "product_launch"),
+    ("2️⃣1️⃣ Delivery Performance Dashboard", "delivery_performance"),
+    ("2️⃣2️⃣ Payment Analytics Dashboard", "payment_analytics"),
+    ("2️⃣3️⃣ Return & Cancellation Dashboard", "returns_cancellations"),
+    ("2️⃣4️⃣ Customer Service Dashboard", "customer_service"),
+    ("2️⃣5️⃣ Supply Chain Dashboard", "supply_chain"),
+    ("2️⃣6️⃣ Predictive Analytics Dashboard", "predictive_analytics"),
+    ("2️⃣7️⃣ Market Intelligence Dashboard", "market_intelligence"),
+    ("2️⃣8️⃣ Cross-selling & Upselling Dashboard", "cross_selling"),
+    ("2️⃣9️⃣ Seasonal Planning Dashboard", "seasonal_planning"),
+    ("3️⃣0️⃣ Business Intelligence Command Center", "command_center"),
+]
+TITLES = [title for title, _ in DASHBOARDS]
+_MODULES = dict(DASHBOARDS)
+
+
+def load(title):
+    """Import (once) and return the module for the dashboard titled ``title``."""
+    return importlib.import_module(f"{__name__}.{_MODULES[title]}")
+
+
+class DashboardContext:
+    """What a dashboard's ``render`` gets: its declared queries plus the session's data settings."""
+
+    def __init__(self, title, verify=False, use_snapshot=False, filters=None, exact=False):
+        self.title = title
+        self.module = load(title)
+        self.verify = verify
+        self.use_snapshot = use_snapshot
+        self.filters = filters or Filters()
+        self.exact = exact
+
+    @property
+    def ttl(self):
+        return getattr(self.module, "CACHE_TTL", None)
+
+    def load(self, name):
+        """Run the declared query ``name``, filtered, through the cache, rollups or aggregation pushdown."""
+        query = resolve(self.module.QUERIES[name], self.filters)
+        if isinstance(query, AggSpec):
+            return run_aggregate(
+                query, verify=self.verify, ttl=self.ttl, use_snapshot=self.use_snapshot, filters=self.filters,
+                exact=self.exact,
+            )
+        if isinstance(query, Routed):
+            return routed_query(query.raw_sql, query.rollup_sql, query.dims, self.filters, self.ttl)
+        if isinstance(query, Sketched) and not self.exact:
+            return sketched_query(*query, filters=self.filters, ttl=self.ttl)
+        if isinstance(query, Sketched):
+            return run_query(*self.filters.format_sql(query.exact_sql), self.ttl)
+        if isinstance(query, Incremental):
+            return incremental_query(query.sql, self.filters)
+        if isinstance(query, Cohorts):
+            return cohort_query(query.sql, self.filters)
+        return run_query(*self.filters.format_sql(query), self.ttl)
+
+    def derive(self, name, key, compute):
+        """``compute(self.load(name))``, cached with the query's results once per ``key``."""
+        return derived_frame(*self.sql(name), key, lambda: compute(self.load(name)), self.ttl)
+
+    def sql(self, name):
+        """``(sql, params)`` the declared query ``name`` reads when run as SQL (e.g. for paging)."""
+        return query_sql(resolve(self.module.QUERIES[name], self.filters), self.filters)
+
+
+def resolve(query, filters):
+    """The query that actually runs for ``query``: a ``Summary`` becomes one of its two sides."""
+    if isinstance(query, Summary):
+        return query.summary_sql if summary_available(filters) else query.fallback
+    return query
+
+
+# -----------------------------
+# Static views of the declared queries (index advisor, prefetch)
+# -----------------------------
+def raw_sql(query):
+    """SQL the query runs against ``orders`` when no rollup or snapshot is involved."""
+    if isinstance(query, Summary):
+        return raw_sql(query.fallback)
+    if isinstance(query, AggSpec):
+        return pushdown_sql(query)
+    if isinstance(query, Routed):
+        return query.raw_sql
+    if isinstance(query, Sketched):
+        return query.exact_sql
+    if isinstance(query, (Incremental, Cohorts)):
+        return query.sql
+    return query
+
+
+def query_sql(query, filters):
+    """``(sql, params)`` for ``query``, reading the rollup a ``Routed`` query routes to."""
+    if isinstance(query, Routed):
+        table = get_router().route(*query.dims, *filters.rollup_dims())
+        return filters.format_sql(query.raw_sql if table is None else query.rollup_sql, rollup=table)
+    return filters.format_sql(raw_sql(query))
+
+
+def declared_queries(title, filters=None):
+    """``(name, sql against orders, params)`` for every query the dashboard declares.
+
+    Incremental queries are given their full-load ``since`` bound.
+    """
+    filters = filters or Filters()
+    queries = []
+    for name, query in load(title).QUERIES.items():
+        sql, params = filters.format_sql(raw_sql(query))
+        if isinstance(query, (Incremental, Cohorts)):
+            params["since"] = filters.start_date
+        queries.append((name, sql, params))
+    return queries
+
+
+def declared_loads(title, filters=None):
+    """``(sql, params, loader, ttl)`` the prefetcher can replay to warm ``title``'s MySQL results."""
+    filters = filters or Filters()
+    module = load(title)
+    ttl = getattr(module, "CACHE_TTL", None)
+    loads = []
+    for query in module.QUERIES.values():
+        query = resolve(query, filters)
+        if isinstance(query, (Incremental, Cohorts)):
+            # Kept current by the watermark store, not the result cache.
+            continue
+        if isinstance(query, Sketched):
+            # The rollup side only: the merged sketches are cached on first use.
+            table = get_router().route(*query.dims, *(query.keys or {}).values(), *(query.match or {}),
+                                       *filters.rollup_dims())
+            sql, params = filters.format_sql(query.exact_sql if table is None else query.rollup_sql, rollup=table)
+        else:
+            sql, params = query_sql(query, filters)
+        loads.append((sql, params, lambda sql=sql, params=params: fetch_query(sql, params), ttl))
+    return loads
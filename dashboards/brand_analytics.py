@@ -0,0 +1,32 @@
+"""
+Question 17: Brand Analytics Dashboard.
+"""
+import streamlit as st
+
+from pushdown import AggSpec, Measure
+
+SPEC17 = AggSpec(
+    group_keys=("brand",),
+    measures={
+        "total_units_sold": Measure("sum", "quantity"),
+        "revenue_cr": Measure("sum", "final_amount_inr", divide_by=10000000, decimals=2),
+        "total_customers": Measure("nunique", "customer_id"),
+    },
+    order_by=(("revenue_cr", False),),
+    limit=20,
+)
+
+QUERIES = {
+    "spec17": SPEC17,
+}
+
+
+def render(ctx):
+    st.header("17️⃣ Brand Analytics Dashboard")
+    try:
+        df17 = ctx.load("spec17")
+
+        st.dataframe(df17, use_container_width=True)
+
+    except Exception as e:
+        st.warning(f"Failed to load Brand Analytics Dashboard. Error: {e}")
@@ -0,0 +1,127 @@
+"""
+Question 7: Category Performance Dashboard.
+"""
+import streamlit as st
+
+from dashboards import Routed
+from scheduler import run_sections
+
+QUERY1 = """
+SELECT
+    subcategory,
+    ROUND(SUM(final_amount_inr)/100000, 2) AS revenue_in_lakhs,
+    ROUND(SUM(final_amount_inr)/SUM(SUM(final_amount_inr)) OVER (), 4) * 100 AS revenue_share_pct
+FROM orders
+WHERE {filters}
+GROUP BY subcategory
+ORDER BY revenue_in_lakhs DESC;
+"""
+
+QUERY1_ROLLUP = """
+SELECT
+    subcategory,
+    ROUND(SUM(revenue)/100000, 2) AS revenue_in_lakhs,
+    ROUND(SUM(revenue)/SUM(SUM(revenue)) OVER (), 4) * 100 AS revenue_share_pct
+FROM {rollup}
+WHERE {filters}
+GROUP BY subcategory
+ORDER BY revenue_in_lakhs DESC;
+"""
+
+QUERY2 = """
+SELECT
+    order_year,
+    ROUND(SUM(CASE WHEN subcategory='Smartphones' THEN final_amount_inr ELSE 0 END)/100000, 2) AS Smartphones_revenue_in_lakhs,
+    ROUND(SUM(CASE WHEN subcategory='Laptops' THEN final_amount_inr ELSE 0 END)/100000, 2) AS Laptops_revenue_in_lakhs,
+    ROUND(SUM(CASE WHEN subcategory='Tablets' THEN final_amount_inr ELSE 0 END)/100000, 2) AS Tablets_revenue_in_lakhs,
+    ROUND(SUM(CASE WHEN subcategory='Smart Watch' THEN final_amount_inr ELSE 0 END)/100000, 2) AS SmartWatch_revenue_in_lakhs,
+    ROUND(SUM(CASE WHEN subcategory='Audio' THEN final_amount_inr ELSE 0 END)/100000, 2) AS Audio_revenue_in_lakhs,
+    ROUND(SUM(CASE WHEN subcategory='TV & Entertainment' THEN final_amount_inr ELSE 0 END)/100000, 2) AS TV_Entertainment_revenue_in_lakhs
+FROM orders
+WHERE {filters}
+GROUP BY order_year
+ORDER BY order_year;
+"""
+
+QUERY2_ROLLUP = """
+SELECT
+    order_year,
+    ROUND(SUM(CASE WHEN subcategory='Smartphones' THEN revenue ELSE 0 END)/100000, 2) AS Smartphones_revenue_in_lakhs,
+    ROUND(SUM(CASE WHEN subcategory='Laptops' THEN revenue ELSE 0 END)/100000, 2) AS Laptops_revenue_in_lakhs,
+    ROUND(SUM(CASE WHEN subcategory='Tablets' THEN revenue ELSE 0 END)/100000, 2) AS Tablets_revenue_in_lakhs,
+    ROUND(SUM(CASE WHEN subcategory='Smart Watch' THEN revenue ELSE 0 END)/100000, 2) AS SmartWatch_revenue_in_lakhs,
+    ROUND(SUM(CASE WHEN subcategory='Audio' THEN revenue ELSE 0 END)/100000, 2) AS Audio_revenue_in_lakhs,
+    ROUND(SUM(CASE WHEN subcategory='TV & Entertainment' THEN revenue ELSE 0 END)/100000, 2) AS TV_Entertainment_revenue_in_lakhs
+FROM {rollup}
+WHERE {filters}
+GROUP BY order_year
+ORDER BY order_year;
+"""
+
+QUERY3 = """
+SELECT
+    order_year,
+    ROUND(SUM(CASE WHEN subcategory='Smartphones' THEN final_amount_inr ELSE 0 END) / SUM(final_amount_inr) * 100, 2) AS Smartphones_market_share_pct,
+    ROUND(SUM(CASE WHEN subcategory='Laptops' THEN final_amount_inr ELSE 0 END) / SUM(final_amount_inr) * 100, 2) AS Laptops_market_share_pct,
+    ROUND(SUM(CASE WHEN subcategory='Tablets' THEN final_amount_inr ELSE 0 END) / SUM(final_amount_inr) * 100, 2) AS Tablets_market_share_pct,
+    ROUND(SUM(CASE WHEN subcategory='Smart Watch' THEN final_amount_inr ELSE 0 END) / SUM(final_amount_inr) * 100, 2) AS SmartWatch_market_share_pct,
+    ROUND(SUM(CASE WHEN subcategory='Audio' THEN final_amount_inr ELSE 0 END) / SUM(final_amount_inr) * 100, 2) AS Audio_market_share_pct,
+    ROUND(SUM(CASE WHEN subcategory='TV & Entertainment' THEN final_amount_inr ELSE 0 END) / SUM(final_amount_inr) * 100, 2) AS TV_Entertainment_market_share_pct
+FROM orders
+WHERE {filters}
+GROUP BY order_year
+ORDER BY order_year;
+"""
+
+QUERY3_ROLLUP = """
+SELECT
+    order_year,
+    ROUND(SUM(CASE WHEN subcategory='Smartphones' THEN revenue ELSE 0 END) / SUM(revenue) * 100, 2) AS Smartphones_market_share_pct,
+    ROUND(SUM(CASE WHEN subcategory='Laptops' THEN revenue ELSE 0 END) / SUM(revenue) * 100, 2) AS Laptops_market_share_pct,
+    ROUND(SUM(CASE WHEN subcategory='Tablets' THEN revenue ELSE 0 END) / SUM(revenue) * 100, 2) AS Tablets_market_share_pct,
+    ROUND(SUM(CASE WHEN subcategory='Smart Watch' THEN revenue ELSE 0 END) / SUM(revenue) * 100, 2) AS SmartWatch_market_share_pct,
+    ROUND(SUM(CASE WHEN subcategory='Audio' THEN revenue ELSE 0 END) / SUM(revenue) * 100, 2) AS Audio_market_share_pct,
+    ROUND(SUM(CASE WHEN subcategory='TV & Entertainment' THEN revenue ELSE 0 END) / SUM(revenue) * 100, 2) AS TV_Entertainment_market_share_pct
+FROM {rollup}
+WHERE {filters}
+GROUP BY order_year
+ORDER BY order_year;
+"""
+
+QUERIES = {
+    "query1": Routed(QUERY1, QUERY1_ROLLUP, ("order_year", "subcategory")),
+    "query2": Routed(QUERY2, QUERY2_ROLLUP, ("order_year", "subcategory")),
+    "query3": Routed(QUERY3, QUERY3_ROLLUP, ("order_year", "subcategory")),
+}
+
+
+def render(ctx):
+    st.header("7️⃣ Category Performance Dashboard (Subcategory)")
+    try:
+        # Revenue Contribution by Subcategory
+        def render_revenue_share(df_revenue_share):
+            st.subheader("📊 Revenue Contribution by Subcategory")
+            st.bar_chart(df_revenue_share.set_index("subcategory")["revenue_in_lakhs"])
+            st.dataframe(df_revenue_share, use_container_width=True)
+
+        # Yearly Revenue Growth by Subcategory
+        def render_yearly_growth(df_yearly_growth):
+            st.subheader("📈 Yearly Revenue by Subcategory")
+            st.line_chart(df_yearly_growth.set_index("order_year"))
+            st.dataframe(df_yearly_growth, use_container_width=True)
+
+        # Market Share Change by Subcategory
+        def render_market_share(df_market_share):
+            st.subheader("📊 Market Share Change by Subcategory")
+            st.area_chart(df_market_share.set_index("order_year"))
+            st.dataframe(df_market_share, use_container_width=True)
+
+        # Independent queries run concurrently; each section renders as soon as its data arrives
+        run_sections([
+            (lambda: ctx.load("query1"), render_revenue_share),
+            (lambda: ctx.load("query2"), render_yearly_growth),
+            (lambda: ctx.load("query3"), render_market_share),
+        ], error_label="Category Performance section")
+
+    except Exception as e:
+        st.warning(f"Failed to load Category Performance Dashboard. Error: {e}")
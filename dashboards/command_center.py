@@ -0,0 +1,53 @@
+"""
+Question 30: Business Intelligence Command Center.
+"""
+import pandas as pd
+import streamlit as st
+
+from downsample import downsample
+from pushdown import AggSpec, Measure
+
+SPEC30_TOTALS = AggSpec(
+    measures={
+        "revenue_cr": Measure("sum", "final_amount_inr", divide_by=10000000),
+        "total_customers": Measure("nunique", "customer_id"),
+        "total_orders": Measure("size"),
+        "total_quantity": Measure("sum", "quantity"),
+    },
+)
+
+REVENUE_CR = {"revenue_cr": Measure("sum", "final_amount_inr", divide_by=10000000)}
+SPEC30_SUBCAT = AggSpec(group_keys=("subcategory",), measures=REVENUE_CR, order_by=(("subcategory", True),))
+SPEC30_PAYMENT = AggSpec(group_keys=("payment_method",), measures=REVENUE_CR, order_by=(("payment_method", True),))
+SPEC30_DAILY = AggSpec(group_keys=("order_date",), measures=REVENUE_CR, order_by=(("order_date", True),))
+
+QUERIES = {
+    "totals": SPEC30_TOTALS,
+    "subcat": SPEC30_SUBCAT,
+    "payment": SPEC30_PAYMENT,
+    "daily": SPEC30_DAILY,
+}
+
+
+def render(ctx):
+    st.header("30️⃣ Business Intelligence Command Center")
+    try:
+        totals = ctx.load("totals").iloc[0]
+        st.subheader("Key Metrics Overview")
+        st.metric("💰 Total Revenue (₹ Cr)", f"{totals['revenue_cr']:.2f}")
+        st.metric("👥 Total Customers", f"{int(totals['total_customers']):,}")
+        st.metric("🛒 Total Orders", f"{int(totals['total_orders']):,}")
+        st.metric("📦 Total Quantity Sold", f"{int(totals['total_quantity']):,}")
+
+        st.subheader("Revenue by Subcategory")
+        st.bar_chart(ctx.load("subcat").set_index('subcategory')['revenue_cr'])
+
+        st.subheader("Revenue by Payment Method")
+        st.bar_chart(ctx.load("payment").set_index('payment_method')['revenue_cr'])
+
+        st.subheader("Daily Revenue Trend")
+        daily_revenue = ctx.load("daily")
+        daily_revenue['order_date'] = pd.to_datetime(daily_revenue['order_date'])
+        st.line_chart(downsample(daily_revenue.set_index('order_date')['revenue_cr']))
+    except Exception as e:
+        st.warning(f"Failed to load Business Intelligence Command Center. Error: {e}")
@@ -0,0 +1,72 @@
+"""
+Question 28: Cross-selling & Upselling Dashboard.
+"""
+import streamlit as st
+
+from associations import RANK_METRICS, association_rules
+from pushdown import AggSpec, Measure
+
+# One row per customer and item they bought; the pair engine only needs presence.
+SPEC28_SUBCAT_BASKETS = AggSpec(
+    group_keys=("customer_id", "subcategory"),
+    measures={"orders": Measure("size")},
+)
+
+SPEC28_PRODUCT_BASKETS = AggSpec(
+    group_keys=("customer_id", "product_id"),
+    measures={"orders": Measure("size")},
+)
+
+SPEC28_DIVERSITY = AggSpec(
+    group_keys=("customer_id",),
+    measures={"subcategories": Measure("nunique", "subcategory")},
+)
+
+QUERIES = {
+    "subcat_baskets": SPEC28_SUBCAT_BASKETS,
+    "product_baskets": SPEC28_PRODUCT_BASKETS,
+    "diversity": SPEC28_DIVERSITY,
+}
+
+
+def _pair_chart(pairs):
+    return pairs.assign(pair=pairs["item_a"].astype(str) + " + " + pairs["item_b"].astype(str)).set_index("pair")
+
+
+def render(ctx):
+    st.header("28️⃣ Cross-selling & Upselling Dashboard")
+    try:
+        col1, col2, col3 = st.columns(3)
+        rank_by = col1.selectbox("Rank pairs by", RANK_METRICS)
+        top_k = col2.slider("Pairs shown", 5, 50, 15)
+        min_customers = col3.number_input(
+            "Min customers per pair", min_value=1, value=20,
+            help="Pairs bought by fewer customers are left out (high lift on tiny counts is noise).",
+        )
+        key = (rank_by, top_k, min_customers)
+
+        # Rules are computed once per setting and shared by every session.
+        subcat_pairs = ctx.derive(
+            "subcat_baskets", key,
+            lambda df: association_rules(df, "subcategory", top_k, min_customers, rank_by),
+        )
+        st.subheader("Top Subcategories Bought Together")
+        st.bar_chart(_pair_chart(subcat_pairs)[rank_by if rank_by == "lift" else "customers_both"])
+        st.dataframe(subcat_pairs, use_container_width=True, hide_index=True)
+
+        product_pairs = ctx.derive(
+            "product_baskets", key,
+            lambda df: association_rules(df, "product_id", top_k, min_customers, rank_by),
+        )
+        st.subheader("Top Products Bought Together")
+        st.dataframe(product_pairs, use_container_width=True, hide_index=True)
+        st.caption(
+            "Support: share of customers who bought both · Confidence A→B: share of A's buyers who also "
+            "bought B · Lift: how many times more often the pair is bought together than by chance."
+        )
+
+        st.subheader("Customer Product Diversity")
+        customer_diversity = ctx.load("diversity")['subcategories']
+        st.bar_chart(customer_diversity.value_counts().sort_index())
+    except Exception as e:
+        st.warning(f"Failed to load Cross-selling & Upselling Dashboard. Error: {e}")
@@ -0,0 +1,49 @@
+"""
+Question 12: Customer Journey Analytics Dashboard.
+"""
+import streamlit as st
+
+from dashboards import Summary
+from downsample import downsample
+
+QUERY_JOURNEY = """
+SELECT
+    customer_id,
+    MIN(order_date) AS first_order_date,
+    MAX(order_date) AS last_order_date,
+    COUNT(DISTINCT category) AS categories_purchased,
+    COUNT(transaction_id) AS total_orders
+FROM orders
+WHERE {filters}
+GROUP BY customer_id
+"""
+
+SUMMARY_JOURNEY = """
+SELECT
+    customer_id,
+    first_order_date,
+    last_order_date,
+    categories_purchased,
+    total_orders
+FROM customer_summary
+"""
+
+QUERIES = {
+    "journey": Summary(SUMMARY_JOURNEY, QUERY_JOURNEY),
+}
+
+
+def render(ctx):
+    st.header("1️⃣2️⃣ Customer Journey Analytics Dashboard")
+    try:
+        df_journey = ctx.load("journey")
+
+        st.subheader("📊 Customer Journey Metrics")
+        st.dataframe(df_journey.head(50), use_container_width=True)
+
+        st.subheader("📈 Customer Lifecycle")
+        # One point per customer: keep each bucket's extremes so outliers stay visible.
+        st.line_chart(downsample(df_journey.set_index("customer_id")["total_orders"], method="minmax"))
+
+    except Exception as e:
+        st.warning(f"Failed to load Customer Journey Dashboard. Error: {e}")
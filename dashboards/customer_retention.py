@@ -0,0 +1,202 @@
+"""
+Question 14: Customer Retention Dashboard.
+"""
+import plotly.express as px
+import streamlit as st
+
+from dashboards import Cohorts, Summary
+from scheduler import run_sections
+
+CUTOFF_DATE = '2025-09-01'
+CHURN_DAYS = 180
+
+QUERY_CHURN = f"""
+WITH cust_agg AS (
+    SELECT
+        o.customer_id,
+        COUNT(DISTINCT o.transaction_id) AS total_orders,
+        ROUND(SUM(o.final_amount_inr), 2) AS total_spend,
+        ROUND(AVG(o.final_amount_inr), 2) AS avg_order_value,
+        MAX(o.order_date) AS last_order_date,
+        MIN(o.order_date) AS first_order_date
+    FROM orders o
+    WHERE {{filters:o}}
+    GROUP BY o.customer_id
+)
+SELECT
+    ca.customer_id,
+    ca.total_orders,
+    ca.total_spend,
+    ca.avg_order_value,
+    DATEDIFF('{CUTOFF_DATE}', ca.last_order_date) AS recency_days,
+    DATEDIFF(ca.last_order_date, ca.first_order_date) AS tenure_days,
+    CASE
+        WHEN ca.last_order_date < DATE_SUB('{CUTOFF_DATE}', INTERVAL {CHURN_DAYS} DAY) THEN 1
+        ELSE 0
+    END AS churn_label
+FROM cust_agg ca
+ORDER BY ca.customer_id;
+"""
+
+QUERY_RETENTION = f"""
+WITH cust_agg AS (
+    SELECT
+        o.customer_id,
+        MAX(o.order_date) AS last_order_date,
+        AVG(o.discount_percent) AS avg_discount,
+        MAX(o.is_prime_member) AS is_prime_member
+    FROM orders o
+    WHERE {{filters:o}}
+    GROUP BY o.customer_id
+),
+cust_status AS (
+    SELECT
+        ca.customer_id,
+        ca.is_prime_member,
+        ROUND(ca.avg_discount, 2) AS avg_discount,
+        CASE 
+            WHEN ca.last_order_date < DATE_SUB('{CUTOFF_DATE}', INTERVAL {CHURN_DAYS} DAY) THEN 1 
+            ELSE 0 
+        END AS churn_label
+    FROM cust_agg ca
+)
+SELECT
+    CASE WHEN is_prime_member = 1 THEN 'Prime Member' ELSE 'Non-Prime' END AS customer_type,
+    ROUND(AVG(avg_discount), 2) AS avg_discount_given,
+    COUNT(*) AS total_customers,
+    SUM(churn_label) AS churned_customers,
+    ROUND(SUM(churn_label) / COUNT(*) * 100, 2) AS churn_rate_pct,
+    ROUND((COUNT(*) - SUM(churn_label)) / COUNT(*) * 100, 2) AS retention_rate_pct
+FROM cust_status
+GROUP BY is_prime_member;
+"""
+
+SUMMARY_CHURN = f"""
+SELECT
+    customer_id,
+    total_orders,
+    ROUND(total_spend, 2) AS total_spend,
+    ROUND(avg_order_value, 2) AS avg_order_value,
+    DATEDIFF('{CUTOFF_DATE}', last_order_date) AS recency_days,
+    DATEDIFF(last_order_date, first_order_date) AS tenure_days,
+    CASE
+        WHEN last_order_date < DATE_SUB('{CUTOFF_DATE}', INTERVAL {CHURN_DAYS} DAY) THEN 1
+        ELSE 0
+    END AS churn_label
+FROM customer_summary
+ORDER BY customer_id;
+"""
+
+SUMMARY_RETENTION = f"""
+WITH cust_status AS (
+    SELECT
+        is_prime_member,
+        ROUND(avg_discount, 2) AS avg_discount,
+        CASE
+            WHEN last_order_date < DATE_SUB('{CUTOFF_DATE}', INTERVAL {CHURN_DAYS} DAY) THEN 1
+            ELSE 0
+        END AS churn_label
+    FROM customer_summary
+)
+SELECT
+    CASE WHEN is_prime_member = 1 THEN 'Prime Member' ELSE 'Non-Prime' END AS customer_type,
+    ROUND(AVG(avg_discount), 2) AS avg_discount_given,
+    COUNT(*) AS total_customers,
+    SUM(churn_label) AS churned_customers,
+    ROUND(SUM(churn_label) / COUNT(*) * 100, 2) AS churn_rate_pct,
+    ROUND((COUNT(*) - SUM(churn_label)) / COUNT(*) * 100, 2) AS retention_rate_pct
+FROM cust_status
+GROUP BY is_prime_member;
+"""
+
+# One row per customer and month, refreshed from the order_date watermark.
+QUERY_ACTIVITY = """
+SELECT
+    customer_id,
+    order_year,
+    order_month,
+    SUM(final_amount_inr) AS revenue,
+    MAX(order_date) AS watermark
+FROM orders
+WHERE {filters} AND order_date >= %(since)s
+GROUP BY customer_id, order_year, order_month
+"""
+
+QUERIES = {
+    "churn": Summary(SUMMARY_CHURN, QUERY_CHURN),
+    "retention": Summary(SUMMARY_RETENTION, QUERY_RETENTION),
+    "cohorts": Cohorts(QUERY_ACTIVITY),
+}
+
+
+def render(ctx):
+    st.header("1️⃣4️⃣ Customer Retention Dashboard")
+    try:
+        # -----------------------------
+        # Part 1: Customer Churn Overview
+        # -----------------------------
+
+        def render_churn(df_churn):
+            st.subheader("📊 Customer Churn Overview")
+            st.dataframe(df_churn.head(50), use_container_width=True)
+
+            # KPI Metrics
+            total_customers = df_churn.shape[0]
+            churned_customers = df_churn['churn_label'].sum()
+            retained_customers = total_customers - churned_customers
+
+            st.markdown("### 🔹 Churn Summary")
+            col1, col2, col3 = st.columns(3)
+            col1.metric("👥 Total Customers", f"{total_customers:,}")
+            col2.metric("⚠️ Churned Customers", f"{churned_customers:,}", f"{churned_customers/total_customers*100:.2f}%")
+            col3.metric("✅ Retained Customers", f"{retained_customers:,}", f"{retained_customers/total_customers*100:.2f}%")
+
+            st.subheader("Churn Distribution")
+            churn_counts = df_churn['churn_label'].value_counts().rename({0:'Active',1:'Churned'})
+            st.bar_chart(churn_counts)
+
+        # -----------------------------
+        # Part 2: Retention Strategies Effectiveness
+        # -----------------------------
+        def render_retention(df_retention):
+            st.subheader("📊 Retention Strategies Effectiveness")
+            st.dataframe(df_retention, use_container_width=True)
+
+            st.markdown("### 🔹 Retention vs Churn Rates by Customer Type")
+            st.bar_chart(df_retention.set_index('customer_type')[['retention_rate_pct','churn_rate_pct']])
+
+        # -----------------------------
+        # Part 3: Monthly Cohort Retention
+        # -----------------------------
+        def render_cohorts(df_cohorts):
+            st.subheader("📅 Monthly Cohort Retention")
+            st.caption("Cohort = month of a customer's first order in the selected date range.")
+            labels = {"x": "Months since first order", "y": "Acquisition cohort"}
+            retention = df_cohorts.pivot(index="cohort", columns="months_since_first", values="retention_pct")
+            st.plotly_chart(
+                px.imshow(retention, aspect="auto", color_continuous_scale="Blues",
+                          labels={**labels, "color": "Retention %"}),
+                use_container_width=True,
+            )
+
+            st.markdown("### 🔹 Revenue by Cohort (₹ Cr)")
+            revenue = df_cohorts.pivot(index="cohort", columns="months_since_first", values="revenue") / 10000000
+            st.plotly_chart(
+                px.imshow(revenue.round(2), aspect="auto", color_continuous_scale="Greens",
+                          labels={**labels, "color": "Revenue (₹ Cr)"}),
+                use_container_width=True,
+            )
+
+            st.markdown("### 🔹 Average Retention Curve")
+            curve = df_cohorts.groupby("months_since_first")[["active_customers", "cohort_size"]].sum()
+            st.line_chart((curve["active_customers"] / curve["cohort_size"] * 100).rename("retention_pct"))
+
+        # Independent queries run concurrently; each section renders as soon as its data arrives
+        run_sections([
+            (lambda: ctx.load("churn"), render_churn),
+            (lambda: ctx.load("retention"), render_retention),
+            (lambda: ctx.load("cohorts"), render_cohorts),
+        ], error_label="Customer Retention section")
+
+    except Exception as e:
+        st.warning(f"Failed to load Customer Retention Dashboard. Error: {e}")
@@ -0,0 +1,68 @@
+"""
+Question 11: Customer Segmentation Dashboard.
+"""
+import pandas as pd
+import streamlit as st
+
+from dashboards import Summary
+from rfm import score_customers, segment_summary
+
+QUERY_RFM = """
+SELECT
+    customer_id,
+    COUNT(transaction_id) AS frequency,
+    SUM(final_amount_inr) AS monetary_value,
+    MAX(order_date) AS last_order_date,
+    DATEDIFF(MAX(order_date), MIN(order_date)) AS tenure_days
+FROM orders
+WHERE {filters}
+GROUP BY customer_id
+"""
+
+SUMMARY_RFM = """
+SELECT
+    customer_id,
+    total_orders AS frequency,
+    total_spend AS monetary_value,
+    last_order_date,
+    DATEDIFF(last_order_date, first_order_date) AS tenure_days
+FROM customer_summary
+"""
+
+QUERIES = {
+    "rfm": Summary(SUMMARY_RFM, QUERY_RFM),
+}
+
+
+def render(ctx):
+    st.header("1️⃣1️⃣ Customer Segmentation Dashboard")
+    try:
+        df_rfm = ctx.load("rfm")
+        reference_date = st.date_input(
+            "📅 Reference date",
+            value=pd.to_datetime(df_rfm["last_order_date"]).max().date(),
+            help="Recency is counted in days before this date (default: the latest order).",
+        )
+        # Scored once per reference date and shared by every session.
+        scored = ctx.derive("rfm", reference_date, lambda df: score_customers(df, reference_date))
+        segments = segment_summary(scored)
+
+        st.subheader("🧩 RFM Segments")
+        st.dataframe(segments, use_container_width=True, hide_index=True)
+        col1, col2 = st.columns(2)
+        col1.bar_chart(segments.set_index("segment")["customers"])
+        col2.bar_chart(segments.set_index("segment")["revenue"])
+
+        # RFM summary KPIs
+        st.markdown("### 🔹 RFM Overview")
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Avg Recency (Days)", f"{scored['recency_days'].mean():.1f}")
+        col2.metric("Avg Frequency", f"{scored['frequency'].mean():.1f}")
+        col3.metric("Avg Monetary Value (₹)", f"{scored['monetary_value'].mean():.2f}")
+        col4.metric("Avg Tenure (Days)", f"{scored['tenure_days'].mean():.1f}")
+
+        st.subheader("🏆 Top Customers by RFM Score")
+        st.dataframe(scored.nlargest(50, ["rfm_score", "monetary_value"]), use_container_width=True, hide_index=True)
+
+    except Exception as e:
+        st.warning(f"Failed to load Customer Segmentation Dashboard. Error: {e}")
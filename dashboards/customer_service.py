@@ -0,0 +1,105 @@
+"""
+Question 24: Customer Service Dashboard.
+"""
+import streamlit as st
+
+from dashboards import Routed
+
+QUERY_SERVICE_SUMMARY = """
+SELECT
+    ROUND(AVG(customer_rating), 2) AS avg_customer_satisfaction,
+    COUNT(CASE WHEN return_status LIKE 'Returned%%' THEN 1 END) AS total_returns,
+    COUNT(CASE WHEN return_status LIKE 'Cancelled%%' THEN 1 END) AS total_cancellations,
+    ROUND(AVG(delivery_days), 2) AS avg_delivery_days,
+    ROUND(SUM(CASE WHEN delivery_days > 7 THEN 1 ELSE 0 END) / COUNT(*) * 100, 2) AS delayed_delivery_pct
+FROM orders
+WHERE {filters};
+"""
+
+QUERY_SERVICE_SUMMARY_ROLLUP = """
+SELECT
+    ROUND(SUM(customer_rating_sum) / SUM(customer_rating_count), 2) AS avg_customer_satisfaction,
+    CAST(SUM(returns) AS SIGNED) AS total_returns,
+    CAST(SUM(cancellations) AS SIGNED) AS total_cancellations,
+    ROUND(SUM(delivery_days_sum) / SUM(delivery_days_count), 2) AS avg_delivery_days,
+    ROUND(SUM(late_deliveries) / SUM(row_count) * 100, 2) AS delayed_delivery_pct
+FROM {rollup}
+WHERE {filters};
+"""
+
+QUERY_SERVICE_TRENDS = """
+SELECT
+    YEAR(order_date) AS year,
+    MONTH(order_date) AS month,
+    ROUND(AVG(customer_rating), 2) AS avg_monthly_rating,
+    ROUND(SUM(CASE WHEN return_status LIKE 'Returned%%' THEN 1 ELSE 0 END) / COUNT(*) * 100, 2) AS return_rate_pct,
+    ROUND(SUM(CASE WHEN return_status LIKE 'Cancelled%%' THEN 1 ELSE 0 END) / COUNT(*) * 100, 2) AS cancel_rate_pct
+FROM orders
+WHERE {filters}
+GROUP BY YEAR(order_date), MONTH(order_date)
+ORDER BY year, month;
+"""
+
+QUERY_SERVICE_TRENDS_ROLLUP = """
+SELECT
+    order_year AS year,
+    order_month AS month,
+    ROUND(SUM(customer_rating_sum) / SUM(customer_rating_count), 2) AS avg_monthly_rating,
+    ROUND(SUM(returns) / SUM(row_count) * 100, 2) AS return_rate_pct,
+    ROUND(SUM(cancellations) / SUM(row_count) * 100, 2) AS cancel_rate_pct
+FROM {rollup}
+WHERE {filters}
+GROUP BY order_year, order_month
+ORDER BY year, month;
+"""
+
+QUERIES = {
+    "service_summary": Routed(QUERY_SERVICE_SUMMARY, QUERY_SERVICE_SUMMARY_ROLLUP, ("order_year",)),
+    "service_trends": Routed(QUERY_SERVICE_TRENDS, QUERY_SERVICE_TRENDS_ROLLUP, ("order_year", "order_month")),
+}
+
+
+def render(ctx):
+    st.header("2️⃣4️⃣ Customer Service Dashboard")
+    try:
+        # -----------------------------
+        # Part 1: Overall Service Quality Summary
+        # -----------------------------
+        df_service_summary = ctx.load("service_summary")
+
+        st.subheader("📊 Overall Service Quality Summary")
+        st.dataframe(df_service_summary, use_container_width=True)
+
+        # KPI metrics
+        avg_rating = df_service_summary["avg_customer_satisfaction"].iloc[0]
+        total_returns = df_service_summary["total_returns"].iloc[0]
+        total_cancellations = df_service_summary["total_cancellations"].iloc[0]
+        avg_delivery = df_service_summary["avg_delivery_days"].iloc[0]
+        delayed_pct = df_service_summary["delayed_delivery_pct"].iloc[0]
+
+        col1, col2, col3, col4, col5 = st.columns(5)
+        col1.metric("Avg Satisfaction ⭐", avg_rating)
+        col2.metric("Total Returns", f"{total_returns:,}")
+        col3.metric("Total Cancellations", f"{total_cancellations:,}")
+        col4.metric("Avg Delivery Days", f"{avg_delivery:.1f}")
+        col5.metric("Delayed Deliveries (%)", f"{delayed_pct:.2f}%")
+
+        # -----------------------------
+        # Part 2: Service Quality Trends (Monthly)
+        # -----------------------------
+        df_service_trends = ctx.load("service_trends")
+
+        st.subheader("📈 Monthly Service Quality Trends")
+        st.dataframe(df_service_trends.head(50), use_container_width=True)
+
+        # Prepare chart
+        df_service_trends["year_month"] = df_service_trends["year"].astype(str) + "-" + df_service_trends["month"].astype(str)
+
+        st.markdown("### 🔹 Customer Rating Trend")
+        st.line_chart(df_service_trends.set_index("year_month")[["avg_monthly_rating"]])
+
+        st.markdown("### 🔹 Return vs Cancel Rates (%)")
+        st.line_chart(df_service_trends.set_index("year_month")[["return_rate_pct", "cancel_rate_pct"]])
+
+    except Exception as e:
+        st.warning(f"Failed to load Customer Service Dashboard. Error: {e}")
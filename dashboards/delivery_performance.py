@@ -0,0 +1,48 @@
+"""
+Question 21: Delivery Performance Dashboard.
+"""
+import streamlit as st
+
+from pushdown import AggSpec, Measure
+
+SPEC21_MONTHLY = AggSpec(
+    group_keys=("order_year", "order_month"),
+    measures={"delivery_days": Measure("mean", "delivery_days")},
+    order_by=(("order_year", True), ("order_month", True)),
+)
+
+SPEC21_DAYS = AggSpec(
+    group_keys=("delivery_days",),
+    measures={"orders": Measure("size")},
+    order_by=(("delivery_days", True),),
+)
+
+QUERIES = {
+    "monthly": SPEC21_MONTHLY,
+    "days": SPEC21_DAYS,
+}
+
+
+def render(ctx):
+    st.header("21️⃣ Delivery Performance Dashboard")
+    try:
+        avg_delivery = ctx.load("monthly")
+        delivery_days = ctx.load("days")
+
+        # Metrics (from the delivery-days histogram; NULL days count as not on time)
+        known_days = delivery_days.dropna(subset=["delivery_days"])
+        avg_days = (known_days["delivery_days"] * known_days["orders"]).sum() / known_days["orders"].sum()
+        on_time_rate = delivery_days.loc[(delivery_days["delivery_days"] <= 5).fillna(False), "orders"].sum() / delivery_days["orders"].sum() * 100  # Assuming <=5 days is on-time
+
+        st.metric("⏱ Average Delivery Days", f"{avg_days:.2f}")
+        st.metric("✅ On-time Delivery Rate (%)", f"{on_time_rate:.2f}")
+
+        # Charts
+        st.subheader("Avg Delivery Days Over Time")
+        avg_delivery['Year-Month'] = avg_delivery['order_year'].astype(str) + "-" + avg_delivery['order_month'].astype(str)
+        st.line_chart(avg_delivery.set_index('Year-Month')['delivery_days'])
+
+        st.subheader("Delivery Days Distribution")
+        st.bar_chart(known_days.set_index("delivery_days")["orders"])
+    except Exception as e:
+        st.warning(f"Failed to load Delivery Performance Dashboard. Error: {e}")
@@ -0,0 +1,36 @@
+"""
+Question 15: Demographics & Behavior Dashboard.
+"""
+import streamlit as st
+
+QUERY_DEMO = """
+SELECT
+    customer_age_group,
+    customer_tier,
+    COUNT(DISTINCT customer_id) AS total_customers,
+    SUM(final_amount_inr)/10000000 AS revenue_in_crores
+FROM orders
+WHERE {filters}
+GROUP BY customer_age_group, customer_tier
+ORDER BY revenue_in_crores DESC
+"""
+
+QUERIES = {
+    "demo": QUERY_DEMO,
+}
+
+
+def render(ctx):
+    st.header("1️⃣5️⃣ Demographics & Behavior Dashboard")
+    try:
+        df_demo = ctx.load("demo")
+
+        st.subheader("📊 Customer Demographics Metrics")
+        st.dataframe(df_demo.head(50), use_container_width=True)
+
+        st.subheader("📈 Revenue by Age Group")
+        pivot_demo = df_demo.pivot(index="customer_age_group", columns="customer_tier", values="revenue_in_crores").fillna(0)
+        st.bar_chart(pivot_demo)
+
+    except Exception as e:
+        st.warning(f"Failed to load Demographics Dashboard. Error: {e}")
@@ -0,0 +1,137 @@
+"""
+Question 1: Executive Summary Dashboard.
+"""
+import streamlit as st
+
+from dashboards import Sketched
+
+QUERY1 = """
+WITH Annual_Metrics AS (
+    SELECT
+        order_year,
+        SUM(final_amount_inr) AS Raw_Revenue_INR,
+        COUNT(DISTINCT customer_id) AS Active_Customers,
+        ROUND(SUM(final_amount_inr) / COUNT(DISTINCT transaction_id), 2) AS Average_Order_Value_INR
+    FROM orders
+    WHERE {filters}
+    GROUP BY 1
+),
+Revenue_Growth AS (
+    SELECT
+        order_year,
+        Active_Customers,
+        Average_Order_Value_INR,
+        ROUND(Raw_Revenue_INR / 10000000.0, 2) AS Total_Revenue_Cores,
+        LAG(Raw_Revenue_INR, 1) OVER (ORDER BY order_year) AS Previous_Year_Revenue,
+        ROUND(
+            ((Raw_Revenue_INR - LAG(Raw_Revenue_INR, 1) OVER (ORDER BY order_year)) / LAG(Raw_Revenue_INR, 1) OVER (ORDER BY order_year)) * 100,
+            2
+        ) AS YoY_Revenue_Growth_Pct
+    FROM Annual_Metrics
+),
+Subcategory_Ranked AS (
+    SELECT
+        order_year,
+        subcategory,
+        ROUND(SUM(final_amount_inr) / 10000000.0, 2) AS Subcategory_Revenue_Cores,
+        ROW_NUMBER() OVER (PARTITION BY order_year ORDER BY SUM(final_amount_inr) DESC) as rn
+    FROM orders
+    WHERE {filters}
+    GROUP BY 1, 2
+),
+Top_Subcategory_Per_Year AS (
+    SELECT
+        order_year,
+        subcategory AS Top_Subcategory_Name,
+        Subcategory_Revenue_Cores AS Final_Subcategory_Revenue_Cores
+    FROM Subcategory_Ranked
+    WHERE rn = 1
+)
+SELECT
+    RG.order_year AS Year,
+    RG.Total_Revenue_Cores,
+    RG.YoY_Revenue_Growth_Pct,
+    RG.Active_Customers,
+    RG.Average_Order_Value_INR,
+    TC.Top_Subcategory_Name,
+    TC.Final_Subcategory_Revenue_Cores AS Top_Subcategory_Revenue_Cores 
+FROM Revenue_Growth RG
+JOIN Top_Subcategory_Per_Year TC
+    ON RG.order_year = TC.order_year
+ORDER BY RG.order_year ASC;
+"""
+
+# Same query over rollup_month_subcategory; Active_Customers is filled from the sketches.
+# COUNT(DISTINCT transaction_id) is the order count: transaction ids are unique.
+QUERY1_ROLLUP = """
+WITH Annual_Metrics AS (
+    SELECT
+        order_year,
+        SUM(revenue) AS Raw_Revenue_INR,
+        ROUND(SUM(revenue) / SUM(orders), 2) AS Average_Order_Value_INR
+    FROM {rollup}
+    WHERE {filters}
+    GROUP BY 1
+),
+Revenue_Growth AS (
+    SELECT
+        order_year,
+        Average_Order_Value_INR,
+        ROUND(Raw_Revenue_INR / 10000000.0, 2) AS Total_Revenue_Cores,
+        ROUND(
+            ((Raw_Revenue_INR - LAG(Raw_Revenue_INR, 1) OVER (ORDER BY order_year)) / LAG(Raw_Revenue_INR, 1) OVER (ORDER BY order_year)) * 100,
+            2
+        ) AS YoY_Revenue_Growth_Pct
+    FROM Annual_Metrics
+),
+Subcategory_Ranked AS (
+    SELECT
+        order_year,
+        subcategory,
+        ROUND(SUM(revenue) / 10000000.0, 2) AS Subcategory_Revenue_Cores,
+        ROW_NUMBER() OVER (PARTITION BY order_year ORDER BY SUM(revenue) DESC) as rn
+    FROM {rollup}
+    WHERE {filters}
+    GROUP BY 1, 2
+)
+SELECT
+    RG.order_year AS Year,
+    RG.Total_Revenue_Cores,
+    RG.YoY_Revenue_Growth_Pct,
+    NULL AS Active_Customers,
+    RG.Average_Order_Value_INR,
+    SR.subcategory AS Top_Subcategory_Name,
+    SR.Subcategory_Revenue_Cores AS Top_Subcategory_Revenue_Cores
+FROM Revenue_Growth RG
+JOIN Subcategory_Ranked SR
+    ON RG.order_year = SR.order_year AND SR.rn = 1
+ORDER BY RG.order_year ASC;
+"""
+
+QUERIES = {
+    "query1": Sketched(
+        QUERY1, QUERY1_ROLLUP, ("subcategory",), {"Active_Customers": "customer_id"}, {"Year": "order_year"}
+    ),
+}
+
+
+def render(ctx):
+    st.header("1️⃣ Executive Summary Dashboard")
+    try:
+        df1 = ctx.load("query1")
+
+        # Display metrics for the latest year
+        latest = df1.iloc[-1]
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("💰 Total Revenue (₹ Cr)", f"{latest.Total_Revenue_Cores:,.2f}", f"{latest.YoY_Revenue_Growth_Pct:.2f}%")
+        col2.metric("👥 Active Customers", f"{latest.Active_Customers:,}")
+        col3.metric("🛒 Average Order Value (₹)", f"{latest.Average_Order_Value_INR:,.2f}")
+        col4.metric("🏆 Top Subcategory", f"{latest.Top_Subcategory_Name} ({latest.Top_Subcategory_Revenue_Cores:.2f} Cr)")
+
+        # Revenue trend chart
+        st.subheader("Revenue Trend & YoY Growth")
+        st.line_chart(df1.set_index('Year')[['Total_Revenue_Cores']])
+        st.bar_chart(df1.set_index('Year')[['YoY_Revenue_Growth_Pct']])
+
+    except Exception as e:
+        st.warning(f"Failed to load Executive Summary Dashboard. Error: {e}")
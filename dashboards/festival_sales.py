@@ -0,0 +1,78 @@
+"""
+Question 9: Festival Sales Analytics.
+"""
+import streamlit as st
+
+from dashboards import Sketched
+
+QUERY_FESTIVAL = """
+SELECT
+    order_year,
+    ROUND(SUM(final_amount_inr)/10000000, 2) AS total_festival_revenue_in_crores,
+    COUNT(transaction_id) AS total_orders,
+    COUNT(DISTINCT customer_id) AS total_customers,
+    ROUND(SUM(final_amount_inr)/NULLIF(COUNT(transaction_id),0), 2) AS avg_order_value_in_inr,
+    SUM(CASE WHEN is_festival_sale=1 THEN 1 ELSE 0 END) AS festival_orders_count,
+    ROUND(SUM(CASE WHEN is_prime_member=1 THEN final_amount_inr ELSE 0 END)/NULLIF(SUM(final_amount_inr),0) * 100, 2) AS prime_revenue_share_pct
+FROM orders
+WHERE is_festival_sale = 1 AND {filters}
+GROUP BY order_year
+ORDER BY order_year;
+"""
+
+QUERY_FESTIVAL_ROLLUP = """
+SELECT
+    order_year,
+    ROUND(SUM(revenue)/10000000, 2) AS total_festival_revenue_in_crores,
+    CAST(SUM(orders) AS SIGNED) AS total_orders,
+    NULL AS total_customers,
+    ROUND(SUM(revenue)/NULLIF(SUM(orders),0), 2) AS avg_order_value_in_inr,
+    CAST(SUM(row_count) AS SIGNED) AS festival_orders_count,
+    ROUND(SUM(CASE WHEN is_prime_member=1 THEN revenue ELSE 0 END)/NULLIF(SUM(revenue),0) * 100, 2) AS prime_revenue_share_pct
+FROM {rollup}
+WHERE is_festival_sale = 1 AND {filters}
+GROUP BY order_year
+ORDER BY order_year;
+"""
+
+QUERIES = {
+    "festival": Sketched(
+        QUERY_FESTIVAL, QUERY_FESTIVAL_ROLLUP, (), {"total_customers": "customer_id"}, {"order_year": "order_year"},
+        {"is_festival_sale": 1},
+    ),
+}
+
+
+def render(ctx):
+    st.header("9️⃣ Festival Sales Analytics Dashboard")
+    try:
+        df_festival = ctx.load("festival")
+
+        # Show table
+        st.subheader("🎉 Festival Sales Metrics by Year")
+        st.dataframe(df_festival, use_container_width=True)
+
+        # KPI-style snapshot for latest year
+        latest_year = df_festival["order_year"].max()
+        latest_data = df_festival[df_festival["order_year"] == latest_year]
+        st.markdown(f"### Latest Festival Year ({latest_year}) Highlights")
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("💰 Total Revenue (₹ Cr)", f"{latest_data['total_festival_revenue_in_crores'].values[0]:.2f}")
+        col2.metric("🛒 Total Orders", f"{latest_data['total_orders'].values[0]:,}")
+        col3.metric("👥 Active Customers", f"{latest_data['total_customers'].values[0]:,}")
+        col4.metric("🏆 Prime Revenue Share (%)", f"{latest_data['prime_revenue_share_pct'].values[0]:.2f}")
+
+        # Revenue Trend Chart
+        st.subheader("📈 Festival Revenue Trend Over Years")
+        st.line_chart(df_festival.set_index("order_year")["total_festival_revenue_in_crores"])
+
+        # Avg Order Value Trend
+        st.subheader("🛍️ Average Order Value Trend")
+        st.line_chart(df_festival.set_index("order_year")["avg_order_value_in_inr"])
+
+        # Orders Count Trend
+        st.subheader("📊 Festival Orders Count Trend")
+        st.bar_chart(df_festival.set_index("order_year")["festival_orders_count"])
+
+    except Exception as e:
+        st.warning(f"Failed to load Festival Sales Analytics Dashboard. Error: {e}")
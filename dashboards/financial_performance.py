@@ -0,0 +1,69 @@
+"""
+Question 4: Financial Performance Dashboard.
+"""
+import streamlit as st
+
+from dashboards import Routed
+
+QUERY4 = """
+SELECT
+    order_year,
+    subcategory,
+    ROUND(SUM(original_price_inr * quantity) / 10000000, 2) AS gross_sales_crores,
+    ROUND(SUM(original_price_inr * discount_percent/100 * quantity) / 10000000, 2) AS discount_given_crores,
+    ROUND(SUM(final_amount_inr) / 10000000, 2) AS net_revenue_crores,
+    ROUND(SUM(delivery_charges) / 10000000, 2) AS delivery_charges_crores
+FROM orders
+WHERE {filters}
+GROUP BY order_year, subcategory
+ORDER BY order_year, net_revenue_crores DESC;
+"""
+
+QUERY4_ROLLUP = """
+SELECT
+    order_year,
+    subcategory,
+    ROUND(SUM(gross_sales) / 10000000, 2) AS gross_sales_crores,
+    ROUND(SUM(discount_amount) / 10000000, 2) AS discount_given_crores,
+    ROUND(SUM(revenue) / 10000000, 2) AS net_revenue_crores,
+    ROUND(SUM(delivery_charges) / 10000000, 2) AS delivery_charges_crores
+FROM {rollup}
+WHERE {filters}
+GROUP BY order_year, subcategory
+ORDER BY order_year, net_revenue_crores DESC;
+"""
+
+QUERIES = {
+    "query4": Routed(QUERY4, QUERY4_ROLLUP, ("order_year", "subcategory")),
+}
+
+
+def render(ctx):
+    st.header("4️⃣ Financial Performance Dashboard")
+    try:
+        df4 = ctx.load("query4")
+
+        # Show data
+        st.subheader("📊 Financial Breakdown by Subcategory")
+        st.dataframe(df4, use_container_width=True)
+
+        # KPI snapshot (overall)
+        st.subheader("💰 Key Financial Metrics")
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Gross Sales (₹ Cr)", f"{df4['gross_sales_crores'].sum():,.2f}")
+        col2.metric("Net Revenue (₹ Cr)", f"{df4['net_revenue_crores'].sum():,.2f}")
+        col3.metric("Discounts Given (₹ Cr)", f"{df4['discount_given_crores'].sum():,.2f}")
+        col4.metric("Delivery Charges (₹ Cr)", f"{df4['delivery_charges_crores'].sum():,.2f}")
+
+        # Revenue Breakdown by Subcategory (Stacked Bar)
+        st.subheader("🛒 Revenue Breakdown by Subcategory (Year-wise)")
+        pivot_rev = df4.pivot(index="order_year", columns="subcategory", values="net_revenue_crores").fillna(0)
+        st.bar_chart(pivot_rev, use_container_width=True)
+
+        # Cost Structure (Discounts & Delivery Charges vs Revenue)
+        st.subheader("⚙️ Cost Structure Components")
+        df_cost = df4.groupby("order_year")[["discount_given_crores", "delivery_charges_crores", "net_revenue_crores"]].sum()
+        st.area_chart(df_cost, use_container_width=True)
+
+    except Exception as e:
+        st.warning(f"Failed to load Financial Performance Dashboard. Error: {e}")
@@ -0,0 +1,177 @@
+"""
+Question 8: Geographic Revenue Analysis.
+"""
+import streamlit as st
+
+from dashboards import Routed, Sketched
+from paging import render_paged_table
+from scheduler import run_sections
+
+QUERY_STATE = """
+SELECT
+    customer_state,
+    ROUND(SUM(final_amount_inr)/10000000, 2) AS revenue_in_crores,
+    COUNT(DISTINCT customer_id) AS total_customers,
+    COUNT(transaction_id) AS total_orders
+FROM orders
+WHERE {filters}
+GROUP BY customer_state
+ORDER BY revenue_in_crores DESC;
+"""
+
+QUERY_STATE_ROLLUP = """
+SELECT
+    customer_state,
+    ROUND(SUM(revenue)/10000000, 2) AS revenue_in_crores,
+    NULL AS total_customers,
+    CAST(SUM(orders) AS SIGNED) AS total_orders
+FROM {rollup}
+WHERE {filters}
+GROUP BY customer_state
+ORDER BY revenue_in_crores DESC;
+"""
+
+QUERY_CITY = """
+SELECT
+    customer_state,
+    customer_city,
+    ROUND(SUM(final_amount_inr)/10000000, 2) AS revenue_in_crores,
+    COUNT(DISTINCT customer_id) AS total_customers,
+    COUNT(transaction_id) AS total_orders
+FROM orders
+WHERE {filters}
+GROUP BY customer_state, customer_city
+ORDER BY customer_state, revenue_in_crores DESC;
+"""
+
+QUERY_TIER = """
+SELECT
+    customer_tier,
+    ROUND(SUM(final_amount_inr)/10000000, 2) AS revenue_in_crores,
+    COUNT(*) AS total_orders
+FROM orders
+WHERE {filters}
+GROUP BY customer_tier
+ORDER BY revenue_in_crores DESC;
+"""
+
+QUERY_TIER_ROLLUP = """
+SELECT
+    customer_tier,
+    ROUND(SUM(revenue)/10000000, 2) AS revenue_in_crores,
+    CAST(SUM(row_count) AS SIGNED) AS total_orders
+FROM {rollup}
+WHERE {filters}
+GROUP BY customer_tier
+ORDER BY revenue_in_crores DESC;
+"""
+
+QUERY_YEAR_STATE = """
+SELECT
+    order_year,
+    customer_state,
+    ROUND(SUM(final_amount_inr)/10000000, 2) AS revenue_in_crores,
+    COUNT(DISTINCT customer_id) AS total_customers
+FROM orders
+WHERE {filters}
+GROUP BY order_year, customer_state
+ORDER BY order_year, revenue_in_crores DESC;
+"""
+
+QUERY_YEAR_STATE_ROLLUP = """
+SELECT
+    order_year,
+    customer_state,
+    ROUND(SUM(revenue)/10000000, 2) AS revenue_in_crores,
+    NULL AS total_customers
+FROM {rollup}
+WHERE {filters}
+GROUP BY order_year, customer_state
+ORDER BY order_year, revenue_in_crores DESC;
+"""
+
+QUERY_PENETRATION = """
+WITH customer_state_summary AS (
+    SELECT
+        customer_id,
+        customer_state,
+        MAX(order_year) AS last_order_year
+    FROM orders
+    WHERE {filters}
+    GROUP BY customer_id, customer_state
+)
+SELECT
+    customer_state,
+    COUNT(customer_id) AS total_customers,
+    SUM(CASE WHEN last_order_year = YEAR(CURDATE()) THEN 1 ELSE 0 END) AS active_customers_current_year,
+    ROUND(
+        SUM(CASE WHEN last_order_year = YEAR(CURDATE()) THEN 1 ELSE 0 END) / COUNT(customer_id) * 100,
+        2
+    ) AS penetration_pct
+FROM customer_state_summary
+GROUP BY customer_state
+ORDER BY penetration_pct DESC;
+"""
+
+QUERIES = {
+    "state": Sketched(
+        QUERY_STATE, QUERY_STATE_ROLLUP, (), {"total_customers": "customer_id"}, {"customer_state": "customer_state"}
+    ),
+    "city": QUERY_CITY,
+    "tier": Routed(QUERY_TIER, QUERY_TIER_ROLLUP, ("order_year", "customer_tier")),
+    "year_state": Sketched(
+        QUERY_YEAR_STATE, QUERY_YEAR_STATE_ROLLUP, (), {"total_customers": "customer_id"},
+        {"order_year": "order_year", "customer_state": "customer_state"},
+    ),
+    "penetration": QUERY_PENETRATION,
+}
+
+
+def render(ctx):
+    st.header("8️⃣ Geographic Revenue Analysis Dashboard")
+    try:
+        # 1️⃣ State-wise Revenue
+        def render_state(df_state):
+            st.subheader("📍 State-wise Revenue")
+            st.dataframe(df_state, use_container_width=True)
+            st.bar_chart(df_state.set_index("customer_state")["revenue_in_crores"])
+
+        # 2️⃣ City-wise Revenue
+        # Paged in SQL on the script thread: only the visible page is fetched.
+        def render_city(_):
+            st.subheader("🏙️ City-wise Revenue (Top Cities per State)")
+            render_paged_table(
+                ctx, "city", keys=("customer_state", "customer_city"),
+                sort_columns=("customer_state", "customer_city", "revenue_in_crores", "total_customers", "total_orders"),
+                search_columns=("customer_state", "customer_city"),
+            )
+
+        # 3️⃣ Tier-wise Revenue Analysis
+        def render_tier(df_tier):
+            st.subheader("📊 Customer Tier-wise Revenue")
+            st.dataframe(df_tier, use_container_width=True)
+            st.bar_chart(df_tier.set_index("customer_tier")["revenue_in_crores"])
+
+        # 4️⃣ Yearly State-wise Revenue Trend
+        def render_year_state(df_year_state):
+            st.subheader("📈 Yearly State-wise Revenue Trend")
+            pivot_state = df_year_state.pivot(index="order_year", columns="customer_state", values="revenue_in_crores").fillna(0)
+            st.line_chart(pivot_state)
+
+        # 5️⃣ Market Penetration Proxy
+        def render_penetration(df_penetration):
+            st.subheader("🗺️ Market Penetration by State")
+            st.dataframe(df_penetration, use_container_width=True)
+            st.bar_chart(df_penetration.set_index("customer_state")["penetration_pct"])
+
+        # Independent queries run concurrently; each section renders as soon as its data arrives
+        run_sections([
+            (lambda: ctx.load("state"), render_state),
+            (lambda: None, render_city),
+            (lambda: ctx.load("tier"), render_tier),
+            (lambda: ctx.load("year_state"), render_year_state),
+            (lambda: ctx.load("penetration"), render_penetration),
+        ], error_label="Geographic Revenue Analysis section")
+
+    except Exception as e:
+        st.warning(f"Failed to load Geographic Revenue Analysis Dashboard. Error: {e}")
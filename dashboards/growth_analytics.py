@@ -0,0 +1,85 @@
+"""
+Question 5: Growth Analytics Dashboard.
+"""
+import streamlit as st
+
+from dashboards import Sketched
+
+QUERY5 = """
+WITH customer_growth AS (
+    SELECT
+        order_year,
+        COUNT(DISTINCT customer_id) AS active_customers
+    FROM orders
+    WHERE {filters}
+    GROUP BY order_year
+),
+product_expansion AS (
+    SELECT
+        order_year,
+        COUNT(DISTINCT product_id) AS unique_products
+    FROM orders
+    WHERE {filters}
+    GROUP BY order_year
+),
+revenue_growth AS (
+    SELECT
+        order_year,
+        ROUND(SUM(final_amount_inr)/10000000, 2) AS revenue_crores
+    FROM orders
+    WHERE {filters}
+    GROUP BY order_year
+)
+SELECT
+    cg.order_year,
+    cg.active_customers,
+    pe.unique_products,
+    rg.revenue_crores
+FROM customer_growth cg
+JOIN product_expansion pe ON cg.order_year = pe.order_year
+JOIN revenue_growth rg ON cg.order_year = rg.order_year
+ORDER BY cg.order_year;
+"""
+
+QUERY5_ROLLUP = """
+SELECT
+    order_year,
+    NULL AS active_customers,
+    NULL AS unique_products,
+    ROUND(SUM(revenue)/10000000, 2) AS revenue_crores
+FROM {rollup}
+WHERE {filters}
+GROUP BY order_year
+ORDER BY order_year;
+"""
+
+QUERIES = {
+    "query5": Sketched(
+        QUERY5, QUERY5_ROLLUP, (),
+        {"active_customers": "customer_id", "unique_products": "product_id"}, {"order_year": "order_year"},
+    ),
+}
+
+
+def render(ctx):
+    st.header("5️⃣ Growth Analytics Dashboard")
+    try:
+        df5 = ctx.load("query5")
+
+        # Show data
+        st.subheader("📈 Growth Metrics Over Years")
+        st.dataframe(df5, use_container_width=True)
+
+        # KPI snapshot (latest year)
+        latest = df5.iloc[-1]
+        col1, col2, col3 = st.columns(3)
+        col1.metric("👥 Customers", f"{latest.active_customers:,}")
+        col2.metric("📦 Unique Products", f"{latest.unique_products:,}")
+        col3.metric("💰 Revenue (₹ Cr)", f"{latest.revenue_crores:.2f}")
+
+        # Growth Trends
+        st.subheader("📊 Growth Trends")
+        st.line_chart(df5.set_index("order_year")[["active_customers", "unique_products", "revenue_crores"]])
+
+    except Exception as e:
+        st.warning(f"Failed to load Growth Analytics Dashboard. Error: {e}")
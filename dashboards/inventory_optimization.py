@@ -0,0 +1,31 @@
+"""
+Question 18: Inventory Optimization Dashboard.
+"""
+import streamlit as st
+
+from pushdown import AggSpec, Measure
+
+SPEC18 = AggSpec(
+    group_keys=("product_id", "product_name", "subcategory"),
+    measures={
+        "total_sold": Measure("sum", "quantity"),
+        "avg_monthly_sold": Measure("mean", "quantity"),
+    },
+    order_by=(("total_sold", False),),
+    limit=50,
+)
+
+QUERIES = {
+    "spec18": SPEC18,
+}
+
+
+def render(ctx):
+    st.header("18️⃣ Inventory Optimization Dashboard")
+    try:
+        df18 = ctx.load("spec18")
+
+        st.dataframe(df18, use_container_width=True)
+
+    except Exception as e:
+        st.warning(f"Failed to load Inventory Optimization Dashboard. Error: {e}")
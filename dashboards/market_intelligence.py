@@ -0,0 +1,40 @@
+"""
+Question 27: Market Intelligence Dashboard.
+"""
+import streamlit as st
+
+from pushdown import AggSpec, Measure
+
+SPEC27_BRAND = AggSpec(
+    group_keys=("brand",),
+    measures={"final_amount_inr": Measure("sum", "final_amount_inr", divide_by=10000000)},
+    order_by=(("brand", True),),
+)
+
+SPEC27_SUBCAT = AggSpec(
+    group_keys=("subcategory",),
+    measures={"final_amount_inr": Measure("sum", "final_amount_inr", divide_by=10000000)},
+    order_by=(("subcategory", True),),
+)
+
+QUERIES = {
+    "brand": SPEC27_BRAND,
+    "subcat": SPEC27_SUBCAT,
+}
+
+
+def render(ctx):
+    st.header("27️⃣ Market Intelligence Dashboard")
+    try:
+        st.subheader("Revenue by Brand")
+        revenue_brand = ctx.load("brand").set_index('brand')['final_amount_inr']
+        st.bar_chart(revenue_brand)
+
+        st.subheader("Revenue by Subcategory")
+        revenue_subcat = ctx.load("subcat").set_index('subcategory')['final_amount_inr']
+        st.bar_chart(revenue_subcat)
+
+        st.subheader("Top 5 Brands by Revenue")
+        st.dataframe(revenue_brand.sort_values(ascending=False).head(5))
+    except Exception as e:
+        st.warning(f"Failed to load Market Intelligence Dashboard. Error: {e}")
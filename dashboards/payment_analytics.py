@@ -0,0 +1,113 @@
+"""
+Question 22: Payment Analytics Dashboard.
+"""
+import streamlit as st
+
+from dashboards import Routed
+
+QUERY_PAYMENT_PREF = """
+SELECT
+    payment_method,
+    COUNT(*) AS total_transactions,
+    ROUND(SUM(final_amount_inr), 2) AS total_amount,
+    ROUND(AVG(final_amount_inr), 2) AS avg_transaction_value,
+    ROUND(COUNT(*) / (SELECT COUNT(*) FROM orders WHERE {filters}) * 100, 2) AS pct_of_total_transactions
+FROM orders
+WHERE {filters}
+GROUP BY payment_method
+ORDER BY total_transactions DESC;
+"""
+
+QUERY_PAYMENT_PREF_ROLLUP = """
+SELECT
+    payment_method,
+    CAST(SUM(row_count) AS SIGNED) AS total_transactions,
+    ROUND(SUM(revenue), 2) AS total_amount,
+    ROUND(SUM(revenue) / SUM(revenue_count), 2) AS avg_transaction_value,
+    ROUND(SUM(row_count) / (SELECT SUM(row_count) FROM {rollup} WHERE {filters}) * 100, 2) AS pct_of_total_transactions
+FROM {rollup}
+WHERE {filters}
+GROUP BY payment_method
+ORDER BY total_transactions DESC;
+"""
+
+QUERY_PAYMENT_TRENDS = """
+SELECT
+    YEAR(order_date) AS year,
+    MONTH(order_date) AS month,
+    payment_method,
+    COUNT(*) AS transactions_count,
+    ROUND(SUM(final_amount_inr), 2) AS total_amount,
+    ROUND(AVG(final_amount_inr), 2) AS avg_transaction_value
+FROM orders
+WHERE {filters}
+GROUP BY YEAR(order_date), MONTH(order_date), payment_method
+ORDER BY year, month, payment_method;
+"""
+
+QUERY_PAYMENT_TRENDS_ROLLUP = """
+SELECT
+    order_year AS year,
+    order_month AS month,
+    payment_method,
+    CAST(SUM(row_count) AS SIGNED) AS transactions_count,
+    ROUND(SUM(revenue), 2) AS total_amount,
+    ROUND(SUM(revenue) / SUM(revenue_count), 2) AS avg_transaction_value
+FROM {rollup}
+WHERE {filters}
+GROUP BY order_year, order_month, payment_method
+ORDER BY year, month, payment_method;
+"""
+
+QUERIES = {
+    "payment_pref": Routed(QUERY_PAYMENT_PREF, QUERY_PAYMENT_PREF_ROLLUP, ("order_year", "payment_method")),
+    "payment_trends": Routed(QUERY_PAYMENT_TRENDS, QUERY_PAYMENT_TRENDS_ROLLUP, ("order_year", "order_month", "payment_method")),
+}
+
+
+def render(ctx):
+    st.header("2️⃣2️⃣ Payment Analytics Dashboard")
+    try:
+        # -----------------------------
+        # Part 1: Payment Method Preferences & Performance
+        # -----------------------------
+        df_payment_pref = ctx.load("payment_pref")
+
+        st.subheader("💳 Payment Method Preferences")
+        st.dataframe(df_payment_pref, use_container_width=True)
+
+        # KPI summary
+        total_txn = df_payment_pref["total_transactions"].sum()
+        total_amount = df_payment_pref["total_amount"].sum()
+
+        col1, col2 = st.columns(2)
+        col1.metric("Total Transactions", f"{total_txn:,}")
+        col2.metric("Total Amount (₹)", f"{total_amount:,.2f}")
+
+        st.markdown("### 🔹 Transactions Share by Method")
+        st.bar_chart(df_payment_pref.set_index("payment_method")["pct_of_total_transactions"])
+
+        # -----------------------------
+        # Part 2: Monthly Payment Trends
+        # -----------------------------
+        df_payment_trends = ctx.load("payment_trends")
+
+        st.subheader("📈 Monthly Payment Trends")
+        st.dataframe(df_payment_trends.head(50), use_container_width=True)
+
+        # Prepare pivot for visualization
+        df_trend_pivot = df_payment_trends.pivot_table(
+            index=["year","month"], 
+            columns="payment_method", 
+            values="transactions_count", 
+            aggfunc="sum",
+            fill_value=0
+        ).reset_index()
+
+        df_trend_pivot["year_month"] = df_trend_pivot["year"].astype(str) + "-" + df_trend_pivot["month"].astype(str)
+
+        st.markdown("### 🔹 Transaction Trends by Payment Method")
+        st.line_chart(df_trend_pivot.set_index("year_month").drop(columns=["year","month"]))
+
+    except Exception as e:
+        st.warning(f"Failed to load Payment Analytics Dashboard. Error: {e}")
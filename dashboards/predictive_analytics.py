@@ -0,0 +1,82 @@
+"""
+Question 26: Predictive Analytics Dashboard.
+"""
+import pandas as pd
+import streamlit as st
+
+from dashboards import Summary
+from downsample import downsample
+from forecasting import backtest_series, fit_series, forecast_series
+from pushdown import AggSpec, Measure
+
+SPEC26_DAILY = AggSpec(
+    group_keys=("order_date",),
+    measures={"final_amount_inr": Measure("sum", "final_amount_inr")},
+    order_by=(("order_date", True),),
+)
+
+SPEC26_LAST_ORDER = AggSpec(
+    group_keys=("customer_id",),
+    measures={"last_order_date": Measure("max", "order_date")},
+)
+
+SUMMARY_LAST_ORDER = """
+SELECT customer_id, last_order_date
+FROM customer_summary
+"""
+
+# Daily models keep weekly seasonality and the last two years of history.
+SEASON_DAYS = 7
+HISTORY_DAYS = 728
+HORIZON_DAYS = 30
+
+
+def _daily(df):
+    """Daily revenue with the date as a daily ``period`` column."""
+    return df.assign(period=pd.to_datetime(df["order_date"]).dt.to_period("D"))
+
+
+QUERIES = {
+    "daily": SPEC26_DAILY,
+    "last_order": Summary(SUMMARY_LAST_ORDER, SPEC26_LAST_ORDER),
+}
+
+
+def render(ctx):
+    st.header("26️⃣ Predictive Analytics Dashboard")
+    try:
+        daily_sales = ctx.load("daily")
+        daily_sales['order_date'] = pd.to_datetime(daily_sales['order_date'])
+        daily_sales['rolling_avg'] = daily_sales['final_amount_inr'].rolling(7).mean()
+
+        # Holt-Winters fit cached with the query result; the projection itself is cheap.
+        fitted = ctx.derive("daily", ("holt-winters", HISTORY_DAYS), lambda df: fit_series(
+            _daily(df), "period", "final_amount_inr", season=SEASON_DAYS, history=HISTORY_DAYS,
+        ))
+        forecast = forecast_series(fitted, HORIZON_DAYS)
+        forecast = forecast.set_index(forecast["period"].dt.to_timestamp())["forecast"]
+
+        st.metric("💰 Total Revenue", f"{daily_sales['final_amount_inr'].sum():,.0f}")
+        st.metric("🔮 Forecast Revenue (next 30 days)", f"{forecast.sum():,.0f}")
+        st.subheader("Sales Forecast (Holt-Winters, weekly seasonality)")
+        chart = pd.concat([
+            daily_sales.set_index('order_date')[['final_amount_inr', 'rolling_avg']],
+            forecast.rename("forecast"),
+        ], axis=1)
+        st.line_chart(downsample(chart))
+
+        backtest = ctx.derive("daily", ("holt-winters backtest", HISTORY_DAYS), lambda df: backtest_series(
+            _daily(df), "period", "final_amount_inr", season=SEASON_DAYS, horizon=SEASON_DAYS,
+            folds=28, history=HISTORY_DAYS,
+        ))
+        col1, col2 = st.columns(2)
+        col1.metric("🧪 Backtest sMAPE, 7 days ahead (%)", f"{backtest['smape_pct'].iloc[0]:.2f}")
+        col2.metric("Seasonal-naive sMAPE (%)", f"{backtest['naive_smape_pct'].iloc[0]:.2f}")
+
+        # Simple churn estimation: customers with no purchase in last 90 days
+        latest_date = daily_sales['order_date'].max()
+        churn_customers = pd.to_datetime(ctx.load("last_order")['last_order_date'])
+        churn_rate = (churn_customers < (latest_date - pd.Timedelta(days=90))).mean() * 100
+        st.metric("📉 Estimated Churn Rate (%)", f"{churn_rate:.2f}")
+    except Exception as e:
+        st.warning(f"Failed to load Predictive Analytics Dashboard. Error: {e}")
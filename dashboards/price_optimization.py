@@ -0,0 +1,72 @@
+"""
+Question 10: Price Optimization Dashboard.
+"""
+import streamlit as st
+
+from downsample import downsample
+from paging import render_paged_table
+
+QUERY_DISCOUNT = """
+SELECT
+    ROUND(discount_percent,0) AS discount_pct_bucket,
+    COUNT(*) AS total_orders,
+    SUM(quantity) AS total_quantity_sold,
+    ROUND(SUM(final_amount_inr)/10000000, 2) AS revenue_in_crores,
+    ROUND(AVG(final_amount_inr),2) AS avg_order_value_in_inr
+FROM orders
+WHERE discount_percent IS NOT NULL AND {filters}
+GROUP BY discount_pct_bucket
+ORDER BY discount_pct_bucket;
+"""
+
+QUERY_PRICE_QTY = """
+SELECT
+    discounted_price_inr,
+    SUM(quantity) AS total_quantity_sold,
+    ROUND(SUM(final_amount_inr)/10000000, 2) AS revenue_in_crores
+FROM orders
+WHERE {filters}
+GROUP BY discounted_price_inr
+ORDER BY discounted_price_inr;
+"""
+
+QUERIES = {
+    "discount": QUERY_DISCOUNT,
+    "price_qty": QUERY_PRICE_QTY,
+}
+
+
+def render(ctx):
+    st.header("🔟 Price Optimization Dashboard")
+    try:
+        # Discount Effectiveness
+        df_discount = ctx.load("discount")
+
+        st.subheader("💸 Discount Effectiveness")
+        st.dataframe(df_discount, use_container_width=True)
+
+        # Discount Metrics Chart
+        st.subheader("📊 Revenue vs Discount %")
+        st.bar_chart(df_discount.set_index("discount_pct_bucket")["revenue_in_crores"])
+
+        st.subheader("📈 Avg Order Value vs Discount %")
+        st.line_chart(df_discount.set_index("discount_pct_bucket")["avg_order_value_in_inr"])
+
+        # Price vs Quantity (Elasticity)
+        df_price_qty = ctx.load("price_qty")
+
+        st.subheader("💰 Price vs Quantity Sold (Elasticity)")
+        render_paged_table(
+            ctx, "price_qty", keys=("discounted_price_inr",),
+            sort_columns=("discounted_price_inr", "total_quantity_sold", "revenue_in_crores"),
+        )
+
+        # Price Elasticity Charts
+        st.subheader("📊 Total Quantity Sold vs Discounted Price")
+        st.line_chart(downsample(df_price_qty.set_index("discounted_price_inr")["total_quantity_sold"]))
+
+        st.subheader("📈 Revenue vs Discounted Price")
+        st.line_chart(downsample(df_price_qty.set_index("discounted_price_inr")["revenue_in_crores"]))
+
+    except Exception as e:
+        st.warning(f"Failed to load Price Optimization Dashboard. Error: {e}")
@@ -0,0 +1,49 @@
+"""
+Question 13: Prime Membership Analytics Dashboard.
+"""
+import streamlit as st
+
+from dashboards import Sketched
+
+QUERY_PRIME = """
+SELECT
+    is_prime_member,
+    COUNT(DISTINCT customer_id) AS total_customers,
+    SUM(final_amount_inr)/10000000 AS revenue_in_crores,
+    ROUND(AVG(customer_rating), 2) AS avg_customer_rating
+FROM orders
+WHERE {filters}
+GROUP BY is_prime_member
+"""
+
+QUERY_PRIME_ROLLUP = """
+SELECT
+    is_prime_member,
+    NULL AS total_customers,
+    SUM(revenue)/10000000 AS revenue_in_crores,
+    ROUND(SUM(customer_rating_sum) / SUM(customer_rating_count), 2) AS avg_customer_rating
+FROM {rollup}
+WHERE {filters}
+GROUP BY is_prime_member
+"""
+
+QUERIES = {
+    "prime": Sketched(
+        QUERY_PRIME, QUERY_PRIME_ROLLUP, (), {"total_customers": "customer_id"}, {"is_prime_member": "is_prime_member"}
+    ),
+}
+
+
+def render(ctx):
+    st.header("1️⃣3️⃣ Prime Membership Analytics Dashboard")
+    try:
+        df_prime = ctx.load("prime")
+
+        st.subheader("📊 Prime vs Non-Prime Metrics")
+        st.dataframe(df_prime, use_container_width=True)
+
+        st.subheader("📈 Revenue Comparison")
+        st.bar_chart(df_prime.set_index("is_prime_member")["revenue_in_crores"])
+
+    except Exception as e:
+        st.warning(f"Failed to load Prime Membership Dashboard. Error: {e}")
@@ -0,0 +1,31 @@
+"""
+Question 20: New Product Launch Dashboard.
+"""
+import streamlit as st
+
+from paging import render_paged_table
+
+QUERY20 = """
+SELECT product_id, product_name, order_year, SUM(quantity) AS units_sold, SUM(final_amount_inr)/10000000 AS revenue_cr
+FROM orders
+WHERE {filters}
+GROUP BY product_id, product_name, order_year
+ORDER BY order_year, revenue_cr DESC
+"""
+
+QUERIES = {
+    "query20": QUERY20,
+}
+
+
+def render(ctx):
+    st.header("20️⃣ New Product Launch Dashboard")
+    try:
+        render_paged_table(
+            ctx, "query20", keys=("order_year", "product_id", "product_name"),
+            sort_columns=("order_year", "revenue_cr", "units_sold", "product_id", "product_name"),
+            search_columns=("product_id", "product_name"),
+        )
+
+    except Exception as e:
+        st.warning(f"Failed to load New Product Launch Dashboard. Error: {e}")
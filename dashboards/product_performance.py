@@ -0,0 +1,32 @@
+"""
+Question 16: Product Performance Dashboard.
+"""
+import streamlit as st
+
+from pushdown import AggSpec, Measure
+
+SPEC16 = AggSpec(
+    group_keys=("product_id", "product_name", "subcategory", "brand"),
+    measures={
+        "total_units_sold": Measure("sum", "quantity"),
+        "revenue_cr": Measure("sum", "final_amount_inr", divide_by=10000000, decimals=2),
+        "total_customers": Measure("nunique", "customer_id"),
+    },
+    order_by=(("revenue_cr", False),),
+    limit=50,
+)
+
+QUERIES = {
+    "spec16": SPEC16,
+}
+
+
+def render(ctx):
+    st.header("16️⃣ Product Performance Dashboard")
+    try:
+        df16 = ctx.load("spec16")
+
+        st.dataframe(df16, use_container_width=True)
+
+    except Exception as e:
+        st.warning(f"Failed to load Product Performance Dashboard. Error: {e}")
@@ -0,0 +1,32 @@
+"""
+Question 19: Product Rating & Review Dashboard.
+"""
+import streamlit as st
+
+from pushdown import AggSpec, Measure
+
+SPEC19 = AggSpec(
+    group_keys=("product_id", "product_name"),
+    measures={
+        "avg_rating": Measure("mean", "product_rating"),
+        "total_reviews": Measure("count", "product_rating"),
+    },
+    not_null=("product_rating",),
+    order_by=(("avg_rating", False),),
+    limit=50,
+)
+
+QUERIES = {
+    "spec19": SPEC19,
+}
+
+
+def render(ctx):
+    st.header("19️⃣ Product Rating & Review Dashboard")
+    try:
+        df19 = ctx.load("spec19")
+
+        st.dataframe(df19, use_container_width=True)
+
+    except Exception as e:
+        st.warning(f"Failed to load Product Rating & Review Dashboard. Error: {e}")
@@ -0,0 +1,76 @@
+"""
+Question 2: Real-time Business Performance Monitor.
+"""
+import numpy as np
+import streamlit as st
+
+from dashboards import Incremental
+
+REFRESH_INTERVALS = {"30 seconds": 30, "1 minute": 60, "5 minutes": 300}
+
+# Revenue is kept unrounded so the month-over-month alert compares exact sums.
+QUERY2 = """
+SELECT
+    order_year,
+    order_month,
+    COUNT(DISTINCT customer_id) AS active_customers,
+    COUNT(transaction_id) AS total_orders,
+    SUM(final_amount_inr) AS revenue,
+    SUM(quantity) AS total_quantity,
+    ROUND(AVG(customer_rating), 1) AS avg_customer_rating,
+    MAX(order_date) AS watermark
+FROM orders
+WHERE {filters} AND order_date >= %(since)s
+GROUP BY order_year, order_month
+ORDER BY order_year, order_month;
+"""
+
+QUERIES = {
+    "query2": Incremental(QUERY2),
+}
+
+
+def with_revenue_alert(df):
+    """Add ``revenue_in_crores`` and the month-over-month ``revenue_alert`` within each year.
+
+    Same as ``LAG(SUM(...)) OVER (PARTITION BY order_year ORDER BY order_month)``:
+    the first month of a year has nothing to compare with and is flagged.
+    """
+    previous = df.groupby("order_year")["revenue"].shift()
+    df["revenue_in_crores"] = (df["revenue"] / 10000000).round(2)
+    df["revenue_alert"] = np.where(df["revenue"] >= previous, "OK", "ALERT: Revenue Down")
+    return df
+
+
+def render(ctx):
+    st.header("2️⃣ Real-time Business Performance Monitor")
+    col1, col2 = st.columns([1, 3])
+    auto_refresh = col1.toggle(
+        "🔄 Auto-refresh",
+        help="Periodically re-aggregate just the months since the newest order seen.",
+    )
+    interval = col2.selectbox("Every", list(REFRESH_INTERVALS), disabled=not auto_refresh)
+
+    @st.fragment(run_every=REFRESH_INTERVALS[interval] if auto_refresh else None)
+    def monitor():
+        try:
+            df2 = with_revenue_alert(ctx.load("query2"))
+
+            # Display current month metrics
+            current = df2.iloc[-1]
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("💰 Revenue (₹ Cr)", f"{current.revenue_in_crores:.2f}", current.revenue_alert)
+            col2.metric("👥 Active Customers", f"{current.active_customers:,}")
+            col3.metric("🛒 Total Orders", f"{current.total_orders:,}")
+            col4.metric("📦 Total Quantity", f"{current.total_quantity:,}")
+            st.caption(f"Orders through {df2['watermark'].max()}")
+
+            # Line chart for revenue run-rate
+            st.subheader("Revenue Run-rate Over Months")
+            df2['Year-Month'] = df2['order_year'].astype(str) + "-" + df2['order_month'].astype(str)
+            st.line_chart(df2.set_index('Year-Month')[['revenue_in_crores', 'total_orders']])
+
+        except Exception as e:
+            st.warning(f"Failed to load Real-time Business Performance Monitor. Error: {e}")
+
+    monitor()
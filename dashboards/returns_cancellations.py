@@ -0,0 +1,60 @@
+"""
+Question 23: Return & Cancellation Dashboard.
+"""
+import streamlit as st
+
+QUERY_RETURN_CANCEL = """
+SELECT
+    subcategory,
+    COUNT(*) AS total_orders,
+    SUM(CASE WHEN return_status = 'Returned' THEN 1 ELSE 0 END) AS returned_orders,
+    SUM(CASE WHEN return_status = 'Cancelled' THEN 1 ELSE 0 END) AS cancelled_orders,
+    ROUND(SUM(CASE WHEN return_status = 'Returned' THEN final_amount_inr ELSE 0 END), 2) AS return_value,
+    ROUND(SUM(CASE WHEN return_status = 'Cancelled' THEN final_amount_inr ELSE 0 END), 2) AS cancel_value,
+    ROUND(SUM(CASE WHEN return_status = 'Returned' THEN final_amount_inr ELSE 0 END) / SUM(final_amount_inr) * 100, 2) AS return_rate_pct,
+    ROUND(SUM(CASE WHEN return_status = 'Cancelled' THEN final_amount_inr ELSE 0 END) / SUM(final_amount_inr) * 100, 2) AS cancel_rate_pct,
+    ROUND(AVG(customer_rating), 2) AS avg_customer_rating,
+    ROUND(AVG(product_rating), 2) AS avg_product_rating
+FROM orders
+WHERE {filters}
+GROUP BY subcategory
+ORDER BY return_rate_pct DESC;
+"""
+
+QUERIES = {
+    "return_cancel": QUERY_RETURN_CANCEL,
+}
+
+
+def render(ctx):
+    st.header("2️⃣3️⃣ Return & Cancellation Dashboard")
+    try:
+        # -----------------------------
+        # Part 1: Category-wise Return & Cancellation Impact
+        # -----------------------------
+        df_return_cancel = ctx.load("return_cancel")
+
+        st.subheader("📊 Category-wise Return & Cancellation Impact")
+        st.dataframe(df_return_cancel, use_container_width=True)
+
+        # KPI summary
+        total_orders = df_return_cancel["total_orders"].sum()
+        total_returns = df_return_cancel["returned_orders"].sum()
+        total_cancels = df_return_cancel["cancelled_orders"].sum()
+        total_loss_value = df_return_cancel["return_value"].sum() + df_return_cancel["cancel_value"].sum()
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Total Orders", f"{total_orders:,}")
+        col2.metric("Returned Orders", f"{total_returns:,}")
+        col3.metric("Cancelled Orders", f"{total_cancels:,}")
+        col4.metric("Total Loss Value (₹)", f"{total_loss_value:,.2f}")
+
+        # -----------------------------
+        # Part 2: Visualization
+        # -----------------------------
+        st.subheader("📉 Return & Cancellation Rates by Category")
+        chart_data = df_return_cancel.set_index("subcategory")[["return_rate_pct", "cancel_rate_pct"]]
+        st.bar_chart(chart_data)
+
+    except Exception as e:
+        st.warning(f"Failed to load Return & Cancellation Dashboard. Error: {e}")
@@ -0,0 +1,248 @@
+"""
+Question 6: Revenue Trend Analysis Dashboard with Time Period Selector.
+"""
+import pandas as pd
+import streamlit as st
+
+from dashboards import Routed
+from forecasting import PARAMS, backtest_series, fit_series, forecast_series
+from pushdown import AggSpec, Measure
+
+YEARLY_QUERY = """
+SELECT
+    order_year,
+    ROUND(SUM(final_amount_inr)/10000000, 2) AS revenue_in_crores,
+    ROUND(SUM(final_amount_inr)/NULLIF(LAG(SUM(final_amount_inr)) OVER (ORDER BY order_year),1) - 1, 4) * 100 AS yoy_growth_pct
+FROM orders
+WHERE {filters}
+GROUP BY order_year
+ORDER BY order_year;
+"""
+
+YEARLY_ROLLUP_QUERY = """
+SELECT
+    order_year,
+    ROUND(SUM(revenue)/10000000, 2) AS revenue_in_crores,
+    ROUND(SUM(revenue)/NULLIF(LAG(SUM(revenue)) OVER (ORDER BY order_year),1) - 1, 4) * 100 AS yoy_growth_pct
+FROM {rollup}
+WHERE {filters}
+GROUP BY order_year
+ORDER BY order_year;
+"""
+
+QUARTERLY_QUERY = """
+SELECT
+    order_year,
+    order_quarter,
+    ROUND(SUM(final_amount_inr)/10000000, 2) AS revenue_in_crores,
+    ROUND(
+        (SUM(final_amount_inr) - LAG(SUM(final_amount_inr)) OVER (ORDER BY order_year, order_quarter))
+        / NULLIF(LAG(SUM(final_amount_inr)) OVER (ORDER BY order_year, order_quarter),0)
+        * 100, 2
+    ) AS qoq_growth_pct
+FROM orders
+WHERE {filters}
+GROUP BY order_year, order_quarter
+ORDER BY order_year, order_quarter;
+"""
+
+QUARTERLY_ROLLUP_QUERY = """
+SELECT
+    order_year,
+    order_quarter,
+    ROUND(SUM(revenue)/10000000, 2) AS revenue_in_crores,
+    ROUND(
+        (SUM(revenue) - LAG(SUM(revenue)) OVER (ORDER BY order_year, order_quarter))
+        / NULLIF(LAG(SUM(revenue)) OVER (ORDER BY order_year, order_quarter),0)
+        * 100, 2
+    ) AS qoq_growth_pct
+FROM {rollup}
+WHERE {filters}
+GROUP BY order_year, order_quarter
+ORDER BY order_year, order_quarter;
+"""
+
+MONTHLY_QUERY = """
+SELECT
+    order_year,
+    order_month,
+    ROUND(SUM(final_amount_inr)/10000000, 2) AS revenue_in_crores,
+    ROUND(SUM(final_amount_inr)/NULLIF(LAG(SUM(final_amount_inr)) OVER (PARTITION BY order_year ORDER BY order_month),1) - 1, 4) * 100 AS mon_growth_pct
+FROM orders
+WHERE {filters}
+GROUP BY order_year, order_month
+ORDER BY order_year, order_month;
+"""
+
+MONTHLY_ROLLUP_QUERY = """
+SELECT
+    order_year,
+    order_month,
+    ROUND(SUM(revenue)/10000000, 2) AS revenue_in_crores,
+    ROUND(SUM(revenue)/NULLIF(LAG(SUM(revenue)) OVER (PARTITION BY order_year ORDER BY order_month),1) - 1, 4) * 100 AS mon_growth_pct
+FROM {rollup}
+WHERE {filters}
+GROUP BY order_year, order_month
+ORDER BY order_year, order_month;
+"""
+
+SEASONAL_VARIATION_QUERY = """
+SELECT
+    order_month,
+    ROUND(SUM(final_amount_inr)/10000000, 2) AS avg_revenue_in_crores,
+    COUNT(DISTINCT order_year) AS years_considered
+FROM orders
+WHERE {filters}
+GROUP BY order_month
+ORDER BY order_month;
+"""
+
+SEASONAL_VARIATION_ROLLUP_QUERY = """
+SELECT
+    order_month,
+    ROUND(SUM(revenue)/10000000, 2) AS avg_revenue_in_crores,
+    COUNT(DISTINCT order_year) AS years_considered
+FROM {rollup}
+WHERE {filters}
+GROUP BY order_month
+ORDER BY order_month;
+"""
+
+# Monthly revenue per series for the Holt-Winters forecasts (see ``forecasting``).
+SPEC6_SUBCATEGORY_MONTHLY = AggSpec(
+    group_keys=("order_year", "order_month", "subcategory"),
+    measures={"revenue": Measure("sum", "final_amount_inr")},
+)
+
+SPEC6_STATE_MONTHLY = AggSpec(
+    group_keys=("order_year", "order_month", "customer_state"),
+    measures={"revenue": Measure("sum", "final_amount_inr")},
+)
+
+SPEC6_SUBCATEGORY_STATE_MONTHLY = AggSpec(
+    group_keys=("order_year", "order_month", "subcategory", "customer_state"),
+    measures={"revenue": Measure("sum", "final_amount_inr")},
+)
+
+# Series choice -> (declared query, series key columns). The total is the sum over subcategories.
+FORECAST_SERIES = {
+    "Total": ("subcategory_monthly", ()),
+    "Subcategory": ("subcategory_monthly", ("subcategory",)),
+    "State": ("state_monthly", ("customer_state",)),
+    "Subcategory × State": ("subcategory_state_monthly", ("subcategory", "customer_state")),
+}
+
+QUERIES = {
+    "yearly": Routed(YEARLY_QUERY, YEARLY_ROLLUP_QUERY, ("order_year",)),
+    "quarterly": Routed(QUARTERLY_QUERY, QUARTERLY_ROLLUP_QUERY, ("order_year", "order_quarter")),
+    "monthly": Routed(MONTHLY_QUERY, MONTHLY_ROLLUP_QUERY, ("order_year", "order_month")),
+    "seasonal_variation": Routed(SEASONAL_VARIATION_QUERY, SEASONAL_VARIATION_ROLLUP_QUERY, ("order_year", "order_month")),
+    "subcategory_monthly": SPEC6_SUBCATEGORY_MONTHLY,
+    "state_monthly": SPEC6_STATE_MONTHLY,
+    "subcategory_state_monthly": SPEC6_SUBCATEGORY_STATE_MONTHLY,
+}
+
+
+def render(ctx):
+    st.header("6️⃣ Revenue Trend Analysis Dashboard")
+    try:
+        time_period = st.selectbox(
+            "Select Time Period for Revenue Analysis",
+            ["Yearly", "Quarterly", "Monthly", "Seasonal Variation", "Forecast"]
+        )
+
+        if time_period == "Yearly":
+            df = ctx.load("yearly")
+            st.subheader("📅 Yearly Revenue Trend")
+            st.line_chart(df.set_index("order_year")["revenue_in_crores"])
+            st.dataframe(df, use_container_width=True)
+
+        elif time_period == "Quarterly":
+            df = ctx.load("quarterly")
+            st.subheader("📊 Quarterly Revenue Trend")
+            df["quarter_label"] = df["order_year"].astype(str) + " Q" + df["order_quarter"].astype(str)
+            st.line_chart(df.set_index("quarter_label")["revenue_in_crores"])
+            st.dataframe(df, use_container_width=True)
+
+        elif time_period == "Monthly":
+            df = ctx.load("monthly")
+            st.subheader("📆 Monthly Revenue Trend")
+            df["month_label"] = df["order_year"].astype(str) + "-" + df["order_month"].astype(str).str.zfill(2)
+            st.line_chart(df.set_index("month_label")["revenue_in_crores"])
+            st.dataframe(df, use_container_width=True)
+
+        elif time_period == "Seasonal Variation":
+            df = ctx.load("seasonal_variation")
+            st.subheader("🌸 Seasonal Revenue Variation")
+            st.bar_chart(df.set_index("order_month")["avg_revenue_in_crores"])
+            st.dataframe(df, use_container_width=True)
+
+        elif time_period == "Forecast":
+            render_forecast(ctx)
+
+    except Exception as e:
+        st.warning(f"Failed to load Revenue Trend Analysis Dashboard. Error: {e}")
+
+
+def _monthly(df):
+    """``df`` with its year and month as a monthly ``period`` column."""
+    return df.assign(period=pd.to_datetime(
+        pd.DataFrame({"year": df["order_year"], "month": df["order_month"], "day": 1})
+    ).dt.to_period("M"))
+
+
+def _series_name(frame, keys):
+    if not keys:
+        return pd.Series("Total", index=frame.index)
+    return frame[list(keys)].astype(str).agg(" / ".join, axis=1)
+
+
+def render_forecast(ctx):
+    st.subheader("🔮 Revenue Forecast (Holt-Winters)")
+    col1, col2, col3 = st.columns(3)
+    series_by = col1.selectbox("Forecast series", list(FORECAST_SERIES))
+    horizon = col2.slider("Months ahead", 1, 24, 6)
+    folds = col3.slider("Backtest origins", 1, 12, 6)
+    name, keys = FORECAST_SERIES[series_by]
+
+    # Parameters are fitted once per series set and cached; any horizon is projected from them.
+    fitted = ctx.derive(name, ("holt-winters", keys), lambda df: fit_series(_monthly(df), "period", "revenue", keys))
+    forecast = forecast_series(fitted, horizon)
+    forecast["series"] = _series_name(forecast, keys)
+    fitted = fitted.assign(series=_series_name(fitted, keys))  # the cached frame is shared
+
+    # Largest series first: those are the ones worth charting.
+    ranked = fitted.sort_values("level", ascending=False)["series"].tolist()
+    shown = st.multiselect("Series to chart", ranked, default=ranked[:5])
+    history = _monthly(ctx.load(name))
+    history["series"] = _series_name(history, keys)
+    recent = history[history["period"] > history["period"].max() - 36]
+    actual = recent.pivot_table(index="period", columns="series", values="revenue", aggfunc="sum")
+    projected = forecast.pivot_table(index="period", columns="series", values="forecast")
+    chart = pd.concat([
+        actual.reindex(columns=shown).add_suffix(" (actual)"),
+        projected.reindex(columns=shown).add_suffix(" (forecast)"),
+    ], axis=1) / 10000000
+    chart.index = chart.index.astype(str)
+    st.line_chart(chart)
+    st.caption("Revenue in crores; the last 36 months of actuals, then the forecast.")
+
+    table = projected.T.reindex(ranked) / 10000000
+    table.columns = table.columns.astype(str)
+    st.dataframe(table.round(2), use_container_width=True)
+
+    st.markdown("### 🧪 Rolling-origin Backtest")
+    backtest = ctx.derive(
+        name, ("holt-winters backtest", keys, horizon, folds),
+        lambda df: backtest_series(_monthly(df), "period", "revenue", keys, horizon=horizon, folds=folds),
+    )
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Median sMAPE (%)", f"{backtest['smape_pct'].median():.2f}")
+    col2.metric("Seasonal-naive sMAPE (%)", f"{backtest['naive_smape_pct'].median():.2f}")
+    col3.metric("Series beating naive", f"{backtest['beats_naive'].mean() * 100:.0f}%")
+    with st.expander("Per-series parameters and backtest errors"):
+        details = fitted[["series"] + PARAMS + ["rmse"]].merge(
+            backtest.assign(series=_series_name(backtest, keys))[["series", "smape_pct", "naive_smape_pct", "beats_naive"]],
+            on="series",
+        )
+        st.dataframe(details, use_container_width=True, hide_index=True)
@@ -0,0 +1,37 @@
+"""
+Question 29: Seasonal Planning Dashboard.
+"""
+import streamlit as st
+
+from pushdown import AggSpec, Measure
+
+SPEC29_SALES = AggSpec(
+    group_keys=("order_month",),
+    measures={"final_amount_inr": Measure("sum", "final_amount_inr", divide_by=10000000)},
+    order_by=(("order_month", True),),
+)
+
+SPEC29_QTY = AggSpec(
+    group_keys=("order_month", "subcategory"),
+    measures={"quantity": Measure("sum", "quantity")},
+)
+
+QUERIES = {
+    "sales": SPEC29_SALES,
+    "qty": SPEC29_QTY,
+}
+
+
+def render(ctx):
+    st.header("29️⃣ Seasonal Planning Dashboard")
+    try:
+        st.subheader("Monthly Sales Trend")
+        monthly_sales = ctx.load("sales").rename(columns={'order_month': 'month'})
+        st.bar_chart(monthly_sales.set_index('month')['final_amount_inr'])
+
+        st.subheader("Monthly Quantity Sold by Subcategory")
+        monthly_qty = ctx.load("qty").rename(columns={'order_month': 'month'})
+        monthly_qty = monthly_qty.pivot(index='month', columns='subcategory', values='quantity').fillna(0)
+        st.line_chart(monthly_qty)
+    except Exception as e:
+        st.warning(f"Failed to load Seasonal Planning Dashboard. Error: {e}")
@@ -0,0 +1,110 @@
+"""
+Question 3: Strategic Overview Dashboard.
+"""
+import streamlit as st
+
+from dashboards import Routed
+from paging import render_paged_table
+
+QUERY3 = """
+WITH brand_revenue AS (
+    SELECT
+        order_year,
+        brand,
+        SUM(final_amount_inr) AS revenue,
+        COUNT(transaction_id) AS total_orders
+    FROM orders
+    WHERE {filters}
+    GROUP BY order_year, brand
+),
+total_revenue_year AS (
+    SELECT
+        order_year,
+        SUM(final_amount_inr) AS total_revenue
+    FROM orders
+    WHERE {filters}
+    GROUP BY order_year
+)
+SELECT
+    br.order_year,
+    br.brand,
+    ROUND(br.revenue / 10000000, 2) AS revenue_in_crores,
+    br.total_orders,
+    ROUND(br.revenue / try.total_revenue * 100, 2) AS market_share_percent
+FROM brand_revenue br
+JOIN total_revenue_year try
+  ON br.order_year = try.order_year
+ORDER BY br.order_year, br.revenue DESC;
+"""
+
+QUERY3_ROLLUP = """
+WITH brand_revenue AS (
+    SELECT
+        order_year,
+        brand,
+        SUM(revenue) AS revenue,
+        CAST(SUM(orders) AS SIGNED) AS total_orders
+    FROM {rollup}
+    WHERE {filters}
+    GROUP BY order_year, brand
+),
+total_revenue_year AS (
+    SELECT
+        order_year,
+        SUM(revenue) AS total_revenue
+    FROM {rollup}
+    WHERE {filters}
+    GROUP BY order_year
+)
+SELECT
+    br.order_year,
+    br.brand,
+    ROUND(br.revenue / 10000000, 2) AS revenue_in_crores,
+    br.total_orders,
+    ROUND(br.revenue / try.total_revenue * 100, 2) AS market_share_percent
+FROM brand_revenue br
+JOIN total_revenue_year try
+  ON br.order_year = try.order_year
+ORDER BY br.order_year, br.revenue DESC;
+"""
+
+QUERIES = {
+    "query3": Routed(QUERY3, QUERY3_ROLLUP, ("order_year", "brand")),
+}
+
+
+def render(ctx):
+    st.header("3️⃣ Strategic Overview Dashboard")
+    try:
+        df3 = ctx.load("query3")
+
+        # Show data
+        st.subheader("📊 Market Share & Brand Positioning")
+        render_paged_table(
+            ctx, "query3", keys=("order_year", "brand"),
+            sort_columns=("order_year", "brand", "revenue_in_crores", "total_orders", "market_share_percent"),
+            search_columns=("brand",),
+        )
+
+        # KPI-style snapshot for latest year
+        latest_year = df3["order_year"].max()
+        latest_data = df3[df3["order_year"] == latest_year]
+
+        st.markdown(f"### Latest Year ({latest_year}) Competitive Positioning")
+        col1, col2, col3 = st.columns(3)
+        top_brand = latest_data.iloc[0]
+        col1.metric("🏆 Top Brand", f"{top_brand['brand']}", f"{top_brand['market_share_percent']}%")
+        col2.metric("💰 Revenue (₹ Cr)", f"{top_brand['revenue_in_crores']:.2f}")
+        col3.metric("📦 Orders", f"{top_brand['total_orders']:,}")
+
+        # Market Share Trend Chart
+        st.subheader("📈 Market Share Trends by Brand")
+        pivot_df = df3.pivot(index="order_year", columns="brand", values="market_share_percent").fillna(0)
+        st.line_chart(pivot_df)
+
+        # Revenue Competitive Matrix (latest year)
+        st.subheader("🏢 Competitive Positioning Matrix (Revenue vs Market Share)")
+        st.scatter_chart(latest_data, x="revenue_in_crores", y="market_share_percent", size="total_orders", color="brand")
+
+    except Exception as e:
+        st.warning(f"Failed to load Strategic Overview Dashboard. Error: {e}")
@@ -0,0 +1,112 @@
+"""
+Question 25: Supply Chain Dashboard.
+"""
+import plotly.express as px
+import streamlit as st
+
+from scheduler import run_sections
+
+QUERY_SUPPLIER_SUMMARY = """
+SELECT
+    brand AS supplier,
+    COUNT(*) AS total_orders,
+    SUM(quantity) AS total_units_supplied,
+    ROUND(SUM(final_amount_inr), 2) AS total_revenue,
+    ROUND(AVG(delivery_days), 2) AS avg_delivery_days,
+    ROUND(SUM(CASE WHEN delivery_days > 7 THEN 1 ELSE 0 END) / COUNT(*) * 100, 2) AS late_delivery_pct,
+    ROUND(SUM(CASE WHEN return_status = 'Returned' THEN 1 ELSE 0 END) / COUNT(*) * 100, 2) AS return_rate_pct,
+    ROUND(AVG(customer_rating), 2) AS avg_customer_rating
+FROM orders
+WHERE {filters}
+GROUP BY brand
+HAVING total_orders > 50
+ORDER BY late_delivery_pct ASC, return_rate_pct ASC;
+"""
+
+QUERY_REVENUE_SUPPLIER = """
+SELECT
+    brand AS supplier,
+    COUNT(*) AS total_orders,
+    SUM(quantity) AS total_units_supplied,
+    ROUND(SUM(final_amount_inr), 2) AS total_revenue,
+    ROUND(AVG(final_amount_inr), 2) AS avg_order_value
+FROM orders
+WHERE {filters}
+GROUP BY brand
+ORDER BY total_revenue DESC;
+"""
+
+QUERY_DELIVERY_TRENDS = """
+SELECT
+    YEAR(order_date) AS year,
+    MONTH(order_date) AS month,
+    brand AS supplier,
+    COUNT(*) AS total_orders,
+    ROUND(AVG(delivery_days), 2) AS avg_delivery_days,
+    ROUND(SUM(CASE WHEN delivery_days > 7 THEN 1 ELSE 0 END) / COUNT(*) * 100, 2) AS late_delivery_pct
+FROM orders
+WHERE {filters}
+GROUP BY YEAR(order_date), MONTH(order_date), brand
+ORDER BY year, month, supplier;
+"""
+
+QUERIES = {
+    "supplier_summary": QUERY_SUPPLIER_SUMMARY,
+    "revenue_supplier": QUERY_REVENUE_SUPPLIER,
+    "delivery_trends": QUERY_DELIVERY_TRENDS,
+}
+
+
+def render(ctx):
+    st.header("2️⃣5️⃣ Supply Chain Dashboard")
+    try:
+        # -----------------------------
+        # Part 1: Supplier Performance Summary
+        # -----------------------------
+        def render_supplier_summary(df_supplier_summary):
+            st.subheader("📊 Supplier Performance Summary")
+            st.dataframe(df_supplier_summary, use_container_width=True)
+
+            # KPI snapshot for top supplier
+            top_supplier = df_supplier_summary.iloc[0]
+            st.markdown(f"### 🔹 Top Supplier: {top_supplier['supplier']}")
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Total Orders", f"{top_supplier['total_orders']:,}")
+            col2.metric("Total Units Supplied", f"{top_supplier['total_units_supplied']:,}")
+            col3.metric("Avg Delivery Days", f"{top_supplier['avg_delivery_days']:.1f}")
+            col4.metric("Return Rate (%)", f"{top_supplier['return_rate_pct']:.2f}%")
+
+        # -----------------------------
+        # Part 2: Revenue Contribution per Supplier
+        # -----------------------------
+        def render_revenue_supplier(df_revenue_supplier):
+            st.subheader("💰 Revenue Contribution per Supplier")
+            st.dataframe(df_revenue_supplier, use_container_width=True)
+
+            # Revenue pie chart
+            st.markdown("### 🔹 Revenue Share by Supplier")
+            st.plotly_chart(
+                px.pie(df_revenue_supplier.head(10), names="supplier", values="total_revenue", title="Top 10 Suppliers by Revenue")
+            )
+
+        # -----------------------------
+        # Part 3: Monthly Delivery Reliability Trends
+        # -----------------------------
+        def render_delivery_trends(df_delivery_trends):
+            st.subheader("📈 Monthly Delivery Reliability Trends")
+            # Pivot for visualization
+            df_delivery_pivot = df_delivery_trends.pivot_table(
+                index=["year","month"], columns="supplier", values="late_delivery_pct", fill_value=0
+            ).reset_index()
+            df_delivery_pivot["year_month"] = df_delivery_pivot["year"].astype(str) + "-" + df_delivery_pivot["month"].astype(str)
+            st.line_chart(df_delivery_pivot.set_index("year_month").drop(columns=["year","month"]))
+
+        # Independent queries run concurrently; each section renders as soon as its data arrives
+        run_sections([
+            (lambda: ctx.load("supplier_summary"), render_supplier_summary),
+            (lambda: ctx.load("revenue_supplier"), render_revenue_supplier),
+            (lambda: ctx.load("delivery_trends"), render_delivery_trends),
+        ], error_label="Supply Chain section")
+
+    except Exception as e:
+        st.warning(f"Failed to load Supply Chain Dashboard. Error: {e}")
@@ -0,0 +1,604 @@
+"""
+Data access helpers used by the dashboards.
+
+All queries go through ``run_query`` so every dashboard borrows its
+connection from the one process-wide pool instead of opening its own,
+and repeated queries are answered from the shared result cache.
+
+With ``AMAZON_DATA_SOURCE=parquet`` the raw-row dashboards read the Parquet
+extract written by ``extract.py`` instead of MySQL.
+"""
+import os
+import time
+from datetime import date
+
+import pandas as pd
+import pymysql
+import streamlit as st
+
+from db_pool import DB_CONFIG, ConnectionPool
+from cohorts import CohortStore
+from customer_summary import state_query
+from extract import extract_available, extract_version, read_orders
+from filters import MIN_DATE, PLACEHOLDER, Filters
+from incremental import WatermarkStore
+from prefetch import Prefetcher, prefetch_targets
+from pushdown import (
+    aggregate_chunks, aggregate_frame, compare_results, pushdown_sql, raw_sql, rollup_result, rollup_sql, unrounded,
+)
+from query_cache import QueryCache, cache_key, frame_nbytes
+from rollups import RollupRouter, catalog_query
+from sketches import fill_estimates, merge_estimates, sketch_catalog_query, sketch_router, sketch_sql
+from schema import SchemaReport, current_dashboard, typed_frame
+from snapshot import SNAPSHOT_COLUMNS, SNAPSHOT_WHERE, OrdersSnapshot
+from timing import label, record, span
+
+# The orders table is reloaded a few times a day at most.
+CACHE_TTL_SECONDS = 6 * 60 * 60
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Rows per chunk when streaming raw rows with a server-side cursor.
+STREAM_CHUNK_ROWS = 50_000
+
+# "mysql" (default) or "parquet"
+DATA_SOURCE = os.environ.get("AMAZON_DATA_SOURCE", "mysql").lower()
+
+
+def parquet_mode():
+    return DATA_SOURCE == "parquet"
+
+
+@st.cache_resource(show_spinner=False)
+def get_pool():
+    """Process-wide connection pool, shared by every session and rerun."""
+    return ConnectionPool(max_size=8, min_size=1, idle_timeout=300, checkout_timeout=10, **DB_CONFIG)
+
+
+@st.cache_resource(show_spinner=False)
+def get_cache():
+    """Process-wide query result cache, shared by every session and rerun."""
+    return QueryCache(max_bytes=CACHE_MAX_BYTES, default_ttl=CACHE_TTL_SECONDS)
+
+
+@st.cache_resource(show_spinner=False)
+def get_prefetcher():
+    """Process-wide log of each dashboard's cached loads, replayed to warm the cache."""
+    return Prefetcher(get_cache())
+
+
+def _cached(sql, params, loader, ttl=None):
+    """Load through the result cache, recording the load for the current dashboard's prefetch."""
+    get_prefetcher().record(current_dashboard.get(), sql, params, loader, ttl)
+    loaded = []
+
+    def load():
+        loaded.append(True)
+        return loader()
+
+    start = time.perf_counter()
+    df = get_cache().get_or_load(sql, params, load, ttl)
+    if not loaded:
+        record("cache", f"hit: {label(sql)}", start, time.perf_counter() - start, len(df))
+    return df
+
+
+def fetch_query(sql, params=None):
+    """Run ``sql`` on a pooled connection, bypassing the result cache.
+
+    Execution, transfer and decode are timed separately: an unbuffered cursor
+    returns from ``execute`` once the server starts sending rows.
+    """
+    with get_pool().connection() as conn:
+        cur = conn.cursor(pymysql.cursors.SSCursor)
+        try:
+            with span("sql", label(sql)):
+                cur.execute(sql, params)
+            columns = [d[0] for d in cur.description]
+            with span("fetch", label(sql)) as info:
+                rows = cur.fetchall()
+                info["rows"] = len(rows)
+        finally:
+            cur.close()
+    with span("decode", label(sql)) as info:
+        df = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+        info.update(rows=len(df), bytes=frame_nbytes(df))
+    return df
+
+
+@st.cache_resource(show_spinner=False)
+def get_schema_report():
+    """Per-dashboard tally of the memory the declared orders schema saves."""
+    return SchemaReport()
+
+
+def stream_query(sql, params=None, chunk_rows=STREAM_CHUNK_ROWS):
+    """Yield the result of ``sql`` as DataFrames of at most ``chunk_rows`` rows.
+
+    Chunks are raw order rows, so the declared orders schema is applied to
+    each one. Uses an unbuffered server-side cursor, so only one chunk is held
+    client-side at a time. The pooled connection is busy until the generator
+    is exhausted; a generator abandoned early gives up its connection rather
+    than draining the rest of the result.
+    """
+    pool = get_pool()
+    conn = pool.acquire()
+    finished = False
+    cur = conn.cursor(pymysql.cursors.SSCursor)
+    # Chunk-level time is summed into one fetch and one decode span for the whole stream.
+    started = time.perf_counter()
+    fetch_s = decode_s = 0.0
+    total_rows = total_bytes = 0
+    try:
+        with span("sql", label(sql)):
+            cur.execute(sql, params)
+        columns = [d[0] for d in cur.description]
+        while True:
+            start = time.perf_counter()
+            rows = cur.fetchmany(chunk_rows)
+            fetch_s += time.perf_counter() - start
+            if not rows:
+                break
+            start = time.perf_counter()
+            chunk = typed_frame(pd.DataFrame.from_records(rows, columns=columns, coerce_float=True), get_schema_report())
+            decode_s += time.perf_counter() - start
+            total_rows += len(chunk)
+            total_bytes += frame_nbytes(chunk)
+            yield chunk
+        finished = True
+        cur.close()
+        record("fetch", f"{label(sql)} (streamed)", started, fetch_s, total_rows)
+        record("decode", f"{label(sql)} (streamed)", started, decode_s, total_rows, total_bytes)
+    finally:
+        # Closing an unfinished SSCursor would read the rest of the result; drop the connection instead.
+        pool.release(conn, discard=not finished)
+
+
+def run_query(sql, params=None, ttl=None):
+    """Return the result of ``sql`` as a DataFrame, from the cache when possible.
+
+    ``ttl`` overrides the cache lifetime in seconds; pass 0 to always hit the database.
+    """
+    return _cached(sql, params, lambda: fetch_query(sql, params), ttl)
+
+
+@st.cache_resource(ttl=600, show_spinner=False)
+def get_router():
+    """Rollup router built from the catalog written by ``python rollups.py build``."""
+    try:
+        return RollupRouter.from_frame(fetch_query(catalog_query()))
+    except Exception:
+        # Rollups not built yet: every dashboard reads raw orders.
+        return RollupRouter({})
+
+
+def routed_query(raw_sql, rollup_sql, dims, filters=None, ttl=None):
+    """Answer a dashboard query from the smallest rollup covering ``dims`` and the filtered columns.
+
+    ``rollup_sql`` is the same query written against the rollup measures with
+    a ``{rollup}`` placeholder for the table; ``raw_sql`` is used when no
+    rollup covers the requested dimensions. Both take a ``{filters}`` placeholder.
+    """
+    filters = filters or Filters()
+    table = get_router().route(*dims, *filters.rollup_dims())
+    if table is None:
+        return run_query(*filters.format_sql(raw_sql), ttl)
+    return run_query(*filters.format_sql(rollup_sql, rollup=table), ttl)
+
+
+@st.cache_resource(ttl=600, show_spinner=False)
+def get_sketch_router():
+    """Router over the distinct-count sketch tables built with the rollups."""
+    try:
+        return sketch_router(fetch_query(sketch_catalog_query()))
+    except Exception:
+        # Sketches not built yet: distinct counts are exact.
+        return RollupRouter({})
+
+
+def sketch_distinct(column, keys, filters=None, match=None, ttl=None):
+    """Estimated distinct ``column`` values per ``keys`` group, merged from the sketches.
+
+    ``match`` pins rollup key columns to a value (e.g. ``{"is_festival_sale": 1}``).
+    Returns the keys plus ``estimate``, or None when no sketch table covers them.
+    """
+    filters = filters or Filters()
+    match = match or {}
+    table = get_sketch_router().route(*keys, *match, *filters.rollup_dims())
+    if table is None:
+        return None
+    sql, params = filters.format_sql(sketch_sql(keys, match), rollup=table)
+    params.update({f"match_{column}": value for column, value in match.items()}, sketch_column=column)
+    return _cached(
+        sql, ("sketch", sorted(params.items())),
+        lambda: _merge_span(lambda: merge_estimates(fetch_query(sql, params), list(keys))), ttl,
+    )
+
+
+def sketched_query(exact_sql, rollup_sql, dims, distinct, keys=None, match=None, filters=None, ttl=None):
+    """Answer a query with distinct counts from a rollup plus merged HyperLogLog sketches.
+
+    ``rollup_sql`` reads ``{rollup}`` (covering ``dims``) and returns each
+    ``distinct`` output column as a NULL placeholder; ``distinct`` maps it to
+    the column counted, ``keys`` maps result columns to the rollup keys the
+    counts are grouped by. ``exact_sql`` runs when no rollup or sketch table
+    covers the query. Estimates are within about ±1.6% (see ``sketches``).
+    """
+    filters = filters or Filters()
+    df = _sketched(rollup_sql, dims, distinct, keys or {}, match, filters, ttl)
+    return run_query(*filters.format_sql(exact_sql), ttl) if df is None else df
+
+
+def _sketched(rollup_sql, dims, distinct, keys, match, filters, ttl=None):
+    """The rollup result with its distinct counts filled in, or None when a rollup or sketch table is missing."""
+    table = get_router().route(*dims, *keys.values(), *(match or {}), *filters.rollup_dims())
+    if table is None:
+        return None
+    estimates = {}
+    for name, column in distinct.items():
+        estimates[name] = sketch_distinct(column, list(keys.values()), filters, match, ttl)
+        if estimates[name] is None:
+            return None
+    return fill_estimates(run_query(*filters.format_sql(rollup_sql, rollup=table), ttl), estimates, keys)
+
+
+@st.cache_resource(ttl=600, show_spinner=False)
+def get_customer_summary():
+    """State of the ``customer_summary`` table (watermark, rows), or None when it isn't built."""
+    try:
+        state = fetch_query(state_query())
+    except Exception:
+        return None
+    return None if state.empty else state.iloc[0].to_dict()
+
+
+def summary_available(filters=None):
+    """True when ``customer_summary`` can stand in for grouping orders by customer.
+
+    It covers the default filter's rows only, so any narrower filter reads orders.
+    """
+    return (filters is None or filters == Filters()) and get_customer_summary() is not None
+
+
+@st.cache_resource(show_spinner=False)
+def get_watermark_store():
+    """Process-wide monthly aggregates refreshed from their high-water marks."""
+    return WatermarkStore()
+
+
+def incremental_query(sql, filters=None):
+    """Monthly aggregate ``sql`` kept current by re-aggregating only from its watermark month.
+
+    ``sql`` takes the ``{filters}`` placeholder plus an ``order_date >= %(since)s``
+    bound, and returns ``order_year``, ``order_month`` and ``MAX(order_date) AS watermark``
+    with additive or per-month measures (see ``incremental``).
+    """
+    filters = filters or Filters()
+    sql, params = filters.format_sql(sql)
+    return get_watermark_store().get(
+        cache_key(sql, params), lambda since: fetch_query(sql, {**params, "since": since or filters.start_date})
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_cohort_store():
+    """Process-wide cohort matrices, one per activity query, updated from its newest months."""
+    return CohortStore()
+
+
+def cohort_query(sql, filters=None):
+    """Acquisition-cohort retention and revenue (long form) from the monthly customer activity ``sql``.
+
+    ``sql`` is an incremental query (see ``incremental_query``) with one row
+    per customer and month: ``customer_id``, the month keys, ``revenue`` and
+    ``watermark``. Only the months it refreshed are re-counted (see ``cohorts``).
+    """
+    filters = filters or Filters()
+    activity = incremental_query(sql, filters)
+    with span("pandas", "cohort matrices") as info:
+        df = get_cohort_store().get(cache_key(*filters.format_sql(sql)), activity)
+        info.update(rows=len(df), bytes=frame_nbytes(df))
+    return df
+
+
+@st.cache_resource(show_spinner=False)
+def get_snapshot():
+    """Process-wide columnar snapshot of orders; picks up a snapshot file from a previous run."""
+    snapshot = OrdersSnapshot()
+    snapshot.load_latest()
+    return snapshot
+
+
+def _snapshot_frames():
+    if parquet_mode() and extract_available():
+        yield typed_frame(read_orders(SNAPSHOT_COLUMNS).to_pandas(), get_schema_report())
+        return
+    yield from stream_query(f"SELECT {', '.join(SNAPSHOT_COLUMNS)} FROM orders WHERE {SNAPSHOT_WHERE}")
+
+
+def refresh_snapshot():
+    """Rebuild the orders snapshot from MySQL and atomically swap in the new generation."""
+    return get_snapshot().refresh(_snapshot_frames())
+
+
+def run_aggregate(spec, verify=False, ttl=None, use_snapshot=False, filters=None, exact=False):
+    """Return the aggregated result of ``spec``, computed by MySQL when possible.
+
+    With ``use_snapshot`` the spec is aggregated from the shared orders snapshot
+    instead, when it covers the spec's rows and columns. Unless ``exact`` (or
+    ``verify``) is set, specs the rollups can answer read them, with distinct
+    counts estimated from the sketches. Falls back to fetching
+    the raw rows and aggregating them with pandas if the pushed-down query
+    fails. With ``verify``, both paths run and any mismatch is reported on the page.
+    ``filters`` (default: none) restrict the rows on every path.
+    """
+    filters = filters or Filters()
+    # The snapshot and the extract hold the rows the default filter selects; narrower filters are applied on read.
+    in_scope = spec.where == PLACEHOLDER and filters.start_date >= MIN_DATE
+    if use_snapshot:
+        snapshot = get_snapshot()
+        if in_scope and snapshot.covers(spec.raw_columns() + filters.columns()):
+            return _cached(
+                "snapshot", ("snapshot", snapshot.generation, repr(spec), repr(filters)),
+                lambda: _aggregate_span(lambda: aggregate_frame(_snapshot_view(snapshot, spec, filters), spec)), ttl,
+            )
+
+    if not (exact or verify):
+        df = _sketched_aggregate(spec, filters, ttl)
+        if df is not None:
+            return df
+
+    if parquet_mode() and in_scope and extract_available():
+        # Partition pruning on order_year, row-group pruning on the filters and column projection.
+        return _cached(
+            "parquet", ("parquet", extract_version(), repr(spec), repr(filters)),
+            lambda: _aggregate_span(
+                lambda: aggregate_frame(
+                    typed_frame(read_orders(spec.raw_columns(), filter=filters.expression()).to_pandas(),
+                                get_schema_report()),
+                    spec,
+                )
+            ), ttl,
+        )
+
+    try:
+        df = run_query(*filters.format_sql(pushdown_sql(spec)), ttl)
+    except Exception as e:
+        st.info(f"Aggregation pushdown failed, aggregating in pandas instead ({e}).")
+        return _run_pandas_aggregate(spec, filters, ttl)
+
+    if verify:
+        check = unrounded(spec)
+        mismatch = compare_results(
+            run_query(*filters.format_sql(pushdown_sql(check)), ttl), _run_pandas_aggregate(check, filters, ttl), check
+        )
+        if mismatch:
+            st.warning(f"Pushdown result differs from the pandas path: {mismatch}")
+        else:
+            st.caption("✅ Pushdown result verified against the pandas path.")
+    return df
+
+
+def _snapshot_view(snapshot, spec, filters):
+    """The snapshot rows ``filters`` select, in ``spec``'s columns: zero-copy at the snapshot's own scope."""
+    if filters == Filters():
+        return snapshot.view(spec.raw_columns())[1]
+    columns = list(dict.fromkeys(spec.raw_columns() + filters.columns()))
+    return snapshot.view(columns, filters.expression())[1]
+
+
+def _sketched_aggregate(spec, filters, ttl=None):
+    """``spec`` from the rollups plus merged sketches, or None when they can't answer it."""
+    sql = rollup_sql(spec)
+    distinct = {name: m.column for name, m in spec.measures.items() if m.func == "nunique"}
+    if sql is None or not distinct:
+        # Specs without distinct counts keep their existing paths.
+        return None
+    df = _sketched(sql, (), distinct, {key: key for key in spec.group_keys}, None, filters, ttl)
+    return None if df is None else rollup_result(df, spec)
+
+
+def _run_pandas_aggregate(spec, filters, ttl=None):
+    raw, params = filters.format_sql(raw_sql(spec))
+    return _cached(
+        raw, ("pandas", repr(spec), sorted(params.items())),
+        lambda: _aggregate_span(lambda: aggregate_chunks(stream_query(raw, params), spec)), ttl,
+    )
+
+
+def derived_frame(sql, params, key, compute, ttl=None):
+    """``compute()`` cached alongside the result of ``(sql, params)``, once per extra ``key``.
+
+    For frames a dashboard computes from its query results (e.g. scored per
+    reference date). Not replayed by the prefetcher.
+    """
+    def load():
+        with span("pandas", f"derive {label(sql)}") as info:
+            df = compute()
+            info.update(rows=len(df), bytes=frame_nbytes(df))
+        return df
+
+    return get_cache().get_or_load(sql, ("derived", sorted(params.items()), repr(key)), load, ttl)
+
+
+def _merge_span(merge):
+    with span("pandas", "merge sketches") as info:
+        df = merge()
+        info.update(rows=len(df), bytes=frame_nbytes(df))
+    return df
+
+
+def _aggregate_span(aggregate):
+    with span("pandas", "aggregate") as info:
+        df = aggregate()
+        info.update(rows=len(df), bytes=frame_nbytes(df))
+    return df
+
+
+def filter_options(column):
+    """Sorted distinct values of ``column`` for the sidebar filters.
+
+    Read from the smallest rollup keyed by ``column`` (or the extract's single
+    column in Parquet mode) rather than scanning orders.
+    """
+    if parquet_mode() and extract_available():
+        values = _cached(
+            "parquet", ("options", extract_version(), column),
+            lambda: read_orders([column]).column(0).unique().to_pandas().to_frame(column),
+        )[column]
+    else:
+        table = get_router().route(column) or "orders"
+        values = run_query(f"SELECT DISTINCT {column} FROM {table}")[column]
+    return sorted(values.dropna().astype(str))
+
+
+def render_filter_controls(container):
+    """Sidebar filters applied to every dashboard query. Returns a ``Filters``."""
+    today = date.today()
+    with container.expander("🔎 Filters"):
+        picked = st.date_input(
+            "Order date range", value=(MIN_DATE, today), min_value=MIN_DATE, max_value=today,
+            help="Ranges that start and end on month boundaries are answered from the rollups.",
+        )
+        options = {}
+        for field, column, name in [
+            ("states", "customer_state", "State"),
+            ("subcategories", "subcategory", "Subcategory"),
+            ("tiers", "customer_tier", "Customer tier"),
+        ]:
+            try:
+                options[field] = st.multiselect(name, filter_options(column))
+            except Exception as e:
+                st.warning(f"Failed to load {name} options. Error: {e}")
+                options[field] = []
+    # While a range is being picked only its start is set.
+    start, end = (tuple(picked) + (None,))[:2] if isinstance(picked, (tuple, list)) else (picked, None)
+    return Filters(
+        start_date=start or MIN_DATE,
+        end_date=None if end is None or end >= today else end,
+        **{field: tuple(sorted(values)) for field, values in options.items()},
+    )
+
+
+def render_snapshot_controls(container):
+    """Sidebar toggle for serving raw-row dashboards from the shared snapshot.
+
+    Returns True when the snapshot should be used.
+    """
+    snapshot = get_snapshot()
+    use_snapshot = container.checkbox(
+        "📸 Aggregate from shared orders snapshot",
+        help="Dashboards 16-30 aggregate one in-memory Arrow snapshot shared by all sessions instead of querying MySQL.",
+    )
+    with container.expander("📸 Orders Snapshot"):
+        stats = snapshot.stats()
+        if stats["generation"]:
+            built = pd.Timestamp(stats["built_at"], unit="s").strftime("%Y-%m-%d %H:%M")
+            st.caption(
+                f"Generation {stats['generation']} • {stats['rows']:,} rows • "
+                f"{stats['bytes'] / 1024 ** 2:,.1f} MB • built {built}"
+            )
+        else:
+            st.caption("No snapshot built yet.")
+        if st.button("🔄 Rebuild snapshot"):
+            with st.spinner("Building orders snapshot..."):
+                refresh_snapshot()
+            st.rerun()
+    if use_snapshot and not snapshot.is_loaded():
+        with st.spinner("Building orders snapshot..."):
+            refresh_snapshot()
+    return use_snapshot
+
+
+def render_prefetch_controls(container):
+    """Opt-in sidebar toggle for warming likely next dashboards in the background.
+
+    Returns True when prefetching is enabled.
+    """
+    return container.checkbox(
+        "🔮 Prefetch likely next dashboards",
+        help="After this page renders, warm the query cache for the next dashboards in the list "
+             "and your most-visited ones, using spare pooled connections only.",
+    )
+
+
+def prefetch_after(questions, selected, pool=None, declared=None):
+    """Count the visit to ``selected`` and queue prefetch of the dashboards likely to follow it.
+
+    ``declared(dashboard)`` lists the loads of dashboards not visited yet
+    (see ``dashboards.declared_loads``).
+    """
+    visits = st.session_state.setdefault("dashboard_visits", {})
+    if st.session_state.get("last_dashboard") != selected:
+        visits[selected] = visits.get(selected, 0) + 1
+        st.session_state["last_dashboard"] = selected
+    targets = prefetch_targets(questions, selected, visits)
+    get_prefetcher().schedule(targets, pool, declared)
+    return targets
+
+
+def render_schema_report(container):
+    """Show how much memory the typed orders schema saved per dashboard."""
+    report = get_schema_report().frame()
+    with container.expander("🧬 Typed Schema Savings"):
+        if report.empty:
+            st.caption("No raw order rows loaded yet.")
+            return
+        total_raw, total_typed = report["raw_bytes"].sum(), report["typed_bytes"].sum()
+        st.metric("Saved (MB)", f"{(total_raw - total_typed) / 1024 ** 2:,.1f}",
+                  f"{(1 - total_typed / total_raw) * 100:.1f}% less" if total_raw else None)
+        report["raw_mb"] = (report["raw_bytes"] / 1024 ** 2).round(2)
+        report["typed_mb"] = (report["typed_bytes"] / 1024 ** 2).round(2)
+        st.dataframe(
+            report[["dashboard", "loads", "rows", "raw_mb", "typed_mb", "saved_pct"]].round({"saved_pct": 1}),
+            hide_index=True, use_container_width=True,
+        )
+
+
+def render_pool_metrics(container):
+    """Show pool utilisation and checkout wait times in ``container``."""
+    stats = get_pool().stats()
+    with container.expander("🔌 Connection Pool"):
+        col1, col2 = st.columns(2)
+        col1.metric("In Use / Size", f"{stats['in_use']} / {stats['size']}")
+        col2.metric("Idle", f"{stats['idle']}")
+        col1.metric("Avg Wait (ms)", f"{stats['avg_wait_ms']:.1f}")
+        col2.metric("p95 Wait (ms)", f"{stats['p95_wait_ms']:.1f}")
+        st.caption(
+            f"Checkouts: {stats['checkouts']:,} • Timeouts: {stats['timeouts']:,} • "
+            f"Max wait: {stats['max_wait_ms']:.1f} ms • Created: {stats['created']:,} • "
+            f"Closed: {stats['closed']:,} • Failed pings: {stats['failed_pings']:,}"
+        )
+
+
+def render_prefetch_metrics(container, targets):
+    """Show what the prefetcher warmed, skipped and is still loading."""
+    stats = get_prefetcher().stats()
+    with container.expander("🔮 Prefetch"):
+        col1, col2 = st.columns(2)
+        col1.metric("Warmed", f"{stats['warmed']:,}")
+        col2.metric("Pending", f"{stats['pending']:,}")
+        st.caption(
+            f"Scheduled: {stats['scheduled']:,} • Already cached: {stats['skipped_cached']:,} • "
+            f"Skipped (pool busy): {stats['skipped_busy']:,} • Failed: {stats['failed']:,}"
+        )
+        if targets:
+            st.caption("Warming: " + ", ".join(targets))
+
+
+def render_cache_metrics(container):
+    """Show query cache hit rate and memory use in ``container``, with a button to clear it."""
+    cache = get_cache()
+    stats = cache.stats()
+    with container.expander("⚡ Query Cache"):
+        col1, col2 = st.columns(2)
+        col1.metric("Hit Rate", f"{stats['hit_rate'] * 100:.1f}%")
+        col2.metric("Entries", f"{stats['entries']:,}")
+        col1.metric("Memory (MB)", f"{stats['bytes'] / 1024 ** 2:,.1f}")
+        col2.metric("Budget (MB)", f"{stats['max_bytes'] / 1024 ** 2:,.0f}")
+        st.caption(
+            f"Hits: {stats['hits']:,} • Misses: {stats['misses']:,} • "
+            f"Expired: {stats['expired']:,} • Evicted: {stats['evictions']:,}"
+        )
+        if st.button("🔄 Clear cached results"):
+            cache.clear()
+            st.rerun()
@@ -0,0 +1,218 @@
+"""
+Bounded, thread-safe pool of pymysql connections shared by every dashboard.
+
+Connections are created lazily up to ``max_size``, pinged before reuse when
+they have been idle for a while, closed once they sit idle past
+``idle_timeout`` and handed out with a per-checkout timeout so a burst of
+sessions queues up instead of exhausting the MySQL server.
+"""
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import pymysql
+
+# -----------------------------
+# Connection settings
+# -----------------------------
+# Overridable so tools like benchmark.py can point the app at a stand-in database.
+DB_CONFIG = {
+    "host": os.environ.get("AMAZON_DB_HOST", "127.0.0.1"),
+    "user": os.environ.get("AMAZON_DB_USER", "amazon_user"),
+    "password": os.environ.get("AMAZON_DB_PASSWORD", "Amazon!Pass#123"),
+    "database": os.environ.get("AMAZON_DB_NAME", "amazon_db"),
+    "port": int(os.environ.get("AMAZON_DB_PORT", 3306)),
+    # Pooled connections outlive a single query, so autocommit keeps InnoDB
+    # from pinning one REPEATABLE READ snapshot for the connection's lifetime.
+    "autocommit": True,
+}
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection could be checked out within the timeout."""
+
+
+class ConnectionPool:
+    def __init__(self, max_size=8, min_size=1, idle_timeout=300, checkout_timeout=10,
+                 ping_interval=30, **connect_kwargs):
+        self.max_size = max_size
+        self.min_size = min_size
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self.ping_interval = ping_interval
+        self.connect_kwargs = connect_kwargs or dict(DB_CONFIG)
+
+        self._cond = threading.Condition()
+        self._idle = []  # stack of (conn, last_used); most recently used on top
+        self._size = 0
+        self._closed = False
+
+        # Metrics
+        self._waits = deque(maxlen=1000)
+        self._counters = {
+            "checkouts": 0, "timeouts": 0, "created": 0, "closed": 0,
+            "pings": 0, "failed_pings": 0, "total_wait_s": 0.0, "max_wait_s": 0.0,
+        }
+
+        for _ in range(min_size):
+            self.release(self.acquire())
+
+    # -----------------------------
+    # Checkout / return
+    # -----------------------------
+    def acquire(self, timeout=None):
+        timeout = self.checkout_timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        conn, last_used = None, None
+        stale = []
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+                stale.extend(self._reap_locked())
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counters["timeouts"] += 1
+                    raise PoolTimeout(f"No database connection available after {timeout:.1f}s "
+                                      f"(pool size {self.max_size})")
+                self._cond.wait(remaining)
+
+            wait = time.monotonic() - start
+            self._waits.append(wait)
+            self._counters["checkouts"] += 1
+            self._counters["total_wait_s"] += wait
+            self._counters["max_wait_s"] = max(self._counters["max_wait_s"], wait)
+
+        self._close_all(stale)
+
+        if conn is not None and time.monotonic() - last_used >= self.ping_interval:
+            conn = self._health_check(conn)
+        if conn is None:
+            conn = self._new_connection()
+        return conn
+
+    def release(self, conn, discard=False):
+        stale = []
+        with self._cond:
+            if discard or self._closed:
+                self._size -= 1
+                stale.append(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+            stale.extend(self._reap_locked())
+            self._cond.notify()
+        self._close_all(stale)
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """Borrow a connection for the duration of a ``with`` block."""
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        except (pymysql.err.OperationalError, pymysql.err.InterfaceError):
+            # The socket is in an unknown state; never hand it out again.
+            self.release(conn, discard=True)
+            raise
+        except BaseException:
+            self.release(conn)
+            raise
+        else:
+            self.release(conn)
+
+    # -----------------------------
+    # Maintenance
+    # -----------------------------
+    def reap(self):
+        """Close connections that have been idle longer than ``idle_timeout``."""
+        with self._cond:
+            stale = self._reap_locked()
+        self._close_all(stale)
+        return len(stale)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            stale = [conn for conn, _ in self._idle]
+            self._size -= len(stale)
+            self._idle = []
+            self._cond.notify_all()
+        self._close_all(stale)
+
+    def stats(self):
+        with self._cond:
+            waits = sorted(self._waits)
+            stats = dict(self._counters)
+            stats.update(
+                size=self._size,
+                idle=len(self._idle),
+                in_use=self._size - len(self._idle),
+                max_size=self.max_size,
+            )
+        stats["avg_wait_ms"] = stats["total_wait_s"] / stats["checkouts"] * 1000 if stats["checkouts"] else 0.0
+        stats["p95_wait_ms"] = waits[int(0.95 * (len(waits) - 1))] * 1000 if waits else 0.0
+        stats["max_wait_ms"] = stats.pop("max_wait_s") * 1000
+        stats.pop("total_wait_s")
+        return stats
+
+    # -----------------------------
+    # Internals
+    # -----------------------------
+    def _new_connection(self):
+        try:
+            conn = pymysql.connect(**self.connect_kwargs)
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._counters["created"] += 1
+        return conn
+
+    def _health_check(self, conn):
+        """Ping a reused connection; return None if it has to be replaced."""
+        try:
+            conn.ping(reconnect=False)
+            with self._cond:
+                self._counters["pings"] += 1
+            return conn
+        except Exception:
+            with self._cond:
+                self._counters["pings"] += 1
+                self._counters["failed_pings"] += 1
+            self._close_all([conn])
+            return None
+
+    def _reap_locked(self):
+        now = time.monotonic()
+        keep, stale = [], []
+        # Oldest entries sit at the bottom of the stack.
+        for conn, last_used in self._idle:
+            surplus = self._size - len(stale) > self.min_size
+            if surplus and now - last_used > self.idle_timeout:
+                stale.append(conn)
+            else:
+                keep.append((conn, last_used))
+        self._idle = keep
+        self._size -= len(stale)
+        return stale
+
+    def _close_all(self, conns):
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        if conns:
+            with self._cond:
+                self._counters["closed"] += len(conns)
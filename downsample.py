@@ -0,0 +1,93 @@
+"""
+Chart-data downsampling before series reach the browser.
+
+Streamlit sends every point of a chart to the browser, so a series with one
+point per customer, day or price freezes the page. ``downsample`` cuts a
+series (or each column of a frame) to ``POINT_BUDGET`` points while keeping
+its visual shape:
+
+* ``"lttb"`` (Largest-Triangle-Three-Buckets) keeps, per bucket, the point
+  forming the largest triangle with the previous pick and the next bucket's
+  mean — good for trends;
+* ``"minmax"`` keeps each bucket's lowest and highest point — good for
+  noisy series where spikes matter.
+
+The first and last points are always kept. Series at or under the budget
+are returned unchanged. The x axis is the index: numeric and datetime
+indexes are used as values, anything else (e.g. customer ids) by position.
+Set ``AMAZON_CHART_POINTS`` to change the budget.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from timing import span
+
+POINT_BUDGET = int(os.environ.get("AMAZON_CHART_POINTS", 2000))
+
+
+def lttb_indices(x, y, threshold):
+    """Positions of the ``threshold`` points Largest-Triangle-Three-Buckets keeps."""
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    y = np.nan_to_num(y)
+    # threshold - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_indices(y, threshold):
+    """Positions of each bucket's minimum and maximum, about ``threshold`` points in all."""
+    n = len(y)
+    if threshold >= n or threshold < 4:
+        return np.arange(n)
+    y = np.nan_to_num(y)
+    edges = np.linspace(1, n - 1, threshold // 2).astype(np.int64)
+    picks = [0, n - 1]
+    for start, end in zip(edges[:-1], edges[1:]):
+        bucket = y[start:end]
+        picks += [start + int(np.argmin(bucket)), start + int(np.argmax(bucket))]
+    return np.unique(picks)
+
+
+def _x_values(index):
+    if pd.api.types.is_datetime64_any_dtype(index):
+        return index.asi8.astype(np.float64)
+    if pd.api.types.is_numeric_dtype(index):
+        return index.to_numpy(dtype=np.float64)
+    return np.arange(len(index), dtype=np.float64)
+
+
+def downsample(data, budget=None, method="lttb"):
+    """``data`` (a Series, or a frame of series sharing its index) cut to about ``budget`` points.
+
+    Each column of a frame gets an equal share of the budget; the rows kept
+    are the union of every column's picks, so all lines keep their shape.
+    """
+    budget = budget or POINT_BUDGET
+    if len(data) <= budget:
+        return data
+    with span("pandas", f"downsample ({method})") as info:
+        columns = [data] if isinstance(data, pd.Series) else [data[column] for column in data.columns]
+        share = max(budget // len(columns), 4)
+        x = _x_values(data.index)
+        picks = [
+            lttb_indices(x, column.to_numpy(dtype=np.float64), share) if method == "lttb"
+            else minmax_indices(column.to_numpy(dtype=np.float64), share)
+            for column in columns
+        ]
+        data = data.iloc[np.unique(np.concatenate(picks))]
+        info["rows"] = len(data)
+    return data
@@ -0,0 +1,163 @@
+"""
+Year-partitioned Parquet extract of ``amazon_db.orders``.
+
+Writes one hive-style partition per ``order_year`` with dictionary-encoded
+string columns, zstd compression and row-group statistics, so readers can
+prune partitions for ``order_year > 2020`` and project only the columns a
+dashboard needs. The app serves the raw-row dashboards from this extract
+when started with ``AMAZON_DATA_SOURCE=parquet``.
+
+Usage::
+
+    python extract.py [--output data/orders_parquet] [--row-group-size 131072]
+"""
+import argparse
+import os
+import shutil
+import time
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pymysql
+
+from db_pool import DB_CONFIG
+
+PARQUET_DIR = os.environ.get("AMAZON_PARQUET_DIR", os.path.join("data", "orders_parquet"))
+PARTITION_COLUMN = "order_year"
+
+# MySQL DATA_TYPE -> Arrow type
+MYSQL_TO_ARROW = {
+    "tinyint": pa.int8(),
+    "smallint": pa.int16(),
+    "mediumint": pa.int32(),
+    "int": pa.int32(),
+    "bigint": pa.int64(),
+    "float": pa.float32(),
+    "double": pa.float64(),
+    "decimal": pa.float64(),
+    "date": pa.date32(),
+    "datetime": pa.timestamp("s"),
+    "timestamp": pa.timestamp("s"),
+    "char": pa.string(),
+    "varchar": pa.string(),
+    "text": pa.string(),
+}
+
+
+# -----------------------------
+# Writing
+# -----------------------------
+def orders_schema(conn):
+    """Arrow schema of the orders table (minus the partition column), from information_schema."""
+    with conn.cursor() as cur:
+        cur.execute(
+            """SELECT COLUMN_NAME, DATA_TYPE FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'orders'
+            ORDER BY ORDINAL_POSITION"""
+        )
+        columns = cur.fetchall()
+    return pa.schema([
+        (name, MYSQL_TO_ARROW.get(data_type.lower(), pa.string()))
+        for name, data_type in columns
+        if name != PARTITION_COLUMN
+    ])
+
+
+def _to_array(values, arrow_type):
+    try:
+        return pa.array(values, type=arrow_type, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # DECIMAL columns arrive as decimal.Decimal; let Arrow infer, then cast.
+        return pa.array(values, from_pandas=True).cast(arrow_type)
+
+
+def _year_batches(conn, schema, year, batch_rows):
+    columns = ", ".join(f"`{name}`" for name in schema.names)
+    # Unbuffered cursor: rows stream from the server one row group at a time.
+    with conn.cursor(pymysql.cursors.SSCursor) as cur:
+        cur.execute(f"SELECT {columns} FROM orders WHERE {PARTITION_COLUMN} = %s", (year,))
+        while True:
+            rows = cur.fetchmany(batch_rows)
+            if not rows:
+                break
+            arrays = [_to_array(col, field.type) for col, field in zip(zip(*rows), schema)]
+            yield pa.Table.from_arrays(arrays, schema=schema)
+
+
+def write_extract(conn, output=PARQUET_DIR, row_group_size=128 * 1024, log=print):
+    """Write the extract into a staging directory, then swap it in place of ``output``."""
+    schema = orders_schema(conn)
+    string_columns = [f.name for f in schema if pa.types.is_string(f.type)]
+    staging = output.rstrip("/\\") + ".staging"
+    shutil.rmtree(staging, ignore_errors=True)
+
+    with conn.cursor() as cur:
+        cur.execute(f"SELECT DISTINCT {PARTITION_COLUMN} FROM orders ORDER BY 1")
+        years = [row[0] for row in cur.fetchall()]
+
+    total_rows = 0
+    for year in years:
+        start = time.perf_counter()
+        partition = os.path.join(staging, f"{PARTITION_COLUMN}={year}")
+        os.makedirs(partition)
+        rows = 0
+        with pq.ParquetWriter(
+            os.path.join(partition, "part-0.parquet"),
+            schema,
+            use_dictionary=string_columns,
+            write_statistics=True,
+            compression="zstd",
+        ) as writer:
+            for table in _year_batches(conn, schema, year, row_group_size):
+                writer.write_table(table, row_group_size=row_group_size)
+                rows += table.num_rows
+        total_rows += rows
+        log(f"{PARTITION_COLUMN}={year}: {rows:,} rows in {time.perf_counter() - start:.1f}s")
+
+    previous = output.rstrip("/\\") + ".previous"
+    shutil.rmtree(previous, ignore_errors=True)
+    if os.path.exists(output):
+        os.rename(output, previous)
+    os.rename(staging, output)
+    shutil.rmtree(previous, ignore_errors=True)
+    log(f"Wrote {total_rows:,} rows to {output}")
+    return total_rows
+
+
+# -----------------------------
+# Reading
+# -----------------------------
+def extract_available(path=PARQUET_DIR):
+    return os.path.isdir(path)
+
+
+def extract_version(path=PARQUET_DIR):
+    """Changes whenever the extract is rewritten; used to key cached results."""
+    return os.path.getmtime(path)
+
+
+def read_orders(columns=None, min_year=2020, path=PARQUET_DIR, filter=None):
+    """Arrow table of orders with ``order_year > min_year``, reading only ``columns``.
+
+    The year filter prunes whole partitions; other predicates in ``filter``
+    (a pyarrow expression) can use the row-group statistics written by the extract.
+    """
+    dataset = ds.dataset(path, format="parquet", partitioning="hive")
+    expression = ds.field(PARTITION_COLUMN) > min_year
+    if filter is not None:
+        expression &= filter
+    return dataset.to_table(columns=columns, filter=expression)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract amazon_db.orders to year-partitioned Parquet.")
+    parser.add_argument("--output", default=PARQUET_DIR)
+    parser.add_argument("--row-group-size", type=int, default=128 * 1024)
+    args = parser.parse_args()
+
+    connection = pymysql.connect(**DB_CONFIG)
+    try:
+        write_extract(connection, args.output, args.row_group_size)
+    finally:
+        connection.close()
@@ -0,0 +1,133 @@
+"""
+Sidebar filters applied to every dashboard query.
+
+A ``Filters`` value (order date range, states, subcategories, customer
+tiers) reaches the data three ways:
+
+* SQL: dashboard queries mark where the predicate goes with ``{filters}``
+  (``{filters:o}`` for rows aliased ``o``); ``format_sql`` fills it in with
+  bound ``%(name)s`` parameters, so literal ``%`` in query text is written ``%%``;
+* rollups: ``rollup_dims`` are the extra columns a rollup needs to answer the
+  filtered query; rollups are month grain, so a date range that doesn't fall
+  on month boundaries is answered from raw orders;
+* Arrow: ``expression`` filters the Parquet extract and the orders snapshot.
+
+Query text and parameters both go into the result-cache key, so results are
+cached per filter combination.
+"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+# First day the dashboards cover; queries used to hard-code ``order_year > 2020``.
+MIN_DATE = date(2021, 1, 1)
+# Placeholder for the filter predicate in query text and ``AggSpec.where``.
+PLACEHOLDER = "{filters}"
+
+# field -> orders column filtered with IN (...)
+LIST_COLUMNS = {"states": "customer_state", "subcategories": "subcategory", "tiers": "customer_tier"}
+
+
+def _month_start(day):
+    return day.day == 1
+
+
+def _month_end(day):
+    return (day + timedelta(days=1)).day == 1
+
+
+def _year_start(day):
+    return (day.month, day.day) == (1, 1)
+
+
+def _year_end(day):
+    return (day.month, day.day) == (12, 31)
+
+
+@dataclass(frozen=True)
+class Filters:
+    start_date: date = MIN_DATE
+    end_date: date = None  # inclusive; None leaves the range open
+    states: tuple = ()
+    subcategories: tuple = ()
+    tiers: tuple = ()
+
+    def _lists(self):
+        return [(field, column, getattr(self, field)) for field, column in LIST_COLUMNS.items() if getattr(self, field)]
+
+    def month_aligned(self):
+        return _month_start(self.start_date) and (self.end_date is None or _month_end(self.end_date))
+
+    def rollup_dims(self):
+        """Columns a rollup must be keyed by to answer these filters (``order_date``: none can)."""
+        dims = [column for _, column, _ in self._lists()]
+        if not self.month_aligned():
+            dims.append("order_date")
+        return tuple(dims)
+
+    def _by_day(self):
+        """True when ``order_year`` alone can't express the date range."""
+        return not _year_start(self.start_date) or (self.end_date is not None and not _year_end(self.end_date))
+
+    def columns(self):
+        """orders columns ``expression`` reads."""
+        columns = ["order_year", "order_date"] if self._by_day() else ["order_year"]
+        return columns + [column for _, column, _ in self._lists()]
+
+    def where(self, alias="", rollup=False):
+        """``(predicate, params)`` for rows of orders (or of a rollup when ``rollup``)."""
+        prefix = f"{alias}." if alias else ""
+        conditions, params = [f"{prefix}order_year >= %(start_year)s"], {"start_year": self.start_date.year}
+        if rollup and self.start_date.month != 1:
+            conditions.append(f"{prefix}order_year * 100 + {prefix}order_month >= %(start_period)s")
+            params["start_period"] = self.start_date.year * 100 + self.start_date.month
+        elif not rollup and not _year_start(self.start_date):
+            conditions.append(f"{prefix}order_date >= %(start_date)s")
+            params["start_date"] = self.start_date
+        if self.end_date is not None:
+            conditions.append(f"{prefix}order_year <= %(end_year)s")
+            params["end_year"] = self.end_date.year
+            if rollup and self.end_date.month != 12:
+                conditions.append(f"{prefix}order_year * 100 + {prefix}order_month <= %(end_period)s")
+                params["end_period"] = self.end_date.year * 100 + self.end_date.month
+            elif not rollup and not _year_end(self.end_date):
+                conditions.append(f"{prefix}order_date <= %(end_date)s")
+                params["end_date"] = self.end_date
+        for field, column, values in self._lists():
+            conditions.append(f"{prefix}{column} IN %({field})s")
+            params[field] = tuple(values)
+        return " AND ".join(conditions), params
+
+    def format_sql(self, sql, rollup=None):
+        """Fill ``{filters}`` (and ``{rollup}``, the table to read) in ``sql``; returns ``(sql, params)``."""
+        predicate = _Predicate(self, rollup is not None)
+        return sql.format(filters=predicate, rollup=rollup), predicate.params
+
+    def expression(self):
+        """The same filter as a pyarrow dataset expression."""
+        expr = ds.field("order_year") >= self.start_date.year
+        if not _year_start(self.start_date):
+            expr &= ds.field("order_date") >= pa.scalar(self.start_date, pa.date32())
+        if self.end_date is not None:
+            expr &= ds.field("order_year") <= self.end_date.year
+            if not _year_end(self.end_date):
+                expr &= ds.field("order_date") <= pa.scalar(self.end_date, pa.date32())
+        for _, column, values in self._lists():
+            expr &= ds.field(column).isin(list(values))
+        return expr
+
+
+class _Predicate:
+    """Formats as the filter predicate (format spec = table alias), collecting its parameters."""
+
+    def __init__(self, filters, rollup):
+        self.filters = filters
+        self.rollup = rollup
+        self.params = {}
+
+    def __format__(self, alias):
+        predicate, params = self.filters.where(alias, self.rollup)
+        self.params.update(params)
+        return predicate
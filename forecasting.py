@@ -0,0 +1,188 @@
+"""
+Holt-Winters forecasts for many revenue series at once.
+
+Every series (total, per subcategory, per state, ...) becomes one row of a
+series x period matrix. An additive Holt-Winters model with damped trend
+is filtered over the whole matrix for every smoothing-parameter set in
+``GRID`` at the same time: one NumPy step per period updates a
+(parameter set x series) state array, so hundreds of series cost about
+the same as one. Each series keeps the parameter set with the lowest
+one-step-ahead squared error.
+
+The fitted parameters and final state are a small frame (``fit_series``);
+dashboards cache it and project any horizon from it (``forecast_series``)
+without refitting.
+
+Backtests use rolling origins from the same pass: at each origin the
+parameter set is chosen on the errors before that origin only, so every
+fold is a genuine refit on past data. Errors are compared with a
+seasonal-naive forecast (same period last season).
+"""
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from timing import span
+
+ALPHAS = (0.05, 0.1, 0.2, 0.35, 0.5, 0.7, 0.9)
+BETAS = (0.0, 0.05, 0.15, 0.3)
+GAMMAS = (0.0, 0.1, 0.25, 0.5)
+PHIS = (0.9, 1.0)
+
+# One row per smoothing-parameter set: alpha (level), beta (trend), gamma (season), phi (trend damping).
+PARAMS = ["alpha", "beta", "gamma", "phi"]
+GRID = np.array(list(itertools.product(ALPHAS, BETAS, GAMMAS, PHIS)))
+
+
+def series_matrix(df, period, value, keys=()):
+    """``(labels, periods, values)``: one row of ``values`` per series, one column per period.
+
+    ``df[period]`` holds pandas Periods. Periods missing from a series
+    count as 0. Without ``keys`` all rows form one "Total" series.
+    """
+    periods = pd.period_range(df[period].min(), df[period].max())
+    keys = list(keys)
+    if keys:
+        wide = df.pivot_table(index=keys, columns=period, values=value, aggfunc="sum", fill_value=0, observed=True)
+        labels = wide.index.to_frame(index=False)
+    else:
+        wide = df.groupby(period)[value].sum().to_frame().T
+        labels = pd.DataFrame({"series": ["Total"]})
+    values = wide.reindex(columns=periods, fill_value=0).to_numpy(dtype=np.float64)
+    return labels, periods, np.nan_to_num(values)
+
+
+def _season(periods, season):
+    """The season length the history supports: two full seasons are needed to start one."""
+    if periods < 3:
+        raise ValueError("Forecasting needs at least 3 periods of history.")
+    return season if periods >= 2 * season else 1
+
+
+def _initial_state(values, season):
+    """Level, trend and seasonal indices from the first one or two seasons."""
+    level = values[:, :season].mean(axis=1)
+    trend = (values[:, season:2 * season].mean(axis=1) - level) / season
+    return level, trend, values[:, :season] - level[:, None]
+
+
+def _select(level, trend, seasonal, sse, t, season):
+    """The state at period ``t`` of each series' lowest-error parameter set, seasons rotated to start at ``t``."""
+    best = sse.argmin(axis=0)
+    rows = np.arange(sse.shape[1])
+    return {
+        "params": GRID[best],
+        "level": level[best, rows],
+        "trend": trend[best, rows],
+        "seasonal": seasonal[best, rows][:, (t + np.arange(season)) % season],
+        "rmse": np.sqrt(sse[best, rows] / max(t - season, 1)),
+    }
+
+
+def _filter(values, season, origins):
+    """Filter every series with every ``GRID`` row; the selected state at each period in ``origins``."""
+    n = len(GRID)
+    alpha, beta, gamma, phi = (GRID[:, i, None] for i in range(len(PARAMS)))
+    level0, trend0, seasonal0 = _initial_state(values, season)
+    level = np.repeat(level0[None], n, axis=0)
+    trend = np.repeat(trend0[None], n, axis=0)
+    seasonal = np.repeat(seasonal0[None], n, axis=0)
+    sse = np.zeros_like(level)
+    states = {}
+    for t in range(season, values.shape[1] + 1):
+        if t in origins:
+            states[t] = _select(level, trend, seasonal, sse, t, season)
+        if t == values.shape[1]:
+            break
+        observed, previous = values[:, t], seasonal[:, :, t % season]
+        damped = phi * trend
+        sse += (observed - level - damped - previous) ** 2
+        new_level = alpha * (observed - previous) + (1 - alpha) * (level + damped)
+        trend = beta * (new_level - level) + (1 - beta) * damped
+        seasonal[:, :, t % season] = gamma * (observed - new_level) + (1 - gamma) * previous
+        level = new_level
+    return states
+
+
+def _project(level, trend, seasonal, phi, horizon):
+    """``horizon`` periods ahead of each state: level + damped trend + season."""
+    steps = np.arange(1, horizon + 1)
+    damping = np.cumsum(phi[:, None] ** steps, axis=1)
+    return level[:, None] + damping * trend[:, None] + seasonal[:, (steps - 1) % seasonal.shape[1]]
+
+
+def fit_series(df, period, value, keys=(), season=12, history=None):
+    """One row per series: fitted parameters, in-sample RMSE and final state (the part worth caching).
+
+    ``history`` keeps only the latest that many periods.
+    """
+    with span("pandas", "holt-winters fit") as info:
+        labels, periods, values = series_matrix(df, period, value, keys)
+        if history:
+            periods, values = periods[-history:], values[:, -history:]
+        season = _season(len(periods), season)
+        state = _filter(values, season, {len(periods)})[len(periods)]
+        fitted = labels.assign(
+            **dict(zip(PARAMS, state["params"].T)),
+            rmse=state["rmse"], level=state["level"], trend=state["trend"], last_period=periods[-1],
+        )
+        seasons = pd.DataFrame(state["seasonal"], columns=[f"season_{i}" for i in range(season)])
+        fitted = pd.concat([fitted, seasons], axis=1)
+        info["rows"] = len(fitted)
+    return fitted
+
+
+def forecast_series(fitted, horizon):
+    """Long frame of the next ``horizon`` periods of every series in ``fitted`` (from ``fit_series``)."""
+    seasonal = fitted.filter(like="season_").to_numpy(dtype=np.float64)
+    projected = _project(
+        fitted["level"].to_numpy(), fitted["trend"].to_numpy(), seasonal, fitted["phi"].to_numpy(), horizon
+    )
+    labels = fitted.drop(columns=PARAMS + ["rmse", "level", "trend", "last_period"] + list(fitted.filter(like="season_")))
+    last = fitted["last_period"].iloc[0]
+    return labels.loc[labels.index.repeat(horizon)].reset_index(drop=True).assign(
+        period=np.tile(pd.period_range(last + 1, periods=horizon), len(fitted)),
+        forecast=projected.ravel(),
+    )
+
+
+def _smape(actual, predicted):
+    """Symmetric MAPE (%) per series over all folds and steps; periods where both are 0 count as exact."""
+    scale = np.abs(actual) + np.abs(predicted)
+    ratio = np.divide(2 * np.abs(actual - predicted), scale, out=np.zeros_like(scale), where=scale > 0)
+    return ratio.mean(axis=(0, 2)) * 100
+
+
+def backtest_series(df, period, value, keys=(), season=12, horizon=3, folds=6, history=None):
+    """Rolling-origin backtest: per series sMAPE and MAE of the model and of a seasonal-naive forecast.
+
+    Origins are the last ``folds`` periods from which a full ``horizon``
+    can still be checked against actuals.
+    """
+    with span("pandas", "holt-winters backtest") as info:
+        labels, _, values = series_matrix(df, period, value, keys)
+        if history:
+            values = values[:, -history:]
+        length = values.shape[1]
+        season = _season(length, season)
+        origins = [o for o in range(length - horizon - folds + 1, length - horizon + 1) if o > season]
+        if not origins:
+            raise ValueError(f"Not enough history to backtest a {horizon}-period horizon.")
+        states = _filter(values, season, set(origins))
+        steps = np.arange(horizon)
+        actual = np.stack([values[:, o:o + horizon] for o in origins])
+        model = np.stack([
+            _project(s["level"], s["trend"], s["seasonal"], s["params"][:, 3], horizon)
+            for s in (states[o] for o in origins)
+        ])
+        naive = np.stack([values[:, o - season + steps % season] for o in origins])
+        result = labels.assign(
+            smape_pct=_smape(actual, model).round(2),
+            naive_smape_pct=_smape(actual, naive).round(2),
+            mae=np.abs(actual - model).mean(axis=(0, 2)),
+            naive_mae=np.abs(actual - naive).mean(axis=(0, 2)),
+        )
+        result["beats_naive"] = result["mae"] < result["naive_mae"]
+        info["rows"] = len(result)
+    return result
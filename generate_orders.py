@@ -0,0 +1,397 @@
+"""
+Synthetic ``orders`` generator for scale testing.
+
+Produces rows with the same columns and value domains the dashboards query
+(see ``schema.ORDERS_SCHEMA``), fully vectorized with NumPy and generated in
+fixed-size chunks so 100M rows never have to fit in memory. Output is
+seeded and reproducible, with realistic skew:
+
+* customers and brands are drawn from Zipf-like (power-law) distributions,
+  so a few customers and brands account for most orders;
+* order volume grows year over year and spikes around festival sales
+  (Republic Day, Prime Day, the Great Indian Festival / Diwali season);
+* discounts deepen during festivals, Prime members get faster, free delivery.
+
+Chunks stream to CSV, to a year-partitioned Parquet dataset readable with
+``AMAZON_DATA_SOURCE=parquet``, or straight into MySQL with ``LOAD DATA``.
+
+Usage::
+
+    python generate_orders.py --rows 10M --format parquet --output data/orders_parquet
+    python generate_orders.py --rows 1M --format mysql --database amazon_bench_1m --truncate
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pymysql
+
+from db_pool import DB_CONFIG
+
+DEFAULT_SEED = 42
+DEFAULT_CHUNK_ROWS = 1_000_000
+START_DATE, END_DATE = "2015-01-01", "2025-12-31"
+ORDERS_PER_CUSTOMER = 5
+YEARLY_GROWTH = 1.25
+
+# subcategory -> (median price in INR, brands in popularity order)
+CATALOG = {
+    "Smartphones": (18_000, ["Samsung", "Xiaomi", "Apple", "OnePlus", "Realme", "Vivo", "Oppo", "Motorola", "Nokia", "iQOO"]),
+    "Laptops": (55_000, ["HP", "Dell", "Lenovo", "Asus", "Apple", "Acer", "MSI", "Microsoft"]),
+    "Tablets": (25_000, ["Apple", "Samsung", "Lenovo", "Xiaomi", "Realme", "Nokia"]),
+    "Smart Watch": (4_000, ["Noise", "boAt", "Fire-Boltt", "Amazfit", "Apple", "Samsung", "Fastrack"]),
+    "Audio": (2_500, ["boAt", "JBL", "Sony", "Noise", "Boult", "Sennheiser", "Bose", "Skullcandy"]),
+    "TV & Entertainment": (35_000, ["Samsung", "LG", "Sony", "Mi", "OnePlus", "TCL", "Vu", "Hisense"]),
+}
+SUBCATEGORY_WEIGHTS = [0.32, 0.14, 0.08, 0.16, 0.20, 0.10]
+PRODUCTS_PER_BRAND = 25
+
+# state -> (cities, tier of each city)
+GEOGRAPHY = {
+    "Maharashtra": (["Mumbai", "Pune", "Nagpur", "Nashik"], ["Metro", "Tier1", "Tier2", "Tier2"]),
+    "Karnataka": (["Bengaluru", "Mysuru", "Hubli"], ["Metro", "Tier2", "Tier2"]),
+    "Delhi": (["New Delhi", "Dwarka"], ["Metro", "Metro"]),
+    "Tamil Nadu": (["Chennai", "Coimbatore", "Madurai"], ["Metro", "Tier1", "Tier2"]),
+    "Telangana": (["Hyderabad", "Warangal"], ["Metro", "Tier2"]),
+    "West Bengal": (["Kolkata", "Siliguri", "Durgapur"], ["Metro", "Tier2", "Tier2"]),
+    "Gujarat": (["Ahmedabad", "Surat", "Vadodara", "Rajkot"], ["Tier1", "Tier1", "Tier2", "Tier2"]),
+    "Uttar Pradesh": (["Lucknow", "Kanpur", "Noida", "Varanasi", "Rural UP"], ["Tier1", "Tier1", "Tier1", "Tier2", "Rural"]),
+    "Rajasthan": (["Jaipur", "Jodhpur", "Rural Rajasthan"], ["Tier1", "Tier2", "Rural"]),
+    "Kerala": (["Kochi", "Thiruvananthapuram"], ["Tier1", "Tier2"]),
+    "Punjab": (["Ludhiana", "Amritsar", "Rural Punjab"], ["Tier1", "Tier2", "Rural"]),
+    "Bihar": (["Patna", "Gaya", "Rural Bihar"], ["Tier2", "Tier2", "Rural"]),
+}
+AGE_GROUPS = ["18-25", "26-35", "36-45", "46-55", "55+"]
+AGE_WEIGHTS = [0.24, 0.36, 0.22, 0.12, 0.06]
+PAYMENT_METHODS = ["UPI", "Credit Card", "Debit Card", "Cash on Delivery", "Net Banking", "Wallet", "BNPL"]
+RETURN_STATUSES = ["Delivered", "Returned", "Cancelled"]
+RETURN_WEIGHTS = [0.90, 0.06, 0.04]
+# Base delivery days per tier (Prime orders are capped at 2)
+TIER_DELIVERY_DAYS = {"Metro": 2, "Tier1": 3, "Tier2": 4, "Rural": 6}
+
+# (month, first day, last day, volume multiplier)
+FESTIVALS = [
+    (1, 20, 26, 1.8),    # Republic Day sale
+    (7, 10, 17, 2.5),    # Prime Day
+    (10, 1, 31, 3.0),    # Great Indian Festival
+    (11, 1, 15, 2.2),    # Diwali
+    (12, 20, 31, 1.5),   # Year-end sale
+]
+
+COLUMNS = [
+    "transaction_id", "customer_id", "product_id", "product_name", "category", "subcategory", "brand",
+    "order_date", "order_year", "order_quarter", "order_month",
+    "original_price_inr", "discount_percent", "discounted_price_inr", "quantity", "delivery_charges",
+    "final_amount_inr", "customer_city", "customer_state", "customer_tier", "customer_age_group",
+    "is_prime_member", "is_festival_sale", "payment_method", "delivery_days", "return_status",
+    "customer_rating", "product_rating",
+]
+
+ORDERS_DDL = """CREATE TABLE IF NOT EXISTS orders (
+    transaction_id VARCHAR(20) PRIMARY KEY,
+    customer_id VARCHAR(16) NOT NULL,
+    product_id VARCHAR(16) NOT NULL,
+    product_name VARCHAR(100),
+    category VARCHAR(50),
+    subcategory VARCHAR(50),
+    brand VARCHAR(50),
+    order_date DATE NOT NULL,
+    order_year SMALLINT NOT NULL,
+    order_quarter TINYINT NOT NULL,
+    order_month TINYINT NOT NULL,
+    original_price_inr DECIMAL(12, 2),
+    discount_percent DECIMAL(5, 2),
+    discounted_price_inr DECIMAL(12, 2),
+    quantity SMALLINT,
+    delivery_charges DECIMAL(8, 2),
+    final_amount_inr DECIMAL(14, 2),
+    customer_city VARCHAR(50),
+    customer_state VARCHAR(50),
+    customer_tier VARCHAR(10),
+    customer_age_group VARCHAR(10),
+    is_prime_member TINYINT,
+    is_festival_sale TINYINT,
+    payment_method VARCHAR(30),
+    delivery_days SMALLINT,
+    return_status VARCHAR(20),
+    customer_rating DECIMAL(2, 1),
+    product_rating DECIMAL(2, 1)
+)"""
+
+PARQUET_SCHEMA = pa.schema([
+    (column, pa.string()) for column in COLUMNS[:7]
+] + [
+    ("order_date", pa.date32()), ("order_year", pa.int16()), ("order_quarter", pa.int8()), ("order_month", pa.int8()),
+    ("original_price_inr", pa.float64()), ("discount_percent", pa.float64()), ("discounted_price_inr", pa.float64()),
+    ("quantity", pa.int16()), ("delivery_charges", pa.float64()), ("final_amount_inr", pa.float64()),
+    ("customer_city", pa.string()), ("customer_state", pa.string()), ("customer_tier", pa.string()),
+    ("customer_age_group", pa.string()), ("is_prime_member", pa.int8()), ("is_festival_sale", pa.int8()),
+    ("payment_method", pa.string()), ("delivery_days", pa.int16()), ("return_status", pa.string()),
+    ("customer_rating", pa.float64()), ("product_rating", pa.float64()),
+])
+
+
+def parse_rows(text):
+    """'1M' -> 1_000_000, '250k' -> 250_000, '1000' -> 1000."""
+    text = str(text).strip().upper()
+    scale = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}.get(text[-1:], 1)
+    return int(float(text.rstrip("KMB")) * scale)
+
+
+def zipf_ranks(rng, n, size, s=1.1):
+    """0-based ranks in ``[0, n)`` with P(rank k) roughly proportional to ``(k + 1) ** -s``.
+
+    Inverse-CDF sampling of a bounded power law: O(size) time, no per-rank weight table.
+    """
+    u = rng.random(size)
+    if abs(s - 1) < 1e-9:
+        x = np.exp(u * np.log(n + 1))
+    else:
+        a = 1 - s
+        x = (1 + u * ((n + 1) ** a - 1)) ** (1 / a)
+    return np.minimum(x.astype(np.int64) - 1, n - 1)
+
+
+def _ids(prefix, numbers, width):
+    return prefix + pd.Series(numbers).astype(str).str.zfill(width)
+
+
+class OrdersGenerator:
+    def __init__(self, rows, seed=DEFAULT_SEED, customers=None):
+        self.rows = rows
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        self._build_calendar()
+        self._build_products(rng)
+        self._build_customers(rng, customers or max(rows // ORDERS_PER_CUSTOMER, 1))
+
+    # -----------------------------
+    # Dimension tables (built once)
+    # -----------------------------
+    def _build_calendar(self):
+        days = pd.date_range(START_DATE, END_DATE, freq="D")
+        weight = YEARLY_GROWTH ** (days.year - days.year[0]).to_numpy(dtype=float)
+        festival = np.zeros(len(days), dtype=np.int8)
+        for month, first, last, boost in FESTIVALS:
+            mask = (days.month == month) & (days.day >= first) & (days.day <= last)
+            weight[mask] *= boost
+            festival[mask] = 1
+        # Weekends sell a little more.
+        weight[days.dayofweek >= 5] *= 1.15
+        self.days = days.values.astype("datetime64[D]")
+        self.day_p = weight / weight.sum()
+        self.day_festival = festival
+
+    def _build_products(self, rng):
+        subcats, brands, prices = [], [], []
+        for subcategory, (median_price, brand_names) in CATALOG.items():
+            for brand in brand_names:
+                subcats += [subcategory] * PRODUCTS_PER_BRAND
+                brands += [brand] * PRODUCTS_PER_BRAND
+                prices.append(median_price * rng.lognormal(0, 0.45, PRODUCTS_PER_BRAND))
+        n = len(subcats)
+        self.product_subcategory = np.array(subcats, dtype=object)
+        self.product_brand = np.array(brands, dtype=object)
+        self.product_price = np.round(np.concatenate(prices), -1)
+        self.product_rating = np.clip(np.round(rng.normal(4.0, 0.4, n), 1), 1, 5)
+        self.product_id = _ids("PROD", np.arange(1, n + 1), 6).to_numpy()
+        self.product_name = (
+            pd.Series(self.product_brand) + " " + pd.Series(self.product_subcategory)
+            + " Model " + pd.Series(np.arange(n) % PRODUCTS_PER_BRAND + 1).astype(str)
+        ).to_numpy()
+        # Products within a subcategory, most popular brand first.
+        self._subcategory_products = {
+            subcategory: np.flatnonzero(self.product_subcategory == subcategory) for subcategory in CATALOG
+        }
+
+    def _build_customers(self, rng, n):
+        cities, states, tiers = [], [], []
+        for state, (state_cities, city_tiers) in GEOGRAPHY.items():
+            cities += state_cities
+            states += [state] * len(state_cities)
+            tiers += city_tiers
+        city_weight = np.array([{"Metro": 4.0, "Tier1": 2.0, "Tier2": 1.0, "Rural": 0.7}[t] for t in tiers])
+        self.cities = np.array(cities, dtype=object)
+        self.city_state = np.array(states, dtype=object)
+        self.city_tier = np.array(tiers, dtype=object)
+
+        self.customers = n
+        self.customer_city = rng.choice(len(cities), n, p=city_weight / city_weight.sum()).astype(np.int16)
+        self.customer_age = rng.choice(len(AGE_GROUPS), n, p=AGE_WEIGHTS).astype(np.int8)
+        self.customer_prime = (rng.random(n) < 0.35).astype(np.int8)
+        # Shuffle so the heaviest buyers aren't all the lowest customer numbers.
+        self.customer_number = rng.permutation(n) + 1
+
+    # -----------------------------
+    # Orders
+    # -----------------------------
+    def chunk(self, index, start, size):
+        """Generate rows ``start .. start + size`` as a DataFrame; deterministic per chunk index."""
+        rng = np.random.default_rng([self.seed, index])
+
+        day = rng.choice(len(self.days), size, p=self.day_p)
+        dates = self.days[day]
+        is_festival = self.day_festival[day]
+        order_date = pd.DatetimeIndex(dates)
+
+        customer = zipf_ranks(rng, self.customers, size, s=0.6)
+        city = self.customer_city[customer]
+        tier = self.city_tier[city]
+        prime = self.customer_prime[customer]
+
+        subcat_index = rng.choice(len(CATALOG), size, p=SUBCATEGORY_WEIGHTS)
+        product = np.empty(size, dtype=np.int64)
+        for i, subcategory in enumerate(CATALOG):
+            mask = subcat_index == i
+            products = self._subcategory_products[subcategory]
+            # Zipf over products (ordered brand by brand) makes the leading brands dominate.
+            product[mask] = products[zipf_ranks(rng, len(products), int(mask.sum()), s=0.8)]
+
+        original = np.round(self.product_price[product] * rng.uniform(0.95, 1.05, size), 2)
+        discount = np.round(np.clip(rng.gamma(2.0, 5.0, size) + is_festival * rng.uniform(5, 20, size), 0, 70), 2)
+        discounted = np.round(original * (1 - discount / 100), 2)
+        quantity = rng.geometric(0.75, size).astype(np.int16)
+        free_delivery = (prime == 1) | (discounted * quantity >= 499)
+        delivery_charges = np.where(free_delivery, 0.0, rng.choice([40.0, 49.0, 79.0, 99.0], size))
+        final_amount = np.round(discounted * quantity + delivery_charges, 2)
+
+        base_days = pd.Series(tier).map(TIER_DELIVERY_DAYS).to_numpy()
+        delivery_days = np.maximum(1, rng.poisson(base_days)).astype(np.int16)
+        delivery_days = np.where(prime == 1, np.minimum(delivery_days, 2), delivery_days)
+
+        customer_rating = np.clip(np.round(rng.normal(4.1, 0.8, size) - (delivery_days > 5) * 0.8, 1), 1, 5)
+        customer_rating[rng.random(size) < 0.15] = np.nan  # not every order gets rated
+
+        return pd.DataFrame({
+            "transaction_id": _ids("TXN", np.arange(start + 1, start + size + 1), 10),
+            "customer_id": _ids("CUST", self.customer_number[customer], 9),
+            "product_id": self.product_id[product],
+            "product_name": self.product_name[product],
+            "category": "Electronics",
+            "subcategory": self.product_subcategory[product],
+            "brand": self.product_brand[product],
+            "order_date": dates,
+            "order_year": order_date.year.astype(np.int16),
+            "order_quarter": order_date.quarter.astype(np.int8),
+            "order_month": order_date.month.astype(np.int8),
+            "original_price_inr": original,
+            "discount_percent": discount,
+            "discounted_price_inr": discounted,
+            "quantity": quantity,
+            "delivery_charges": delivery_charges,
+            "final_amount_inr": final_amount,
+            "customer_city": self.cities[city],
+            "customer_state": self.city_state[city],
+            "customer_tier": tier,
+            "customer_age_group": np.array(AGE_GROUPS, dtype=object)[self.customer_age[customer]],
+            "is_prime_member": prime,
+            "is_festival_sale": is_festival,
+            "payment_method": np.array(PAYMENT_METHODS, dtype=object)[
+                zipf_ranks(rng, len(PAYMENT_METHODS), size, s=1.2)
+            ],
+            "delivery_days": delivery_days,
+            "return_status": np.array(RETURN_STATUSES, dtype=object)[rng.choice(3, size, p=RETURN_WEIGHTS)],
+            "customer_rating": customer_rating,
+            "product_rating": self.product_rating[product],
+        }, columns=COLUMNS)
+
+    def chunks(self, chunk_rows=DEFAULT_CHUNK_ROWS):
+        for index, start in enumerate(range(0, self.rows, chunk_rows)):
+            yield self.chunk(index, start, min(chunk_rows, self.rows - start))
+
+
+# -----------------------------
+# Writers
+# -----------------------------
+def write_csv(chunks, path, log=print):
+    total = 0
+    for i, df in enumerate(chunks):
+        df.to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+        total += len(df)
+        log(f"{total:,} rows written")
+    return total
+
+
+def write_parquet(chunks, path, log=print):
+    """Hive-partitioned by ``order_year``, the layout ``extract.read_orders`` expects."""
+    total = 0
+    for i, df in enumerate(chunks):
+        table = pa.Table.from_pandas(df, schema=PARQUET_SCHEMA, preserve_index=False)
+        ds.write_dataset(
+            table, path, format="parquet",
+            partitioning=ds.partitioning(pa.schema([("order_year", pa.int16())]), flavor="hive"),
+            basename_template=f"part-{i}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+            file_options=ds.ParquetFileFormat().make_write_options(compression="zstd"),
+        )
+        total += len(df)
+        log(f"{total:,} rows written")
+    return total
+
+
+def write_mysql(chunks, database=None, truncate=False, log=print):
+    """Bulk-load chunks with ``LOAD DATA LOCAL INFILE`` (the server needs ``local_infile=1``)."""
+    config = dict(DB_CONFIG, local_infile=True)
+    if database:
+        config["database"] = database
+    conn = pymysql.connect(**config)
+    total = 0
+    try:
+        with conn.cursor() as cur:
+            cur.execute(ORDERS_DDL)
+            if truncate:
+                cur.execute("TRUNCATE TABLE orders")
+            for df in chunks:
+                start = time.perf_counter()
+                with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, newline="") as f:
+                    df.to_csv(f, index=False, header=False, na_rep="\\N")
+                try:
+                    cur.execute(
+                        f"LOAD DATA LOCAL INFILE %s INTO TABLE orders "
+                        f"FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+                        f"LINES TERMINATED BY '\\n' ({', '.join(COLUMNS)})",
+                        (f.name,),
+                    )
+                finally:
+                    os.remove(f.name)
+                conn.commit()
+                total += len(df)
+                log(f"{total:,} rows loaded ({time.perf_counter() - start:.1f}s for {len(df):,})")
+    finally:
+        conn.close()
+    return total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic Amazon India orders.")
+    parser.add_argument("--rows", default="1M", help="Number of rows, e.g. 1M, 10M, 100M.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument("--format", choices=["csv", "parquet", "mysql"], default="csv")
+    parser.add_argument("--output", help="File (csv) or directory (parquet).")
+    parser.add_argument("--database", help="Target database for --format mysql (default: AMAZON_DB_NAME).")
+    parser.add_argument("--truncate", action="store_true", help="Empty the orders table before loading.")
+    args = parser.parse_args()
+
+    rows = parse_rows(args.rows)
+    generator = OrdersGenerator(rows, seed=args.seed)
+    chunks = generator.chunks(args.chunk_rows)
+    output = args.output or os.path.join(
+        "data", f"orders_{args.rows}.csv" if args.format == "csv" else f"orders_{args.rows}_parquet"
+    )
+    if args.format != "mysql" and os.path.dirname(output):
+        # Only the output's parent; the parquet writer creates the dataset directory itself.
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+    started = time.perf_counter()
+    if args.format == "csv":
+        written = write_csv(chunks, output)
+    elif args.format == "parquet":
+        written = write_parquet(chunks, output)
+    else:
+        written = write_mysql(chunks, args.database, args.truncate)
+    print(f"Generated {written:,} rows in {time.perf_counter() - started:.1f}s")
@@ -0,0 +1,279 @@
+"""
+Index advisor for the ``orders`` table.
+
+Collects every SQL string (and every pushed-down ``AggSpec``) the dashboard
+modules in ``dashboards/`` declare, runs ``EXPLAIN FORMAT=JSON`` on each and
+proposes composite indexes: equality columns first, then the range column
+(``order_year``), extended into a covering index when the query reads few
+enough columns. Candidates are ranked by the rows they are estimated to stop
+scanning, using the optimizer's own ``filtered`` estimate for the indexed
+predicates. The DDL is written as a migration; ``--apply`` runs it and
+re-explains every query to report rows examined per dashboard before and after.
+
+Only the raw-table side of rollup-routed queries is explained: the rollup
+tables are small and are indexed when ``rollups.py build`` creates them.
+
+Usage::
+
+    python index_advisor.py [--output migrations/orders_indexes.sql] [--apply]
+"""
+import argparse
+import json
+import os
+import re
+
+import pymysql
+from pymysql.converters import escape_item
+
+from db_pool import DB_CONFIG
+
+MIGRATION_PATH = os.path.join("migrations", "orders_indexes.sql")
+
+# Longer indexes cost more on every load than they save on reads.
+MAX_INDEX_COLUMNS = 6
+MYSQL_MAX_IDENTIFIER = 64
+
+_CONDITION = re.compile(r"`(\w+)`\s*(=|<=>|>=|<=|>|<|\bin\b|\bbetween\b|\bis not null\b)", re.IGNORECASE)
+_GROUP_BY = re.compile(r"\bGROUP BY\s+(.+?)(?=\bORDER BY\b|\bHAVING\b|\bLIMIT\b|\)|;|$)", re.IGNORECASE | re.DOTALL)
+_ALIAS = re.compile(r"\b(?:FROM|JOIN)\s+orders(?:\s+(?:AS\s+)?(\w+))?", re.IGNORECASE)
+_ALIAS_KEYWORDS = {"where", "group", "order", "join", "left", "inner", "on", "limit", "union"}
+
+
+# -----------------------------
+# Query extraction
+# -----------------------------
+def extract_queries():
+    """Return ``(dashboard, name, sql)`` for every query the dashboards run against ``orders``."""
+    # Imported here so the advisor's other helpers don't pull in Streamlit.
+    import dashboards
+
+    queries = []
+    for dashboard in dashboards.TITLES:
+        seen = set()
+        for name, sql, params in dashboards.declared_queries(dashboard):
+            # Inline the default filter's parameters the way pymysql would bind them.
+            sql = sql % {key: escape_item(value, "utf8mb4") for key, value in params.items()}
+            if sql in seen:
+                continue
+            seen.add(sql)
+            queries.append((dashboard, name, sql))
+    return queries
+
+
+# -----------------------------
+# EXPLAIN
+# -----------------------------
+def _table_accesses(node):
+    if isinstance(node, dict):
+        if "table_name" in node and "access_type" in node:
+            yield node
+        for value in node.values():
+            yield from _table_accesses(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _table_accesses(value)
+
+
+def orders_aliases(sql):
+    aliases = {"orders"}
+    for alias in _ALIAS.findall(sql):
+        if alias and alias.lower() not in _ALIAS_KEYWORDS:
+            aliases.add(alias)
+    return aliases
+
+
+def explain(conn, sql):
+    """Table accesses on ``orders`` from ``EXPLAIN FORMAT=JSON``, plus total rows examined."""
+    with conn.cursor() as cur:
+        cur.execute("EXPLAIN FORMAT=JSON " + sql.strip().rstrip(";"))
+        plan = json.loads(cur.fetchone()[0])
+    aliases = orders_aliases(sql)
+    accesses = []
+    for access in _table_accesses(plan):
+        if access["table_name"] in aliases and "materialized_from_subquery" not in access:
+            accesses.append({
+                "access_type": access["access_type"],
+                "key": access.get("key"),
+                "rows": int(access.get("rows_examined_per_scan", 0)),
+                "filtered": float(access.get("filtered", 100)),
+                "condition": access.get("attached_condition", ""),
+                "used_columns": access.get("used_columns", []),
+            })
+    return {"accesses": accesses, "rows_examined": sum(a["rows"] for a in accesses)}
+
+
+def existing_indexes(conn):
+    with conn.cursor() as cur:
+        cur.execute(
+            """SELECT INDEX_NAME, COLUMN_NAME FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'orders'
+            ORDER BY INDEX_NAME, SEQ_IN_INDEX"""
+        )
+        indexes = {}
+        for index_name, column in cur.fetchall():
+            indexes.setdefault(index_name, []).append(column)
+    return list(indexes.values())
+
+
+# -----------------------------
+# Proposals
+# -----------------------------
+def _group_columns(sql, columns):
+    groups = []
+    for clause in _GROUP_BY.findall(sql):
+        names = [part.strip().split(".")[-1] for part in clause.split(",")]
+        if names and all(name in columns for name in names):
+            groups.append(names)
+    return groups[0] if groups else []
+
+
+def candidate_for(sql, access):
+    """Composite (and, when small enough, covering) index key for one ``orders`` access."""
+    equality, ranges = [], []
+    for column, op in _CONDITION.findall(access["condition"]):
+        target = equality if op.lower() in ("=", "<=>", "in") else ranges
+        if column not in equality + ranges:
+            target.append(column)
+    used = list(access["used_columns"])
+    key = equality + ranges[:1]
+    if not key:
+        return None
+    # Columns after a range column can't narrow the scan, but they let the index cover the query.
+    extra = _group_columns(sql, used)
+    if len(set(key) | set(used)) <= MAX_INDEX_COLUMNS:
+        extra += used
+    for column in extra:
+        if column not in key:
+            key.append(column)
+    return {"columns": key, "covering": set(used) <= set(key)}
+
+
+def _is_prefix(short, long):
+    return list(long[:len(short)]) == list(short)
+
+
+def index_name(columns):
+    return ("idx_orders_" + "_".join(columns))[:MYSQL_MAX_IDENTIFIER]
+
+
+def propose_indexes(plans, existing=()):
+    """Rank candidate indexes by estimated rows no longer scanned.
+
+    ``plans`` is a list of ``(dashboard, name, sql, explain_result)``.
+    """
+    candidates = []
+    for dashboard, name, sql, plan in plans:
+        for access in plan["accesses"]:
+            if access["key"]:
+                continue  # already uses an index
+            candidate = candidate_for(sql, access)
+            if candidate is None:
+                continue
+            candidate.update(
+                saved=access["rows"] * (1 - access["filtered"] / 100),
+                queries=[(dashboard, name)],
+            )
+            candidates.append(candidate)
+
+    # A longer key also serves every query that only needs one of its prefixes.
+    candidates.sort(key=lambda c: -len(c["columns"]))
+    merged = []
+    for candidate in candidates:
+        for kept in merged:
+            if _is_prefix(candidate["columns"], kept["columns"]):
+                kept["saved"] += candidate["saved"]
+                kept["queries"].extend(candidate["queries"])
+                break
+        else:
+            merged.append(dict(candidate))
+
+    proposals = [
+        p for p in merged
+        if not any(_is_prefix(p["columns"], columns) for columns in existing)
+    ]
+    return sorted(proposals, key=lambda p: (-p["saved"], -p["covering"]))
+
+
+def migration_sql(proposals):
+    lines = [
+        "-- Indexes for amazon_db.orders proposed by index_advisor.py",
+        "-- Ranked by estimated rows no longer scanned across the dashboard queries.",
+        "",
+    ]
+    for p in proposals:
+        dashboards = sorted({dashboard for dashboard, _ in p["queries"]})
+        lines.append(
+            f"-- ~{p['saved']:,.0f} rows saved, {len(p['queries'])} queries"
+            f"{', covering' if p['covering'] else ''}: {'; '.join(dashboards)}"
+        )
+        lines.append(f"CREATE INDEX {index_name(p['columns'])} ON orders ({', '.join(p['columns'])});")
+        lines.append("")
+    lines.append("-- Rollback:")
+    for p in proposals:
+        lines.append(f"-- DROP INDEX {index_name(p['columns'])} ON orders;")
+    return "\n".join(lines) + "\n"
+
+
+# -----------------------------
+# Reporting
+# -----------------------------
+def explain_all(conn, queries, log=print):
+    plans = []
+    for dashboard, name, sql in queries:
+        try:
+            plans.append((dashboard, name, sql, explain(conn, sql)))
+        except pymysql.MySQLError as e:
+            log(f"Skipping {dashboard} / {name}: {e}")
+    return plans
+
+
+def rows_by_dashboard(plans):
+    totals = {}
+    for dashboard, _, _, plan in plans:
+        totals[dashboard] = totals.get(dashboard, 0) + plan["rows_examined"]
+    return totals
+
+
+def print_comparison(before, after, log=print):
+    log(f"{'Dashboard':<45} {'Rows before':>14} {'Rows after':>14} {'Change':>8}")
+    for dashboard, rows_before in before.items():
+        rows_after = after.get(dashboard, rows_before)
+        change = (rows_after - rows_before) / rows_before * 100 if rows_before else 0.0
+        log(f"{dashboard:<45} {rows_before:>14,} {rows_after:>14,} {change:>7.1f}%")
+
+
+def apply_migration(conn, proposals):
+    with conn.cursor() as cur:
+        for p in proposals:
+            cur.execute(f"CREATE INDEX {index_name(p['columns'])} ON orders ({', '.join(p['columns'])})")
+        cur.execute("ANALYZE TABLE orders")
+        cur.fetchall()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Propose indexes on orders for every dashboard query.")
+    parser.add_argument("--output", default=MIGRATION_PATH)
+    parser.add_argument("--apply", action="store_true", help="Create the indexes and re-run EXPLAIN.")
+    args = parser.parse_args()
+
+    queries = extract_queries()
+    print(f"Extracted {len(queries)} queries from {len({q[0] for q in queries})} dashboards")
+
+    connection = pymysql.connect(**DB_CONFIG)
+    try:
+        plans = explain_all(connection, queries)
+        proposals = propose_indexes(plans, existing_indexes(connection))
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(migration_sql(proposals))
+        for rank, p in enumerate(proposals, 1):
+            print(f"{rank:>2}. ({', '.join(p['columns'])}) ~{p['saved']:,.0f} rows saved, {len(p['queries'])} queries")
+        print(f"Wrote {len(proposals)} indexes to {args.output}")
+
+        if args.apply and proposals:
+            before = rows_by_dashboard(plans)
+            apply_migration(connection, proposals)
+            after = rows_by_dashboard(explain_all(connection, queries))
+            print_comparison(before, after)
+    finally:
+        connection.close()
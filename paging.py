@@ -0,0 +1,116 @@
+"""
+Keyset-paginated tables for result sets too large to hand to ``st.dataframe``.
+
+The dashboard's query becomes a derived table; the page query adds the
+search predicate, orders by the chosen column plus the row's key columns
+and fetches one page after the last row of the previous page::
+
+    SELECT * FROM (<query>) AS page_source
+    WHERE <search> AND (sort, key1, key2) > (%(page_after_0)s, ...)
+    ORDER BY sort, key1, key2
+    LIMIT <page size + 1>
+
+so only the visible page crosses the wire and is serialized to the browser.
+Key columns must identify a row and be non-NULL (NULLs never satisfy the
+row comparison). Pages and row counts go through the result cache; the
+cursor of every page seen is kept in the session so "Previous" is exact.
+"""
+import math
+
+import streamlit as st
+
+from db import run_query
+
+PAGE_SIZE = 50
+
+
+def _order(columns, ascending):
+    direction = "ASC" if ascending else "DESC"
+    return ", ".join(f"{column} {direction}" for column in columns)
+
+
+def _search_predicate(search_columns, search):
+    """``(predicate, params)`` matching ``search`` anywhere in ``search_columns``."""
+    if not search or not search_columns:
+        return None, {}
+    escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"CONCAT_WS(' ', {', '.join(search_columns)}) LIKE %(page_search)s", {"page_search": f"%{escaped}%"}
+
+
+def _source(sql):
+    return f"(\n{sql.strip().rstrip(';')}\n) AS page_source"
+
+
+def keyset_sql(sql, order_columns, ascending, search_columns=(), search="", after=None, limit=PAGE_SIZE + 1):
+    """``(sql, params)`` of the page of ``sql`` after the row whose ``order_columns`` values are ``after``."""
+    conditions, params = [], {"page_limit": int(limit)}
+    predicate, search_params = _search_predicate(search_columns, search)
+    if predicate:
+        conditions.append(predicate)
+        params.update(search_params)
+    if after is not None:
+        placeholders = ", ".join(f"%(page_after_{i})s" for i in range(len(after)))
+        conditions.append(f"({', '.join(order_columns)}) {'>' if ascending else '<'} ({placeholders})")
+        params.update({f"page_after_{i}": value for i, value in enumerate(after)})
+    page = f"SELECT *\nFROM {_source(sql)}"
+    if conditions:
+        page += f"\nWHERE {' AND '.join(conditions)}"
+    return page + f"\nORDER BY {_order(order_columns, ascending)}\nLIMIT %(page_limit)s", params
+
+
+def count_sql(sql, search_columns=(), search=""):
+    """``(sql, params)`` counting the rows of ``sql`` that match ``search``."""
+    predicate, params = _search_predicate(search_columns, search)
+    count = f"SELECT COUNT(*) AS row_count\nFROM {_source(sql)}"
+    return (count + f"\nWHERE {predicate}" if predicate else count), params
+
+
+def render_paged_table(ctx, name, keys, sort_columns=None, search_columns=(), page_size=PAGE_SIZE):
+    """Show the declared query ``name`` one page at a time, sorted and searched in SQL.
+
+    ``keys`` identify a row; ``sort_columns`` (default: ``keys``) are offered
+    for sorting, ``search_columns`` are searched with a substring match.
+    """
+    sql, params = ctx.sql(name)
+    sort_columns = list(sort_columns or keys)
+    widget = f"page:{ctx.title}:{name}"
+
+    col1, col2, col3 = st.columns([3, 2, 1])
+    search = col1.text_input(
+        "🔍 Search", key=f"{widget}:search", placeholder=", ".join(search_columns),
+        disabled=not search_columns,
+    ).strip()
+    sort = col2.selectbox("Sort by", sort_columns, key=f"{widget}:sort")
+    ascending = col3.toggle("Ascending", value=True, key=f"{widget}:ascending")
+    order_columns = [sort] + [key for key in keys if key != sort]
+
+    # A new query, sort or search starts again from the first page.
+    state = st.session_state.setdefault(widget, {"signature": None, "cursors": [None]})
+    signature = (sql, sorted(params.items()), search, sort, ascending)
+    if state["signature"] != signature:
+        state.update(signature=signature, cursors=[None])
+
+    page_sql, page_params = keyset_sql(
+        sql, order_columns, ascending, search_columns, search, state["cursors"][-1], page_size + 1
+    )
+    page = run_query(page_sql, {**params, **page_params}, ctx.ttl)
+    has_next = len(page) > page_size
+    page = page.head(page_size)
+    count, count_params = count_sql(sql, search_columns, search)
+    total = int(run_query(count, {**params, **count_params}, ctx.ttl)["row_count"].iloc[0])
+
+    st.dataframe(page, use_container_width=True, hide_index=True)
+    col1, col2, col3 = st.columns([1, 1, 4])
+    col1.button(
+        "◀ Previous", key=f"{widget}:previous", disabled=len(state["cursors"]) == 1,
+        on_click=lambda: state["cursors"].pop(),
+    )
+    # Python scalars, which the driver can escape.
+    last = list(page[order_columns].tail(1).to_dict("records")[0].values()) if len(page) else None
+    col2.button(
+        "Next ▶", key=f"{widget}:next", disabled=not has_next,
+        on_click=lambda: state["cursors"].append(last),
+    )
+    col3.caption(
+        f"Page {len(state['cursors'])} of {max(math.ceil(total / page_size), 1)} · {total:,} rows"
+    )
@@ -0,0 +1,118 @@
+"""
+Speculative background prefetch of the dashboards a user is likely to open next.
+
+While a dashboard renders, every cached load it performs is recorded under
+the dashboard's name; dashboards not opened yet fall back to the queries
+their registry module declares. Once the page is done, the loads recorded for the next
+dashboards in the list and for the session's most-visited ones are replayed
+on a small background pool, so their results are already in the query cache
+when the user gets there. Prefetching backs off while the connection pool is
+busy, so it never competes with foreground queries for connections.
+"""
+import contextvars
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from query_cache import cache_key
+from schema import current_dashboard
+
+PREFETCH_WORKERS = 2
+NEXT_DASHBOARDS = 2
+FAVOURITE_DASHBOARDS = 2
+MAX_LOADS_PER_DASHBOARD = 32
+# Pooled connections always left free for foreground queries.
+POOL_HEADROOM = 3
+
+
+def prefetch_targets(questions, selected, visits, next_count=NEXT_DASHBOARDS, favourites=FAVOURITE_DASHBOARDS):
+    """Dashboards worth warming after ``selected``: the next ones in the list, then the most visited."""
+    start = questions.index(selected) + 1 if selected in questions else 0
+    targets = questions[start:start + next_count]
+    ranked = sorted(visits.items(), key=lambda item: -item[1])
+    for name, _ in ranked:
+        if len(targets) >= next_count + favourites:
+            break
+        if name != selected and name not in targets and name in questions:
+            targets.append(name)
+    return targets
+
+
+class Prefetcher:
+    def __init__(self, cache, workers=PREFETCH_WORKERS, headroom=POOL_HEADROOM):
+        self.cache = cache
+        self.headroom = headroom
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self._lock = threading.Lock()
+        self._loads = {}  # dashboard -> OrderedDict(key -> (sql, params, loader, ttl))
+        self._pending = set()  # cache keys queued or running
+        self._counters = {"scheduled": 0, "warmed": 0, "skipped_cached": 0, "skipped_busy": 0, "failed": 0}
+
+    def record(self, dashboard, sql, params, loader, ttl=None):
+        """Remember a cached load performed by ``dashboard`` so it can be replayed later."""
+        if ttl == 0:
+            return
+        key = cache_key(sql, params)
+        with self._lock:
+            loads = self._loads.setdefault(dashboard, OrderedDict())
+            loads[key] = (sql, params, loader, ttl)
+            loads.move_to_end(key)
+            while len(loads) > MAX_LOADS_PER_DASHBOARD:
+                loads.popitem(last=False)
+
+    def schedule(self, dashboards, pool=None, declared=None):
+        """Queue the recorded loads of ``dashboards`` whose results are not cached yet.
+
+        ``declared(dashboard)`` supplies ``(sql, params, loader, ttl)`` loads
+        for dashboards that haven't run in this process yet.
+        """
+        for dashboard in dashboards:
+            with self._lock:
+                seen = dashboard in self._loads
+            if not seen and declared is not None:
+                for sql, params, loader, ttl in declared(dashboard):
+                    self.record(dashboard, sql, params, loader, ttl)
+            with self._lock:
+                loads = list(self._loads.get(dashboard, {}).items())
+            for key, (sql, params, loader, ttl) in loads:
+                if self.cache.contains(sql, params):
+                    continue
+                with self._lock:
+                    if key in self._pending:
+                        continue
+                    self._pending.add(key)
+                    self._counters["scheduled"] += 1
+                self._executor.submit(self._warm, dashboard, key, sql, params, loader, ttl, pool)
+
+    def _warm(self, dashboard, key, sql, params, loader, ttl, pool):
+        outcome = "warmed"
+        try:
+            if self.cache.contains(sql, params):
+                outcome = "skipped_cached"
+            elif pool is not None and self._busy(pool):
+                outcome = "skipped_busy"
+            else:
+                # Run in a fresh context so the load is attributed to the dashboard it belongs to.
+                context = contextvars.Context()
+                context.run(current_dashboard.set, dashboard)
+                context.run(self.cache.get_or_load, sql, params, loader, ttl)
+        except Exception:
+            outcome = "failed"
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+                self._counters[outcome] += 1
+
+    def _busy(self, pool):
+        stats = pool.stats()
+        return stats["in_use"] >= stats["max_size"] - self.headroom
+
+    def close(self):
+        """Drop queued warm-ups and wait for the ones running."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._counters)
+            stats.update(pending=len(self._pending), dashboards=len(self._loads))
+        return stats
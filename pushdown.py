@@ -0,0 +1,268 @@
+"""
+Aggregation pushdown for dashboards that used to pull raw order rows.
+
+A dashboard declares what it needs as an ``AggSpec`` (group keys plus named
+measures). ``pushdown_sql`` turns that into a single GROUP BY query so only
+aggregated rows cross the wire (its ``{filters}`` placeholder is filled in
+by ``filters.Filters.format_sql``); ``aggregate_frame`` computes the same result
+from raw rows with pandas and is kept as the fallback and as the reference
+the SQL path is verified against.
+"""
+from dataclasses import dataclass, field, replace
+
+import pandas as pd
+
+from rollups import ROLLUP_EQUIVALENTS
+from sketches import SKETCH_COLUMNS
+
+# pandas aggregation name -> SQL aggregate template
+SQL_FUNCS = {
+    "sum": "SUM({col})",
+    "count": "COUNT({col})",
+    "mean": "AVG({col})",
+    "min": "MIN({col})",
+    "max": "MAX({col})",
+    "nunique": "COUNT(DISTINCT {col})",
+    "size": "COUNT(*)",
+}
+
+
+@dataclass
+class Measure:
+    func: str
+    column: str = None
+    divide_by: float = 1
+    decimals: int = None
+
+    def __post_init__(self):
+        if self.func not in SQL_FUNCS:
+            raise ValueError(f"Unsupported aggregate: {self.func}")
+        if self.column is None and self.func != "size":
+            raise ValueError(f"'{self.func}' needs a column")
+
+
+@dataclass
+class AggSpec:
+    group_keys: tuple = ()
+    measures: dict = field(default_factory=dict)  # output name -> Measure
+    where: str = "{filters}"  # filled in by Filters.format_sql
+    not_null: tuple = ()  # columns whose NULL rows are skipped before aggregating
+    order_by: tuple = ()  # (column, ascending) pairs
+    limit: int = None
+    table: str = "orders"
+
+    def raw_columns(self):
+        columns = list(self.group_keys)
+        for column in [m.column for m in self.measures.values()] + list(self.not_null):
+            if column and column not in columns:
+                columns.append(column)
+        return columns
+
+    def where_sql(self):
+        conditions = [f"{col} IS NOT NULL" for col in self.not_null]
+        if self.where:
+            conditions.append(self.where)
+        return " AND ".join(conditions)
+
+
+# -----------------------------
+# SQL path
+# -----------------------------
+def _measure_sql(measure):
+    expr = SQL_FUNCS[measure.func].format(col=measure.column)
+    if measure.divide_by != 1:
+        expr = f"{expr} / {measure.divide_by}"
+    if measure.decimals is not None:
+        expr = f"ROUND({expr}, {measure.decimals})"
+    return expr
+
+
+def pushdown_sql(spec):
+    """GROUP BY query that returns the aggregated result of ``spec`` directly."""
+    select = list(spec.group_keys) + [f"{_measure_sql(m)} AS {name}" for name, m in spec.measures.items()]
+    sql = "SELECT\n    " + ",\n    ".join(select) + f"\nFROM {spec.table}"
+    if spec.where_sql():
+        sql += f"\nWHERE {spec.where_sql()}"
+    if spec.group_keys:
+        sql += "\nGROUP BY " + ", ".join(spec.group_keys)
+    if spec.order_by:
+        sql += "\nORDER BY " + ", ".join(f"{col} {'ASC' if asc else 'DESC'}" for col, asc in spec.order_by)
+    if spec.limit:
+        sql += f"\nLIMIT {int(spec.limit)}"
+    return sql
+
+
+def rollup_sql(spec):
+    """``spec`` over the ``{rollup}`` measures, or None when a measure has no rollup form.
+
+    Measures come back unscaled and unordered (``rollup_result`` finishes
+    them); distinct counts are NULL placeholders filled from the sketches.
+    """
+    if spec.where != "{filters}" or spec.not_null or spec.table != "orders":
+        return None
+    select = list(spec.group_keys)
+    for name, m in spec.measures.items():
+        if m.func == "nunique" and m.column in SKETCH_COLUMNS:
+            select.append(f"NULL AS {name}")
+        elif (m.func, m.column) in ROLLUP_EQUIVALENTS:
+            select.append(f"{ROLLUP_EQUIVALENTS[(m.func, m.column)]} AS {name}")
+        else:
+            return None
+    sql = "SELECT\n    " + ",\n    ".join(select) + "\nFROM {rollup}\nWHERE {filters}"
+    if spec.group_keys:
+        sql += "\nGROUP BY " + ", ".join(spec.group_keys)
+    return sql
+
+
+def rollup_result(df, spec):
+    """Finish the ``rollup_sql`` result like the other paths."""
+    return _finish(df.sort_values(list(spec.group_keys)) if spec.group_keys else df, spec)
+
+
+# -----------------------------
+# pandas path
+# -----------------------------
+def raw_sql(spec):
+    """Query for the raw rows the pandas path aggregates."""
+    sql = f"SELECT {', '.join(spec.raw_columns())} FROM {spec.table}"
+    if spec.where_sql():
+        sql += f" WHERE {spec.where_sql()}"
+    return sql
+
+
+def _finish(df, spec):
+    """Apply scaling, rounding, ordering and limit shared by both paths."""
+    for name, measure in spec.measures.items():
+        if measure.divide_by != 1:
+            df[name] = df[name] / measure.divide_by
+        if measure.decimals is not None:
+            df[name] = df[name].round(measure.decimals)
+    if spec.order_by:
+        df = df.sort_values(
+            [col for col, _ in spec.order_by],
+            ascending=[asc for _, asc in spec.order_by],
+            kind="stable",
+        )
+    if spec.limit:
+        df = df.head(spec.limit)
+    return df.reset_index(drop=True)
+
+
+def aggregate_frame(df, spec):
+    """Aggregate raw rows in ``df`` exactly as ``pushdown_sql(spec)`` would.
+
+    ``df`` must already satisfy ``spec.where``; ``spec.not_null`` is applied here.
+    """
+    if spec.not_null:
+        df = df.dropna(subset=list(spec.not_null))
+    if not spec.group_keys:
+        row = {}
+        for name, m in spec.measures.items():
+            row[name] = len(df) if m.func == "size" else getattr(df[m.column], m.func)()
+        return _finish(pd.DataFrame([row]), spec)
+
+    size_column = spec.group_keys[0]
+    named = {
+        name: (m.column or size_column, m.func) for name, m in spec.measures.items()
+    }
+    # SQL keeps NULL groups; observed=True keeps categorical keys from exploding.
+    out = df.groupby(list(spec.group_keys), dropna=False, observed=True, sort=True).agg(**named).reset_index()
+    return _finish(out, spec)
+
+
+# -----------------------------
+# Incremental (chunked) pandas path
+# -----------------------------
+# How per-chunk partial results are combined: func -> [(partial column suffix, chunk func, combine func)]
+_PARTIALS = {
+    "sum": [("sum", "sum", "sum")],
+    "count": [("count", "count", "sum")],
+    "size": [("size", "size", "sum")],
+    "min": [("min", "min", "min")],
+    "max": [("max", "max", "max")],
+    "mean": [("sum", "sum", "sum"), ("count", "count", "sum")],
+}
+_NO_KEYS = "__all__"
+
+
+def aggregate_chunks(chunks, spec):
+    """Aggregate an iterable of raw-row DataFrames with memory bounded by the group count.
+
+    Gives the same result as ``aggregate_frame`` on the concatenated chunks:
+    sums, counts, min/max and means are folded chunk by chunk, and distinct
+    counts keep only the distinct (group, value) pairs seen so far.
+    """
+    keys = list(spec.group_keys) or [_NO_KEYS]
+    partials = None
+    distinct = {name: None for name, m in spec.measures.items() if m.func == "nunique"}
+
+    for chunk in chunks:
+        if spec.not_null:
+            chunk = chunk.dropna(subset=list(spec.not_null))
+        if not spec.group_keys:
+            chunk = chunk.assign(**{_NO_KEYS: 0})
+
+        # "__rows" keeps groups whose distinct-count column is all NULL.
+        named = {"__rows": (keys[0], "size")}
+        for name, m in spec.measures.items():
+            for suffix, chunk_func, _ in _PARTIALS.get(m.func, []):
+                named[f"{name}__{suffix}"] = (m.column or keys[0], chunk_func)
+        part = chunk.groupby(keys, dropna=False, observed=True).agg(**named)
+        if partials is not None:
+            combine = {"__rows": "sum"}
+            for name, m in spec.measures.items():
+                for suffix, _, combine_func in _PARTIALS.get(m.func, []):
+                    combine[f"{name}__{suffix}"] = combine_func
+            part = pd.concat([partials, part]).groupby(level=keys, dropna=False, observed=True).agg(combine)
+        partials = part
+
+        for name in distinct:
+            column = spec.measures[name].column
+            pairs = chunk[keys + [column]].dropna(subset=[column]).drop_duplicates()
+            if distinct[name] is not None:
+                pairs = pd.concat([distinct[name], pairs]).drop_duplicates()
+            distinct[name] = pairs
+
+    if partials is None:
+        return aggregate_frame(pd.DataFrame(columns=spec.raw_columns()), spec)
+    out = partials
+    for name, pairs in distinct.items():
+        counts = pairs.groupby(keys, dropna=False, observed=True).size().rename(f"{name}__nunique")
+        out = out.join(counts, how="left")
+
+    result = pd.DataFrame(index=out.index)
+    for name, m in spec.measures.items():
+        if m.func == "mean":
+            result[name] = out[f"{name}__sum"] / out[f"{name}__count"]
+        elif m.func == "nunique":
+            result[name] = out[f"{name}__nunique"].fillna(0).astype("int64")
+        else:
+            result[name] = out[f"{name}__{_PARTIALS[m.func][0][0]}"]
+    result = result.reset_index()
+    if not spec.group_keys:
+        result = result.drop(columns=[_NO_KEYS])
+    return _finish(result.sort_values(list(spec.group_keys)) if spec.group_keys else result, spec)
+
+
+# -----------------------------
+# Verification
+# -----------------------------
+def unrounded(spec):
+    """Copy of ``spec`` without rounding or LIMIT, for comparing both paths."""
+    measures = {name: replace(m, decimals=None) for name, m in spec.measures.items()}
+    return replace(spec, measures=measures, order_by=(), limit=None)
+
+
+def compare_results(sql_df, pandas_df, spec, rtol=1e-6):
+    """Return None when both paths agree, otherwise a short description of the mismatch."""
+    keys = list(spec.group_keys)
+    if keys:
+        sql_df = sql_df.sort_values(keys).reset_index(drop=True)
+        pandas_df = pandas_df.sort_values(keys).reset_index(drop=True)
+    try:
+        pd.testing.assert_frame_equal(
+            sql_df, pandas_df[sql_df.columns], check_dtype=False, check_categorical=False, rtol=rtol
+        )
+    except (AssertionError, KeyError) as e:
+        return str(e).strip().splitlines()[0]
+    return None
@@ -0,0 +1,151 @@
+"""
+In-memory cache of query results shared by every session.
+
+Entries are keyed on the normalized SQL text plus its parameters, expire
+after a TTL and are evicted least-recently-used first once the cached
+DataFrames exceed a memory budget.
+"""
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql):
+    """Collapse whitespace and drop the trailing semicolon so formatting changes don't miss the cache."""
+    return _WHITESPACE.sub(" ", sql).strip().rstrip(";").strip()
+
+
+def cache_key(sql, params=None):
+    if isinstance(params, dict):
+        params = sorted(params.items())
+    raw = normalize_sql(sql) + "\x00" + repr(params)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def frame_nbytes(df):
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+class _Flight:
+    """The load of one key, shared by every caller that missed it while it was in progress."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.callers = 0
+        self.error = None
+
+
+class QueryCache:
+    def __init__(self, max_bytes=512 * 1024 * 1024, default_ttl=6 * 60 * 60):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._entries = OrderedDict()  # key -> (df, nbytes, expires_at)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._flights = {}  # key -> _Flight of the load in progress
+        self._counters = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+
+    def get(self, key):
+        """Return a copy of the cached frame for ``key`` or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            df, nbytes, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._drop_locked(key)
+                self._counters["expired"] += 1
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+        # Dashboards add helper columns to their frames, so never hand out the cached object.
+        return df.copy()
+
+    def put(self, key, df, ttl=None):
+        ttl = self.default_ttl if ttl is None else ttl
+        nbytes = frame_nbytes(df)
+        if ttl <= 0 or nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop_locked(key)
+            self._entries[key] = (df.copy(), nbytes, time.monotonic() + ttl)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop_locked(oldest)
+                self._counters["evictions"] += 1
+
+    def get_or_load(self, sql, params, loader, ttl=None):
+        """Return the cached result or run ``loader()`` once, even if several sessions miss together.
+
+        Sessions waiting on a load that fails get its exception instead of
+        each retrying it; the next caller after they have all returned loads
+        afresh.
+        """
+        key = cache_key(sql, params)
+        df = self.get(key)
+        if df is not None:
+            return df
+        with self._lock:
+            flight = self._flights.setdefault(key, _Flight())
+            flight.callers += 1
+        try:
+            with flight.lock:
+                if flight.error is not None:
+                    raise flight.error
+                df = self._peek(key)
+                if df is None:
+                    try:
+                        df = loader()
+                    except Exception as e:
+                        flight.error = e
+                        raise
+                    self.put(key, df, ttl)
+            return df
+        finally:
+            # Dropped only by the last caller, so nobody arriving meanwhile starts a second load.
+            with self._lock:
+                flight.callers -= 1
+                if not flight.callers:
+                    del self._flights[key]
+
+    def _peek(self, key):
+        """Like ``get`` but without touching the hit/miss counters."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] <= time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            df = entry[0]
+        return df.copy()
+
+    def contains(self, sql, params=None):
+        """True when a live result for ``sql`` is cached; does not count as a hit or miss."""
+        key = cache_key(sql, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[2] > time.monotonic()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._counters)
+            stats.update(entries=len(self._entries), bytes=self._bytes, max_bytes=self.max_bytes)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def _drop_locked(self, key):
+        _, nbytes, _ = self._entries.pop(key)
+        self._bytes -= nbytes
@@ -0,0 +1,160 @@
+"""
+Pre-aggregated rollups of the ``orders`` table and the router that picks one.
+
+The build step materializes a small cube at month grain: one base rollup
+plus one rollup per dashboard dimension, all carrying the same additive
+measures. Time-series dashboards then scan a few thousand rollup rows
+instead of ~1M raw orders.
+
+Build (or rebuild) the rollups, and the distinct-count sketches stored
+alongside them (see ``sketches``), with::
+
+    python rollups.py build
+"""
+import sys
+import time
+
+import pymysql
+
+from db_pool import DB_CONFIG
+
+# Every rollup is keyed by month plus the two flags dashboards filter on.
+BASE_KEYS = ["order_year", "order_quarter", "order_month", "is_festival_sale", "is_prime_member"]
+
+# Dimensions that get their own month-grain rollup.
+ROLLUP_DIMENSIONS = ["subcategory", "brand", "customer_state", "customer_tier", "payment_method"]
+
+# Additive measures stored in every rollup. Averages are rebuilt as sum / count.
+MEASURES = {
+    "revenue": "SUM(final_amount_inr)",
+    "revenue_count": "COUNT(final_amount_inr)",
+    "orders": "COUNT(transaction_id)",
+    "row_count": "COUNT(*)",
+    "quantity": "SUM(quantity)",
+    "gross_sales": "SUM(original_price_inr * quantity)",
+    "discount_amount": "SUM(original_price_inr * discount_percent / 100 * quantity)",
+    "delivery_charges": "SUM(delivery_charges)",
+    "delivery_days_sum": "SUM(delivery_days)",
+    "delivery_days_count": "COUNT(delivery_days)",
+    "late_deliveries": "SUM(CASE WHEN delivery_days > 7 THEN 1 ELSE 0 END)",
+    "customer_rating_sum": "SUM(customer_rating)",
+    "customer_rating_count": "COUNT(customer_rating)",
+    "returns": "SUM(CASE WHEN return_status LIKE 'Returned%' THEN 1 ELSE 0 END)",
+    "cancellations": "SUM(CASE WHEN return_status LIKE 'Cancelled%' THEN 1 ELSE 0 END)",
+}
+
+# Aggregation-pushdown measure (func, orders column) -> the same aggregate over the rollup measures.
+ROLLUP_EQUIVALENTS = {
+    ("sum", "final_amount_inr"): "SUM(revenue)",
+    ("count", "final_amount_inr"): "CAST(SUM(revenue_count) AS SIGNED)",
+    ("mean", "final_amount_inr"): "SUM(revenue) / SUM(revenue_count)",
+    ("count", "transaction_id"): "CAST(SUM(orders) AS SIGNED)",
+    ("size", None): "CAST(SUM(row_count) AS SIGNED)",
+    ("sum", "quantity"): "SUM(quantity)",
+    ("sum", "delivery_charges"): "SUM(delivery_charges)",
+    ("mean", "delivery_days"): "SUM(delivery_days_sum) / SUM(delivery_days_count)",
+    ("mean", "customer_rating"): "SUM(customer_rating_sum) / SUM(customer_rating_count)",
+}
+
+CATALOG_TABLE = "rollup_catalog"
+
+
+def rollup_definitions():
+    """Map rollup table name -> list of key columns."""
+    definitions = {"rollup_month": list(BASE_KEYS)}
+    for dim in ROLLUP_DIMENSIONS:
+        definitions[f"rollup_month_{dim}"] = BASE_KEYS + [dim]
+    return definitions
+
+
+# -----------------------------
+# Router
+# -----------------------------
+class RollupRouter:
+    """Answer "which rollup covers these columns?" from the build catalog."""
+
+    def __init__(self, catalog):
+        # catalog: {table_name: (frozenset of key columns, row_count)}
+        self.catalog = catalog
+
+    def route(self, *columns):
+        """Return the smallest rollup whose keys cover ``columns``, or None."""
+        needed = set(columns)
+        candidates = [
+            (rows, table) for table, (keys, rows) in self.catalog.items() if needed <= keys
+        ]
+        if not candidates:
+            return None
+        return min(candidates)[1]
+
+    @classmethod
+    def from_frame(cls, df):
+        catalog = {
+            row.table_name: (frozenset(row.dimensions.split(",")), int(row.row_count))
+            for row in df.itertuples()
+        }
+        return cls(catalog)
+
+
+def catalog_query():
+    return f"SELECT table_name, dimensions, row_count FROM {CATALOG_TABLE}"
+
+
+# -----------------------------
+# Build step
+# -----------------------------
+def build_statements(table, keys):
+    """SQL that rebuilds ``table`` into a staging table and swaps it in atomically."""
+    key_list = ", ".join(keys)
+    measure_list = ",\n    ".join(f"{expr} AS {name}" for name, expr in MEASURES.items())
+    return [
+        f"DROP TABLE IF EXISTS {table}_new",
+        f"""CREATE TABLE {table}_new AS
+SELECT
+    {key_list},
+    {measure_list}
+FROM orders
+GROUP BY {key_list}""",
+        f"ALTER TABLE {table}_new ADD INDEX idx_year_month (order_year, order_month)",
+        f"CREATE TABLE IF NOT EXISTS {table} LIKE {table}_new",
+        f"RENAME TABLE {table} TO {table}_old, {table}_new TO {table}",
+        f"DROP TABLE {table}_old",
+    ]
+
+
+def build_rollups(conn, log=print):
+    with conn.cursor() as cur:
+        cur.execute(
+            f"""CREATE TABLE IF NOT EXISTS {CATALOG_TABLE} (
+                table_name VARCHAR(64) PRIMARY KEY,
+                dimensions VARCHAR(512) NOT NULL,
+                row_count BIGINT NOT NULL,
+                built_at DATETIME NOT NULL
+            )"""
+        )
+        for table, keys in rollup_definitions().items():
+            start = time.perf_counter()
+            for statement in build_statements(table, keys):
+                cur.execute(statement)
+            cur.execute(f"SELECT COUNT(*) FROM {table}")
+            rows = cur.fetchone()[0]
+            cur.execute(
+                f"""REPLACE INTO {CATALOG_TABLE} (table_name, dimensions, row_count, built_at)
+                VALUES (%s, %s, %s, NOW())""",
+                (table, ",".join(keys), rows),
+            )
+            conn.commit()
+            log(f"{table}: {rows:,} rows in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["build"]:
+        sys.exit("usage: python rollups.py build")
+    connection = pymysql.connect(**DB_CONFIG)
+    try:
+        build_rollups(connection)
+        from sketches import build_sketches
+
+        build_sketches(connection)
+    finally:
+        connection.close()
@@ -0,0 +1,61 @@
+"""
+Run a dashboard's independent queries concurrently.
+
+Each section of a multi-query dashboard is a ``(load, render)`` pair. All
+loads are submitted at once to a shared thread pool (each borrows its own
+pooled connection), and every section is rendered on the script thread as
+soon as its data arrives, into a slot reserved in page order. Page latency
+approaches the slowest query instead of the sum of all of them.
+"""
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from timing import span
+
+# Leave a few pooled connections for other sessions' single-query dashboards.
+MAX_PARALLEL_QUERIES = 5
+
+
+@st.cache_resource(show_spinner=False)
+def get_executor():
+    return ThreadPoolExecutor(max_workers=MAX_PARALLEL_QUERIES, thread_name_prefix="dashboard-query")
+
+
+def _submit(executor, load):
+    script_ctx = get_script_run_ctx()
+    context = contextvars.copy_context()
+
+    def task():
+        # Let cached resources and context variables behave as on the script thread.
+        add_script_run_ctx(threading.current_thread(), script_ctx)
+        return context.run(load)
+
+    return executor.submit(task)
+
+
+def run_sections(sections, error_label="section"):
+    """Load every section concurrently and render each one as it completes.
+
+    ``sections`` is a list of ``(load, render)`` callables: ``load()`` returns
+    the section's data and ``render(data)`` draws it. A failing section shows
+    a warning in its own slot without hiding the others.
+    """
+    slots = [st.container() for _ in sections]
+    executor = get_executor()
+    futures = {_submit(executor, load): i for i, (load, _) in enumerate(sections)}
+    completed = as_completed(futures)
+    while True:
+        with span("wait", "parallel sections"):
+            future = next(completed, None)
+        if future is None:
+            break
+        i = futures[future]
+        with slots[i]:
+            try:
+                sections[i][1](future.result())
+            except Exception as e:
+                st.warning(f"Failed to load {error_label} {i + 1}. Error: {e}")
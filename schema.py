@@ -0,0 +1,150 @@
+"""
+Declared column types for the ``orders`` table.
+
+Every loader that pulls raw order rows (streamed MySQL chunks, the Parquet
+extract, the shared snapshot) applies this schema: low-cardinality strings
+become ``category``, small integers are downcast and amounts are stored as
+``AMOUNT_DTYPE``. ``SchemaReport`` keeps a per-dashboard tally of the bytes
+this saves.
+"""
+import os
+import threading
+from contextvars import ContextVar
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# float64 keeps crore-level sums exact to the paisa; float32 halves the memory.
+AMOUNT_DTYPE = os.environ.get("AMAZON_AMOUNT_DTYPE", "float64")
+
+ORDERS_SCHEMA = {
+    # identifiers (high cardinality, left as strings)
+    "transaction_id": "string",
+    "customer_id": "string",
+    "product_id": "string",
+    # low-cardinality strings
+    "product_name": "category",
+    "category": "category",
+    "subcategory": "category",
+    "brand": "category",
+    "customer_city": "category",
+    "customer_state": "category",
+    "customer_tier": "category",
+    "customer_age_group": "category",
+    "payment_method": "category",
+    "return_status": "category",
+    # dates and small integers
+    "order_date": "date",
+    "order_year": "int16",
+    "order_quarter": "int8",
+    "order_month": "int8",
+    "quantity": "int16",
+    "delivery_days": "int16",
+    "is_prime_member": "int8",
+    "is_festival_sale": "int8",
+    # ratings and percentages
+    "customer_rating": "float32",
+    "product_rating": "float32",
+    "discount_percent": "float32",
+    # amounts
+    "original_price_inr": "amount",
+    "discounted_price_inr": "amount",
+    "final_amount_inr": "amount",
+    "delivery_charges": "amount",
+}
+
+_ARROW_TYPES = {
+    "string": pa.string(),
+    "category": pa.dictionary(pa.int32(), pa.string()),
+    "date": pa.date32(),
+    "int8": pa.int8(),
+    "int16": pa.int16(),
+    "float32": pa.float32(),
+    "float64": pa.float64(),
+}
+
+# Dashboard whose data is currently being loaded; set once per rerun by the app.
+current_dashboard = ContextVar("current_dashboard", default="(none)")
+
+
+def declared_dtype(column):
+    dtype = ORDERS_SCHEMA.get(column)
+    return AMOUNT_DTYPE if dtype == "amount" else dtype
+
+
+def arrow_type(column):
+    return _ARROW_TYPES[declared_dtype(column)]
+
+
+def _fits(series, dtype):
+    info = np.iinfo(dtype)
+    values = series.dropna()
+    return values.empty or (values.min() >= info.min and values.max() <= info.max)
+
+
+def _integral(series):
+    if pd.api.types.is_integer_dtype(series):
+        return True
+    values = series.dropna()
+    return bool((values % 1 == 0).all())
+
+
+def _cast(series, dtype):
+    if dtype == "category":
+        return series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype("category")
+    if dtype in ("int8", "int16"):
+        if not pd.api.types.is_numeric_dtype(series) or not _fits(series, dtype) or not _integral(series):
+            # Never wrap around: SUM(quantity) results reuse the column name.
+            return series
+        if series.isna().any():
+            return series.astype(dtype.capitalize())  # nullable Int8 / Int16
+        return series.astype(dtype)
+    if dtype in ("float32", "float64"):
+        return series.astype(dtype) if pd.api.types.is_numeric_dtype(series) else series
+    return series
+
+
+def apply_schema(df):
+    """Return ``df`` with the declared dtype applied to every known column it has."""
+    typed = {}
+    for column in df.columns:
+        dtype = declared_dtype(column)
+        if dtype in (None, "string", "date"):
+            continue
+        typed[column] = _cast(df[column], dtype)
+    return df.assign(**typed) if typed else df
+
+
+# -----------------------------
+# Bytes-saved report
+# -----------------------------
+class SchemaReport:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rows = {}  # dashboard -> [loads, rows, raw_bytes, typed_bytes]
+
+    def record(self, dashboard, rows, raw_bytes, typed_bytes):
+        with self._lock:
+            entry = self._rows.setdefault(dashboard, [0, 0, 0, 0])
+            entry[0] += 1
+            entry[1] += rows
+            entry[2] += raw_bytes
+            entry[3] += typed_bytes
+
+    def frame(self):
+        with self._lock:
+            rows = [(name, *values) for name, values in self._rows.items()]
+        df = pd.DataFrame(rows, columns=["dashboard", "loads", "rows", "raw_bytes", "typed_bytes"])
+        df["saved_pct"] = (1 - df["typed_bytes"] / df["raw_bytes"].where(df["raw_bytes"] > 0)) * 100
+        return df.sort_values("raw_bytes", ascending=False)
+
+
+def typed_frame(df, report=None):
+    """Apply the schema to ``df`` and record the saving under the current dashboard."""
+    typed = apply_schema(df)
+    if report is not None:
+        raw_bytes = int(df.memory_usage(deep=True).sum())
+        typed_bytes = int(typed.memory_usage(deep=True).sum())
+        report.record(current_dashboard.get(), len(df), raw_bytes, typed_bytes)
+    return typed
@@ -0,0 +1,327 @@
+"""
+HyperLogLog sketches of distinct customers and products, stored with the rollups.
+
+Exact ``COUNT(DISTINCT ...)`` results can't be added up across months or
+states, so every distinct count used to need a scan of ``orders``. The
+build step (run by ``python rollups.py build``) writes one sketch per
+rollup group — month × festival × prime flag, plus the rollup's dimension —
+and per sketched column into ``sketch_month`` / ``sketch_month_<dim>``.
+At query time the sketches of the selected groups are merged (register-wise
+max) and estimated, for any combination of years, quarters, months and one
+dimension the rollups support.
+
+Error bound: with ``PRECISION = 14`` (16,384 one-byte registers per sketch)
+the relative standard error is 1.04 / sqrt(16384) ≈ 0.81%, so about 95% of
+estimates are within ±1.6% and 99.7% within ±2.4% of the exact count.
+Estimates use Ertl's improved estimator ("New cardinality estimation
+algorithms for HyperLogLog sketches", 2017), which stays unbiased from
+small counts through the range where raw HyperLogLog hands over to linear
+counting (~40,000 at this precision), so the bound holds there too. Merging
+doesn't add error: a merged sketch equals the sketch of the union.
+Dashboards offer an exact mode that runs the original ``COUNT(DISTINCT)``.
+
+Values are hashed with pandas' 64-bit ``hash_array`` on their string form,
+so sketches from MySQL and from the Parquet extract are interchangeable.
+"""
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+import pymysql
+
+from rollups import BASE_KEYS, ROLLUP_DIMENSIONS, RollupRouter, rollup_definitions
+
+PRECISION = 14
+REGISTERS = 1 << PRECISION
+# Columns that get sketches.
+SKETCH_COLUMNS = ["customer_id", "product_id"]
+
+SKETCH_CATALOG_TABLE = "sketch_catalog"
+INSERT_BATCH = 500
+CHUNK_ROWS = 50_000
+
+
+# -----------------------------
+# HyperLogLog
+# -----------------------------
+def hash_values(values):
+    return pd.util.hash_array(np.asarray(pd.Series(values).astype(str), dtype=object))
+
+
+def register_updates(hashes, precision=PRECISION):
+    """``(register index, rank)`` per 64-bit hash: top ``precision`` bits pick the register."""
+    bits = 64 - precision
+    index = (hashes >> np.uint64(bits)).astype(np.int64)
+    low = hashes & np.uint64((1 << bits) - 1)
+    rank = np.full(len(hashes), bits + 1, dtype=np.uint8)
+    nonzero = low > 0
+    # Position of the highest set bit of the remaining bits, counted from the top.
+    rank[nonzero] = bits - np.floor(np.log2(low[nonzero].astype(np.float64))).astype(np.uint8)
+    return index, rank
+
+
+def _sigma(x):
+    """sigma(x) = x + sum_k x^(2^k) * 2^(k-1), the correction for empty registers."""
+    if x == 1.0:
+        return np.inf
+    y, z = 1.0, x
+    while True:
+        x *= x
+        previous, z = z, z + x * y
+        y += y
+        if z == previous:
+            return z
+
+
+def _tau(x):
+    """tau(x) = (1 - x - sum_k (1 - x^(2^-k))^2 * 2^-k) / 3, the correction for saturated registers."""
+    if x == 0.0 or x == 1.0:
+        return 0.0
+    y, z = 1.0, 1.0 - x
+    while True:
+        x = np.sqrt(x)
+        y *= 0.5
+        previous, z = z, z - (1.0 - x) ** 2 * y
+        if z == previous:
+            return z / 3
+
+
+def estimate(registers):
+    """Cardinality estimate of one dense register array (Ertl's improved estimator).
+
+    Unlike raw HyperLogLog with a linear-counting switch, it has no bias
+    bump around the switch (~2.5 x registers), so one error bound holds
+    across the whole range.
+    """
+    m = len(registers)
+    q = 64 - int(np.log2(m))  # ranks run from 0 (empty) to q + 1
+    counts = np.bincount(registers, minlength=q + 2).astype(np.float64)
+    z = m * _tau(1.0 - counts[q + 1] / m)
+    for k in range(q, 0, -1):
+        z = 0.5 * (z + counts[k])
+    z += m * _sigma(counts[0] / m)
+    return m * m / (2 * np.log(2) * z)
+
+
+def pack(registers):
+    return zlib.compress(registers.tobytes())
+
+
+def unpack(blob, registers=REGISTERS):
+    return np.frombuffer(zlib.decompress(blob), dtype=np.uint8, count=registers)
+
+
+def merge_estimates(rows, keys):
+    """Merge packed sketches per ``keys`` group; ``rows`` has the keys plus ``registers``.
+
+    Returns the keys plus an ``estimate`` column (one row when ``keys`` is empty).
+    """
+    merged = {}
+    for group, blob in zip(rows[keys].itertuples(index=False, name=None) if keys else [()] * len(rows),
+                           rows["registers"]):
+        registers = unpack(blob)
+        if group in merged:
+            np.maximum(merged[group], registers, out=merged[group])
+        else:
+            merged[group] = registers.copy()
+    if not keys:
+        return pd.DataFrame({"estimate": [round(estimate(merged[()])) if merged else 0]})
+    out = pd.DataFrame(list(merged), columns=keys)
+    out["estimate"] = [round(estimate(registers)) for registers in merged.values()]
+    return out
+
+
+# -----------------------------
+# Build step
+# -----------------------------
+def sketch_table(rollup):
+    return rollup.replace("rollup_", "sketch_", 1)
+
+
+def order_chunks(conn, chunk_rows=CHUNK_ROWS):
+    """Stream the columns the sketches are built from, ``chunk_rows`` orders at a time."""
+    columns = BASE_KEYS + ROLLUP_DIMENSIONS + SKETCH_COLUMNS
+    with conn.cursor(pymysql.cursors.SSCursor) as cur:
+        cur.execute(f"SELECT {', '.join(columns)} FROM orders")
+        while True:
+            rows = cur.fetchmany(chunk_rows)
+            if not rows:
+                break
+            yield pd.DataFrame.from_records(rows, columns=columns)
+
+
+class SparseRegisters:
+    """HyperLogLog registers of every group of one sketch table and column, folded in chunk by chunk.
+
+    Entries are ``group code * REGISTERS + register`` with the highest rank
+    seen. Chunk updates wait in ``pending`` and are sort-reduced into the
+    entries once they outnumber them, so each reduction costs about as much
+    as the new data: linear overall, not a regroup of everything per chunk.
+    """
+
+    def __init__(self):
+        self.groups = {}  # key tuple -> group code
+        self.cells = np.empty(0, dtype=np.int64)
+        self.ranks = np.empty(0, dtype=np.uint8)
+        self.pending = []
+        self.pending_rows = 0
+
+    def codes(self, rows, keys):
+        """Group code of every row of ``rows``, registering groups not seen yet (NULL keys become None)."""
+        local = rows.groupby(keys, dropna=False, observed=True, sort=False).ngroup().to_numpy()
+        firsts = rows[keys].drop_duplicates()
+        firsts = firsts.astype(object).where(firsts.notna(), None)
+        mapping = np.array(
+            [self.groups.setdefault(group, len(self.groups)) for group in firsts.itertuples(index=False, name=None)],
+            dtype=np.int64,
+        )
+        return mapping[local]
+
+    def add(self, codes, index, rank):
+        self.pending.append((codes * REGISTERS + index, rank))
+        self.pending_rows += len(codes)
+        if self.pending_rows >= max(len(self.cells), CHUNK_ROWS):
+            self.compact()
+
+    def compact(self):
+        if not self.pending:
+            return
+        cells = np.concatenate([self.cells] + [cells for cells, _ in self.pending])
+        ranks = np.concatenate([self.ranks] + [ranks for _, ranks in self.pending])
+        order = np.argsort(cells, kind="stable")
+        cells, ranks = cells[order], ranks[order]
+        starts = np.flatnonzero(np.r_[True, cells[1:] != cells[:-1]])
+        self.cells, self.ranks = cells[starts], np.maximum.reduceat(ranks, starts)
+        self.pending, self.pending_rows = [], 0
+
+    def dense(self):
+        """``(key tuple, uint8 registers)`` per group."""
+        self.compact()
+        names = list(self.groups)
+        codes = self.cells // REGISTERS
+        bounds = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1], True])
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            registers = np.zeros(REGISTERS, dtype=np.uint8)
+            registers[self.cells[start:end] % REGISTERS] = self.ranks[start:end]
+            yield names[codes[start]], registers
+
+
+def build_registers(chunks, definitions=None):
+    """Registers for every sketch table from one pass over raw-row chunks.
+
+    Returns ``{(table, column): SparseRegisters}``.
+    """
+    definitions = definitions or rollup_definitions()
+    registers = {
+        (sketch_table(rollup), column): SparseRegisters()
+        for rollup in definitions for column in SKETCH_COLUMNS
+    }
+    for chunk in chunks:
+        for rollup, keys in definitions.items():
+            for column in SKETCH_COLUMNS:
+                rows = chunk[keys + [column]].dropna(subset=[column])
+                target = registers[(sketch_table(rollup), column)]
+                index, rank = register_updates(hash_values(rows[column]))
+                target.add(target.codes(rows, keys), index, rank)
+    return registers
+
+
+def _sketch_rows(registers, column):
+    for group, dense in registers.dense():
+        yield group + (column, pack(dense))
+
+
+def build_sketches(conn, log=print):
+    """Write the sketch tables (staging + swap, like the rollups) and their catalog.
+
+    Orders are read once; the stream is drained before anything is written.
+    """
+    definitions = rollup_definitions()
+    start = time.perf_counter()
+    registers = build_registers(order_chunks(conn), definitions)
+    log(f"sketch registers computed in {time.perf_counter() - start:.1f}s")
+    with conn.cursor() as cur:
+        cur.execute(
+            f"""CREATE TABLE IF NOT EXISTS {SKETCH_CATALOG_TABLE} (
+                table_name VARCHAR(64) PRIMARY KEY,
+                dimensions VARCHAR(512) NOT NULL,
+                row_count BIGINT NOT NULL,
+                sketch_precision TINYINT NOT NULL,
+                built_at DATETIME NOT NULL
+            )"""
+        )
+        for rollup, keys in definitions.items():
+            table = sketch_table(rollup)
+            start = time.perf_counter()
+            key_columns = ",\n    ".join(f"{key} {'VARCHAR(50)' if key not in BASE_KEYS else 'SMALLINT'}" for key in keys)
+            cur.execute(f"DROP TABLE IF EXISTS {table}_new")
+            cur.execute(
+                f"""CREATE TABLE {table}_new (
+    {key_columns},
+    sketch_column VARCHAR(32) NOT NULL,
+    registers BLOB NOT NULL,
+    INDEX idx_column_year_month (sketch_column, order_year, order_month)
+)"""
+            )
+            insert = (
+                f"INSERT INTO {table}_new ({', '.join(keys)}, sketch_column, registers) "
+                f"VALUES ({', '.join(['%s'] * (len(keys) + 2))})"
+            )
+            rows = 0
+            for column in SKETCH_COLUMNS:
+                batch = []
+                for row in _sketch_rows(registers[(table, column)], column):
+                    batch.append(row)
+                    if len(batch) >= INSERT_BATCH:
+                        rows += cur.executemany(insert, batch)
+                        batch = []
+                if batch:
+                    rows += cur.executemany(insert, batch)
+            cur.execute(f"CREATE TABLE IF NOT EXISTS {table} LIKE {table}_new")
+            cur.execute(f"RENAME TABLE {table} TO {table}_old, {table}_new TO {table}")
+            cur.execute(f"DROP TABLE {table}_old")
+            cur.execute(
+                f"""REPLACE INTO {SKETCH_CATALOG_TABLE} (table_name, dimensions, row_count, sketch_precision, built_at)
+                VALUES (%s, %s, %s, %s, NOW())""",
+                (table, ",".join(keys), rows, PRECISION),
+            )
+            conn.commit()
+            log(f"{table}: {rows:,} sketches in {time.perf_counter() - start:.1f}s")
+
+
+# -----------------------------
+# Query time
+# -----------------------------
+def sketch_catalog_query():
+    return f"SELECT table_name, dimensions, row_count FROM {SKETCH_CATALOG_TABLE} WHERE sketch_precision = {PRECISION}"
+
+
+def sketch_router(df):
+    return RollupRouter.from_frame(df)
+
+
+def sketch_sql(keys, match=()):
+    """Sketches of the selected groups in ``{rollup}``, for ``Filters.format_sql``."""
+    select = ", ".join(list(keys) + ["registers"])
+    conditions = ["sketch_column = %(sketch_column)s", "{filters}"]
+    conditions += [f"{column} = %(match_{column})s" for column in match]
+    return f"SELECT {select} FROM {{rollup}} WHERE {' AND '.join(conditions)}"
+
+
+def fill_estimates(df, estimates, keys):
+    """Fill the distinct-count columns of a rollup result from merged sketches.
+
+    ``estimates``: output column -> ``merge_estimates`` frame; ``keys``: result
+    column -> sketch key column it joins on (empty for a single-row result).
+    The rollup SQL returns the output columns as NULL placeholders.
+    """
+    df = df.copy()
+    for name, merged in estimates.items():
+        if keys:
+            merged = merged.rename(columns={column: result for result, column in keys.items()})
+            values = df[list(keys)].merge(merged, how="left", on=list(keys))["estimate"]
+        else:
+            values = pd.Series(merged["estimate"].iloc[0], index=df.index)
+        df[name] = values.fillna(0).astype("int64").to_numpy()
+    return df
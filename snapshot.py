@@ -0,0 +1,164 @@
+"""
+Process-wide, read-only columnar snapshot of the ``orders`` rows.
+
+The snapshot is written once as an Arrow IPC file and memory-mapped, so
+every Streamlit session aggregates from the same buffers instead of holding
+its own copy of ~1M rows. Views handed to sessions are Arrow-backed pandas
+frames over those buffers: no copy at the snapshot's own scope, while
+narrower filters copy the selected rows of the projected columns. A
+refresh writes a new generation next to the old one and swaps it in under
+a lock; sessions still holding the previous generation keep reading it
+until they drop their view.
+"""
+import glob
+import os
+import re
+import tempfile
+import threading
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from schema import arrow_type
+
+SNAPSHOT_DIR = os.environ.get(
+    "AMAZON_SNAPSHOT_DIR", os.path.join(tempfile.gettempdir(), "amazon_orders_snapshot")
+)
+
+# Rows and columns the raw-row dashboards (16-30) aggregate over.
+SNAPSHOT_WHERE = "order_year > 2020"
+SNAPSHOT_COLUMNS = [
+    "order_date", "order_year", "order_month", "customer_id", "product_id", "product_name",
+    "subcategory", "brand", "payment_method", "quantity", "final_amount_inr", "delivery_days",
+    "product_rating",
+]
+# Typed per the declared orders schema; categorical columns are dictionary-encoded.
+SNAPSHOT_SCHEMA = pa.schema([(column, arrow_type(column)) for column in SNAPSHOT_COLUMNS])
+
+_FILE_PATTERN = re.compile(r"orders_snapshot_(\d+)\.arrow$")
+
+
+class OrdersSnapshot:
+    def __init__(self, directory=SNAPSHOT_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._table = None
+        self._generation = 0
+        self._path = None
+        self._built_at = None
+
+    # -----------------------------
+    # Reading
+    # -----------------------------
+    @property
+    def generation(self):
+        return self._generation
+
+    def is_loaded(self):
+        return self._table is not None
+
+    def covers(self, columns):
+        return self._table is not None and set(columns) <= set(SNAPSHOT_COLUMNS)
+
+    def view(self, columns=None, filter=None):
+        """Arrow-backed DataFrame over the current generation.
+
+        Without ``filter`` the view is zero-copy, except that dictionary
+        columns become pandas categoricals with lexically ordered categories,
+        as ``typed_frame`` gives (pyarrow can't sort dictionary arrays, which
+        ``sort_values`` needs). ``filter`` is a pyarrow
+        expression selecting rows, which copies them; columns are projected
+        first, so only ``columns`` are copied and they must include every
+        column ``filter`` reads.
+        Returns ``(generation, frame)`` so callers can key caches on the generation.
+        """
+        with self._lock:
+            table, generation = self._table, self._generation
+        if table is None:
+            raise RuntimeError("Orders snapshot has not been built yet")
+        if columns is not None:
+            table = table.select(list(columns))
+        if filter is not None:
+            table = table.filter(filter)
+        frame = table.to_pandas(types_mapper=_arrow_dtype)
+        for column in frame.columns:
+            if isinstance(frame[column].dtype, pd.CategoricalDtype):
+                categories = frame[column].cat.categories
+                if not categories.is_monotonic_increasing:
+                    frame[column] = frame[column].cat.reorder_categories(categories.sort_values())
+        return generation, frame
+
+    def stats(self):
+        with self._lock:
+            table = self._table
+            return {
+                "generation": self._generation,
+                "rows": table.num_rows if table is not None else 0,
+                "bytes": table.nbytes if table is not None else 0,
+                "path": self._path,
+                "built_at": self._built_at,
+            }
+
+    # -----------------------------
+    # Building / swapping
+    # -----------------------------
+    def load_latest(self):
+        """Map the newest snapshot file left by a previous process, if any."""
+        files = []
+        for path in glob.glob(os.path.join(self.directory, "orders_snapshot_*.arrow")):
+            match = _FILE_PATTERN.search(path)
+            if match:
+                files.append((int(match.group(1)), path))
+        if not files:
+            return False
+        generation, path = max(files)
+        self._swap(_map_table(path), generation, path, os.path.getmtime(path))
+        return True
+
+    def refresh(self, frames):
+        """Build a new generation from an iterable of DataFrames and swap it in."""
+        with self._refresh_lock:
+            os.makedirs(self.directory, exist_ok=True)
+            tables = [
+                pa.Table.from_pandas(df[SNAPSHOT_COLUMNS], schema=SNAPSHOT_SCHEMA, preserve_index=False)
+                for df in frames
+            ]
+            table = pa.concat_tables(tables) if tables else SNAPSHOT_SCHEMA.empty_table()
+            # The IPC file format needs one dictionary per column across all batches.
+            table = table.unify_dictionaries()
+
+            generation = self._generation + 1
+            path = os.path.join(self.directory, f"orders_snapshot_{generation}.arrow")
+            tmp_path = path + ".tmp"
+            with pa.OSFile(tmp_path, "wb") as sink:
+                with ipc.new_file(sink, SNAPSHOT_SCHEMA) as writer:
+                    writer.write_table(table, max_chunksize=256 * 1024)
+            os.replace(tmp_path, path)
+
+            old_path = self._swap(_map_table(path), generation, path, time.time())
+            if old_path and old_path != path:
+                try:
+                    # Views of the old generation keep their mapping alive after unlink.
+                    os.remove(old_path)
+                except OSError:
+                    pass
+            return generation
+
+    def _swap(self, table, generation, path, built_at):
+        with self._lock:
+            old_path = self._path
+            self._table, self._generation, self._path, self._built_at = table, generation, path, built_at
+        return old_path
+
+
+def _arrow_dtype(arrow_type):
+    """Arrow-backed pandas dtype, except dictionary types, which convert to ``category``."""
+    return None if pa.types.is_dictionary(arrow_type) else pd.ArrowDtype(arrow_type)
+
+
+def _map_table(path):
+    source = pa.memory_map(path, "r")
+    return ipc.open_file(source).read_all()
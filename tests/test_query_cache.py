@@ -0,0 +1,80 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from query_cache import QueryCache, cache_key
+
+SQL = "SELECT 1"
+CALLERS = 8
+
+
+def _concurrent(cache, loader):
+    """Run ``get_or_load`` from ``CALLERS`` threads that all miss together; their results or exceptions."""
+    results = [None] * CALLERS
+
+    def call(i):
+        try:
+            results[i] = cache.get_or_load(SQL, None, loader)
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(CALLERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return results
+
+
+def _blocking_loader(cache, calls, release, fail):
+    def loader():
+        calls.append(1)
+        release.wait(timeout=10)
+        if fail:
+            raise RuntimeError("backend down")
+        return pd.DataFrame({"x": [1]})
+    return loader
+
+
+def _release_when_all_waiting(cache, release):
+    key = cache_key(SQL)
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        flight = cache._flights.get(key)
+        if flight is not None and flight.callers == CALLERS:
+            break
+        time.sleep(0.001)
+    release.set()
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_concurrent_misses_load_once(fail):
+    cache, calls, release = QueryCache(), [], threading.Event()
+    releaser = threading.Thread(target=_release_when_all_waiting, args=(cache, release))
+    releaser.start()
+    results = _concurrent(cache, _blocking_loader(cache, calls, release, fail))
+    releaser.join()
+
+    assert len(calls) == 1
+    if fail:
+        assert all(isinstance(r, RuntimeError) for r in results)
+    else:
+        assert all(r["x"].tolist() == [1] for r in results)
+    assert cache._flights == {}
+
+
+def test_failed_load_is_retried_by_the_next_caller():
+    cache, calls = QueryCache(), []
+
+    def failing():
+        calls.append(1)
+        raise RuntimeError("backend down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load(SQL, None, failing)
+    df = cache.get_or_load(SQL, None, lambda: pd.DataFrame({"x": [2]}))
+    assert len(calls) == 1
+    assert df["x"].tolist() == [2]
+    assert cache._flights == {}
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from rollups import ROLLUP_DIMENSIONS
+from sketches import REGISTERS, build_registers, estimate, hash_values, register_updates
+
+TRIALS = 30
+
+
+def _relative_errors(n, seed):
+    rng = np.random.default_rng(seed)
+    errors = []
+    for _ in range(TRIALS):
+        hashes = rng.integers(0, np.iinfo(np.uint64).max, n, dtype=np.uint64, endpoint=True)
+        index, rank = register_updates(hashes)
+        registers = np.zeros(REGISTERS, dtype=np.uint8)
+        np.maximum.at(registers, index, rank)
+        errors.append(estimate(registers) / n - 1)
+    return np.array(errors)
+
+
+# 30k-60k spans the hand-over from linear counting to raw HyperLogLog (~2.5 x registers = 41k).
+@pytest.mark.parametrize("n", [30_000, 38_000, 42_000, 45_000, 50_000, 55_000, 60_000])
+def test_error_bound_across_transition_range(n):
+    errors = _relative_errors(n, seed=n)
+    assert abs(errors.mean()) < 0.005
+    assert np.mean(np.abs(errors) > 0.016) <= 0.15  # ~5% expected; slack for 30 trials
+    assert np.abs(errors).max() < 0.033  # 4 standard errors
+
+
+@pytest.mark.parametrize("n", [1, 100, 5_000, 1_000_000])
+def test_small_and_large_counts(n):
+    assert abs(_relative_errors(n, seed=n)[:5].mean()) < 0.02
+
+
+def test_empty_sketch():
+    assert estimate(np.zeros(REGISTERS, dtype=np.uint8)) == 0
+
+
+def _orders(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    pick = lambda prefix, n: np.array([f"{prefix}{i}" for i in rng.integers(0, n, rows)], dtype=object)  # noqa: E731
+    months = rng.integers(1, 13, rows)
+    chunk = pd.DataFrame({
+        "order_year": rng.integers(2021, 2024, rows),
+        "order_quarter": (months - 1) // 3 + 1,
+        "order_month": months,
+        "is_festival_sale": rng.integers(0, 2, rows),
+        "is_prime_member": rng.integers(0, 2, rows),
+        "customer_id": pick("CUST", 3_000),
+        "product_id": pick("PROD", 200),
+    })
+    for dim in ROLLUP_DIMENSIONS:
+        chunk[dim] = pick(f"{dim} ", 6)
+        chunk.loc[rng.random(rows) < 0.02, dim] = None  # NULL dimension values form their own group
+    chunk.loc[rng.random(rows) < 0.01, "customer_id"] = None  # not counted
+    return chunk
+
+
+def _as_dict(registers):
+    return {
+        key: {group: dense.tobytes() for group, dense in value.dense()}
+        for key, value in registers.items()
+    }
+
+
+def test_chunked_build_matches_single_chunk():
+    orders = _orders(20_000)
+    chunked = build_registers(orders.iloc[i:i + 1_500] for i in range(0, len(orders), 1_500))
+    assert _as_dict(chunked) == _as_dict(build_registers([orders]))
+
+
+def test_build_registers_matches_direct_hll():
+    orders = _orders(5_000)
+    registers = build_registers([orders.iloc[:2_000], orders.iloc[2_000:]])
+    rows = orders.dropna(subset=["customer_id"])
+    rows = rows[(rows["order_year"] == 2022) & (rows["order_month"] == 3)
+                & (rows["is_festival_sale"] == 1) & (rows["is_prime_member"] == 0)]
+    expected = np.zeros(REGISTERS, dtype=np.uint8)
+    index, rank = register_updates(hash_values(rows["customer_id"]))
+    np.maximum.at(expected, index, rank)
+    groups = dict(registers[("sketch_month", "customer_id")].dense())
+    assert np.array_equal(groups[(2022, 1, 3, 1, 0)], expected)
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboards import TITLES, load
+from filters import Filters
+from pushdown import AggSpec, aggregate_frame, compare_results, unrounded
+from schema import typed_frame
+from snapshot import SNAPSHOT_COLUMNS, OrdersSnapshot
+
+ROWS = 5_000
+
+
+def _orders(seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.to_datetime("2021-01-01") + pd.to_timedelta(rng.integers(0, 4 * 365, ROWS), unit="D")
+    pick = lambda prefix, n: [f"{prefix}{i}" for i in rng.integers(0, n, ROWS)]  # noqa: E731
+    ratings = rng.uniform(1, 5, ROWS).round(1)
+    ratings[rng.random(ROWS) < 0.05] = np.nan
+    return pd.DataFrame({
+        "order_date": dates.date,
+        "order_year": dates.year,
+        "order_month": dates.month,
+        "customer_id": pick("CUST", 800),
+        "product_id": pick("PROD", 120),
+        "product_name": pick("Product ", 120),
+        "subcategory": pick("Subcategory ", 8),
+        "brand": pick("Brand ", 15),
+        "payment_method": pick("Method ", 5),
+        "quantity": rng.integers(1, 5, ROWS),
+        "final_amount_inr": rng.uniform(100, 100_000, ROWS).round(2),
+        "delivery_days": rng.integers(1, 12, ROWS),
+        "product_rating": ratings,
+    })[SNAPSHOT_COLUMNS]
+
+
+def _covered_specs():
+    covered = set(SNAPSHOT_COLUMNS)
+    for title in TITLES:
+        for name, query in load(title).QUERIES.items():
+            if isinstance(query, AggSpec) and set(query.raw_columns()) <= covered:
+                yield pytest.param(query, id=f"{load(title).__name__.split('.')[-1]}:{name}")
+
+
+@pytest.fixture(scope="module")
+def snapshot(tmp_path_factory):
+    orders = _orders()
+    snapshot = OrdersSnapshot(str(tmp_path_factory.mktemp("snapshot")))
+    # Two frames, so the snapshot's dictionaries are unified across batches.
+    snapshot.refresh([orders.iloc[:ROWS // 2], orders.iloc[ROWS // 2:]])
+    return snapshot, orders
+
+
+@pytest.mark.parametrize("spec", list(_covered_specs()))
+def test_snapshot_aggregate_matches_typed_frame(snapshot, spec):
+    snapshot, orders = snapshot
+    columns = spec.raw_columns()
+    _, view = snapshot.view(columns)
+    typed = typed_frame(orders[columns].copy())
+
+    aggregate_frame(view, spec)  # with its ordering and limit
+    check = unrounded(spec)
+    assert compare_results(aggregate_frame(typed, check), aggregate_frame(view, check), check) is None
+
+
+def test_filtered_view_matches_typed_frame(snapshot):
+    snapshot, orders = snapshot
+    filters = Filters(start_date=pd.Timestamp("2023-03-01").date())
+    _, view = snapshot.view(["subcategory", "final_amount_inr"] + filters.columns(), filters.expression())
+    expected = orders[orders["order_date"] >= filters.start_date]
+    assert len(view) == len(expected)
+    assert isinstance(view["subcategory"].dtype, pd.CategoricalDtype)
@@ -0,0 +1,227 @@
+"""
+Per-dashboard timing spans.
+
+A ``Trace`` is started for every rerun and stored in a context variable, so
+spans opened anywhere below it — query execution, result transfer and
+decode in ``db``, aggregation in pandas, ``st.*_chart`` calls — land in the
+same trace, including spans from the parallel-section worker threads. Time
+on the script thread not covered by any span (the dashboard's own pandas
+code between loading and charting) is reported as ``pandas`` gaps. Finished
+traces are shown as a collapsible waterfall and appended to a JSON-lines log.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+TIMING_LOG = os.environ.get("AMAZON_TIMING_LOG", os.path.join("logs", "timings.jsonl"))
+# Uncovered script-thread time shorter than this isn't worth a row in the waterfall.
+MIN_GAP_MS = 1.0
+# Streamlit calls recorded as "render" spans.
+RENDER_CALLS = (
+    "line_chart", "bar_chart", "area_chart", "scatter_chart", "plotly_chart", "pyplot",
+    "dataframe", "table",
+)
+
+current_trace = ContextVar("current_trace", default=None)
+_depth = ContextVar("timing_depth", default=0)
+_parent = ContextVar("timing_parent", default=None)  # {"child_s": ...} of the enclosing span
+_log_lock = threading.Lock()
+
+
+class Trace:
+    def __init__(self, dashboard):
+        self.dashboard = dashboard
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self._thread = threading.get_ident()
+        self._lock = threading.Lock()
+        self.spans = []
+        self.total_ms = None
+
+    def add(self, kind, name, start, duration, rows=None, nbytes=None, depth=0, child_s=0.0):
+        span = {
+            "kind": kind,
+            "name": name,
+            "start_ms": (start - self._start) * 1000,
+            "duration_ms": duration * 1000,
+            "self_ms": max(duration - child_s, 0.0) * 1000,
+            "rows": rows,
+            "bytes": nbytes,
+            "depth": depth,
+            "main_thread": threading.get_ident() == self._thread,
+        }
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    def finish(self):
+        """Close the trace and attribute uncovered script-thread time to pandas."""
+        self.total_ms = (time.perf_counter() - self._start) * 1000
+        with self._lock:
+            top = sorted(
+                (s for s in self.spans if s["main_thread"] and s["depth"] == 0), key=lambda s: s["start_ms"]
+            )
+            cursor, previous = 0.0, "start"
+            gaps = []
+            for span in top + [{"start_ms": self.total_ms, "duration_ms": 0, "name": "end"}]:
+                if span["start_ms"] - cursor >= MIN_GAP_MS:
+                    gaps.append({
+                        "kind": "pandas", "name": f"{previous} → {span['name']}",
+                        "start_ms": cursor, "duration_ms": span["start_ms"] - cursor,
+                        "self_ms": span["start_ms"] - cursor,
+                        "rows": None, "bytes": None, "depth": 0, "main_thread": True,
+                    })
+                cursor = max(cursor, span["start_ms"] + span["duration_ms"])
+                previous = span["name"]
+            self.spans.extend(gaps)
+            self.spans.sort(key=lambda s: s["start_ms"])
+        return self
+
+    def totals(self):
+        """Milliseconds per span kind, excluding time spent in nested spans."""
+        totals = {}
+        for span in self.spans:
+            totals[span["kind"]] = totals.get(span["kind"], 0.0) + span["self_ms"]
+        return totals
+
+
+def start_trace(dashboard):
+    trace = Trace(dashboard)
+    current_trace.set(trace)
+    return trace
+
+
+def end_trace():
+    """Finish the active trace and stop recording, so the timing panel doesn't time itself."""
+    trace = current_trace.get()
+    current_trace.set(None)
+    return trace.finish() if trace is not None else None
+
+
+@contextmanager
+def span(kind, name):
+    """Time the block as a span of ``kind``; set ``rows`` / ``bytes`` on the yielded dict.
+
+    A no-op when no trace is active (background prefetch, CLI tools).
+    """
+    trace = current_trace.get()
+    info = {}
+    if trace is None:
+        yield info
+        return
+    depth, parent, frame = _depth.get(), _parent.get(), {"child_s": 0.0}
+    depth_token, parent_token = _depth.set(depth + 1), _parent.set(frame)
+    start = time.perf_counter()
+    try:
+        yield info
+    finally:
+        duration = time.perf_counter() - start
+        _depth.reset(depth_token)
+        _parent.reset(parent_token)
+        if parent is not None:
+            parent["child_s"] += duration
+        trace.add(kind, name, start, duration, info.get("rows"), info.get("bytes"), depth, frame["child_s"])
+
+
+def record(kind, name, start, duration, rows=None, nbytes=None):
+    """Add a span measured by the caller (e.g. time accumulated across a stream)."""
+    trace = current_trace.get()
+    if trace is not None:
+        parent = _parent.get()
+        if parent is not None:
+            parent["child_s"] += duration
+        trace.add(kind, name, start, duration, rows, nbytes, _depth.get())
+
+
+def label(sql, width=60):
+    text = " ".join(str(sql).split())
+    return text if len(text) <= width else text[:width - 1] + "…"
+
+
+def _timed_render(call, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if current_trace.get() is None:
+            return func(*args, **kwargs)
+        data = args[0] if args else next(iter(kwargs.values()), None)
+        with span("render", call) as info:
+            info["rows"] = len(data) if hasattr(data, "shape") else None
+            return func(*args, **kwargs)
+
+    wrapper._timed = True
+    return wrapper
+
+
+def instrument_streamlit():
+    """Record every ``st.*_chart`` / ``st.dataframe`` call as a render span (idempotent)."""
+    for call in RENDER_CALLS:
+        func = getattr(st, call, None)
+        if func is not None and not getattr(func, "_timed", False):
+            setattr(st, call, _timed_render(call, func))
+
+
+def log_trace(trace, path=TIMING_LOG):
+    """Append one JSON line per span to ``path``."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    lines = [
+        json.dumps({"ts": trace.started_at, "dashboard": trace.dashboard, "total_ms": trace.total_ms, **span},
+                   ensure_ascii=False)
+        for span in trace.spans
+    ]
+    with _log_lock, open(path, "a", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+# -----------------------------
+# Waterfall panel
+# -----------------------------
+KIND_COLORS = {
+    "cache": "#9e9e9e", "sql": "#1f77b4", "fetch": "#17becf", "decode": "#2ca02c",
+    "pandas": "#ff7f0e", "render": "#9467bd", "wait": "#d3d3d3",
+}
+
+
+def render_timing_panel(trace):
+    """Collapsible waterfall of the spans in ``trace`` with row counts and bytes."""
+    if trace is None or not trace.spans:
+        return
+    with st.expander(f"⏱️ Timing Breakdown — {trace.total_ms:,.0f} ms"):
+        totals = trace.totals()
+        columns = st.columns(len(totals))
+        for column, (kind, ms) in zip(columns, sorted(totals.items(), key=lambda item: -item[1])):
+            column.metric(kind, f"{ms:,.0f} ms")
+
+        df = pd.DataFrame(trace.spans)
+        # Numbered so repeated spans (e.g. two bar charts) keep their own row.
+        df["label"] = [
+            f"{i + 1:>2}. {'· ' * depth}{kind}: {name}" + ("" if main else " (worker)")
+            for i, (depth, kind, name, main) in enumerate(zip(df["depth"], df["kind"], df["name"], df["main_thread"]))
+        ]
+        fig = go.Figure()
+        for kind, group in df.groupby("kind", sort=False):
+            fig.add_bar(
+                y=group["label"], x=group["duration_ms"], base=group["start_ms"], orientation="h", name=kind,
+                marker_color=KIND_COLORS.get(kind), customdata=group[["rows", "bytes"]].fillna(-1),
+                hovertemplate="%{y}<br>%{x:,.1f} ms<br>rows %{customdata[0]:,}<br>bytes %{customdata[1]:,}<extra></extra>",
+            )
+        fig.update_yaxes(categoryorder="array", categoryarray=list(df["label"])[::-1])
+        fig.update_layout(barmode="overlay", height=max(250, 22 * len(df)), xaxis_title="ms since rerun start")
+        st.plotly_chart(fig, use_container_width=True)
+
+        df["kb"] = (df["bytes"] / 1024).round(1)
+        st.dataframe(
+            df[["kind", "name", "start_ms", "duration_ms", "self_ms", "rows", "kb"]].round(
+                {"start_ms": 1, "duration_ms": 1, "self_ms": 1}
+            ),
+            hide_index=True, use_container_width=True,
+        )